@@ -13,6 +13,25 @@ Module for runtime quantum program transformations.
 
 .. currentmodule:: qbraid.passes
 
+Classes
+--------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   PassManager
+   TokenType
+
+Functions
+----------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   tokenize
+   emit
+   token_type
+
 Exceptions
 -----------
 
@@ -23,8 +42,17 @@ Exceptions
 
 """
 from .exceptions import QasmDecompositionError
+from .lexer import TokenType, emit, token_type, tokenize
+from .manager import PassManager
 
-__all__ = ["QasmDecompositionError"]
+__all__ = [
+    "QasmDecompositionError",
+    "PassManager",
+    "TokenType",
+    "emit",
+    "token_type",
+    "tokenize",
+]
 
 _lazy_mods = ["qasm2", "qasm3"]
 
@@ -0,0 +1,182 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module defining a lossless tokenizer for OpenQASM 2 and 3 programs, shared by
+passes that rewrite programs as a stream of tokens.
+
+"""
+import re
+from enum import Enum
+from typing import Iterable, Iterator, Optional
+
+
+class TokenType(Enum):
+    """Lexical category of an OpenQASM token."""
+
+    COMMENT = "comment"
+    STRING = "string"
+    NUMBER = "number"
+    IDENTIFIER = "identifier"
+    OPERATOR = "operator"
+    WHITESPACE = "whitespace"
+
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    //[^\n]*|/\*.*?(?:\*/|\Z)
+    |"[^"]*"|'[^']*'
+    |(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?
+    |[^\W\d]\w*
+    |\s+
+    |\*\*=?|->|<<=?|>>=?|[-+*/%^&|=!<>]=|&&|\|\||\+\+|.
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+QASM_KEYWORDS = frozenset(
+    {
+        "OPENQASM",
+        "include",
+        "defcalgrammar",
+        "qreg",
+        "creg",
+        "qubit",
+        "bit",
+        "int",
+        "uint",
+        "float",
+        "angle",
+        "bool",
+        "complex",
+        "duration",
+        "stretch",
+        "array",
+        "const",
+        "input",
+        "output",
+        "let",
+        "gate",
+        "opaque",
+        "def",
+        "defcal",
+        "cal",
+        "extern",
+        "return",
+        "measure",
+        "reset",
+        "barrier",
+        "delay",
+        "box",
+        "if",
+        "else",
+        "for",
+        "in",
+        "while",
+        "switch",
+        "case",
+        "default",
+        "break",
+        "continue",
+        "end",
+        "ctrl",
+        "negctrl",
+        "inv",
+        "pow",
+        "gphase",
+    }
+)
+
+# Tokens after which a gate application may start, including the bodies of unbraced
+# ``if (...)`` and ``else`` branches.
+_STATEMENT_BOUNDARIES = frozenset({";", "{", "}", ")", "else"})
+
+
+def tokenize(program: str) -> list[str]:
+    """Split an OpenQASM program into tokens.
+
+    Tokens are the substrings of the program, and tokenization is lossless: whitespace and
+    comments are kept as tokens, so that ``emit(tokenize(program)) == program``. Use
+    :func:`token_type` to classify a token. An unterminated block comment extends to the
+    end of the program, so tokenization takes linear time.
+    """
+    return _TOKEN_PATTERN.findall(program)
+
+
+def emit(tokens: Iterable[str]) -> str:
+    """Join a stream of tokens back into program text."""
+    return "".join(tokens)
+
+
+def token_type(token: str) -> TokenType:
+    """Return the lexical category of a token produced by :func:`tokenize`."""
+    first = token[0]
+    if first.isspace():
+        return TokenType.WHITESPACE
+    if token.startswith(("//", "/*")):
+        return TokenType.COMMENT
+    if first in "\"'":
+        return TokenType.STRING
+    if first.isdigit() or (first == "." and len(token) > 1):
+        return TokenType.NUMBER
+    if first == "_" or first.isalpha():
+        return TokenType.IDENTIFIER
+    return TokenType.OPERATOR
+
+
+def is_significant(token: str) -> bool:
+    """Return True if the token is neither whitespace nor a comment."""
+    return not (token[0].isspace() or token.startswith(("//", "/*")))
+
+
+def is_identifier(token: str) -> bool:
+    """Return True if the token is an identifier or keyword."""
+    return token[0] == "_" or token[0].isalpha()
+
+
+def next_significant(tokens: list[str], index: int) -> Optional[int]:
+    """Return the index of the first significant token after ``index``, if any."""
+    for position in range(index + 1, len(tokens)):
+        if is_significant(tokens[position]):
+            return position
+    return None
+
+
+def previous_significant(tokens: list[str], index: int) -> Optional[int]:
+    """Return the index of the last significant token before ``index``, if any."""
+    for position in range(index - 1, -1, -1):
+        if is_significant(tokens[position]):
+            return position
+    return None
+
+
+def gate_name_indices(tokens: list[str]) -> Iterator[int]:
+    """Yield the indices of identifiers that name a gate being applied or defined.
+
+    These are the identifiers that start a statement and are followed by gate parameters or
+    qubit operands, identifiers following a gate modifier ``@``, and the name in a ``gate``
+    or ``opaque`` definition.
+    """
+    previous: Optional[str] = None
+    for index, token in enumerate(tokens):
+        if not is_significant(token):
+            continue
+        if is_identifier(token):
+            if previous in ("gate", "opaque", "@"):
+                yield index
+            elif token not in QASM_KEYWORDS and (
+                previous is None or previous in _STATEMENT_BOUNDARIES
+            ):
+                following = next_significant(tokens, index)
+                if following is not None and (
+                    is_identifier(tokens[following]) or tokens[following] in ("(", "$")
+                ):
+                    yield index
+        previous = token
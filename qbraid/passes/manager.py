@@ -0,0 +1,73 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module defining the PassManager class, which chains token-stream passes over
+an OpenQASM program.
+
+"""
+from typing import Callable, Iterable, Iterator, Optional
+
+from .lexer import emit, tokenize
+
+TokenPass = Callable[[list[str]], list[str]]
+
+
+class PassManager:
+    """Runs a sequence of passes over one token stream.
+
+    Each pass is a callable that takes the list of tokens of a program, as produced by
+    :func:`~qbraid.passes.tokenize`, and returns a list of tokens. The program is tokenized
+    once before the first pass and emitted once after the last, so a chain of passes does
+    not rescan the program text.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from qbraid.passes import PassManager
+        >>> from qbraid.passes.qasm3.compat import pi_to_decimal_pass, rename_gates_pass
+        >>> manager = PassManager([rename_gates_pass({"cnot": "cx"}), pi_to_decimal_pass()])
+        >>> manager.run("cnot q[0], q[1]; rz(pi / 2) q[0];")
+        'cx q[0], q[1]; rz(1.5707963267948966) q[0];'
+
+    """
+
+    def __init__(self, passes: Optional[Iterable[TokenPass]] = None):
+        self._passes: list[TokenPass] = list(passes or [])
+
+    def __repr__(self):
+        names = ", ".join(getattr(p, "__name__", type(p).__name__) for p in self._passes)
+        return f"PassManager([{names}])"
+
+    def __len__(self):
+        return len(self._passes)
+
+    def __iter__(self) -> Iterator[TokenPass]:
+        return iter(self._passes)
+
+    def append(self, token_pass: TokenPass) -> "PassManager":
+        """Add a pass to the end of the chain, and return the manager."""
+        self._passes.append(token_pass)
+        return self
+
+    def run_tokens(self, tokens: list[str]) -> list[str]:
+        """Apply every pass in order to a list of tokens."""
+        for token_pass in self._passes:
+            tokens = token_pass(tokens)
+        return tokens
+
+    def run(self, program: str) -> str:
+        """Tokenize a program, apply every pass in order, and emit the result."""
+        if not self._passes:
+            return program
+        return emit(self.run_tokens(tokenize(program)))
+
+    __call__ = run
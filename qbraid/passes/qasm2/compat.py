@@ -14,141 +14,264 @@ Module for preprocessing qasm string to before it is passed to parser.
 """
 import re
 
+from qbraid.passes.exceptions import QasmDecompositionError
+from qbraid.passes.lexer import previous_significant, tokenize
+from qbraid.passes.manager import PassManager, TokenPass
+
 from .decompose import decompose_qasm_qelib1
 
+_BARRIER_BOUNDARIES = frozenset({";", "{", "}"})
 
-def remove_qasm_barriers(qasm_str: str) -> str:
-    """Returns a copy of the input QASM with all barriers removed.
 
-    Args:
-        qasm_str: QASM to remove barriers from.
-    """
-    quoted_re = r"(?:\"[^\"]*?\")"
-    # Statements separated by semicolons
-    statement_re = r"((?:[^;{}\"]*?" + quoted_re + r"?)*[;{}])?"
-    # Comments begin with a pair of forward slashes and end with a new line
-    comment_re = r"(\n?//[^\n]*(?:\n|$))?"
-    statements_comments = re.findall(statement_re + comment_re, qasm_str)
-    lines = []
-    # Language is case sensitive. Whitespace is ignored
-    for statement, comment in statements_comments:
-        if re.match(r"^\s*barrier(?:(?:\s+)|(?:;))", statement) is None:
-            lines.append(statement + comment)
-    return "".join(lines)
-
-
-def _format_qasm_string(qasm_string, skip_pattern):
-    lines = qasm_string.split("\n")
-    formatted_lines = []
-
-    for line in lines:
-        line = line.strip()  # Strip leading and trailing whitespace
-        if skip_pattern.match(line) or line.startswith("//"):
-            # If the line matches the gate definition pattern, add it as is
-            formatted_lines.append(line)
-        else:
-            # Otherwise, split it at semicolons and add each part as a separate line
-            parts = re.split(";[ ]*", line)
-            parts = [part + ";" for part in parts if part]  # Remove empty parts
-            formatted_lines.extend(parts)
+def remove_barriers_pass() -> TokenPass:
+    """Return a token pass that removes every barrier statement.
 
-    return "\n".join(formatted_lines)
+    A barrier statement is removed together with the whitespace that separates it from the
+    previous statement. Barriers in comments and strings are not statements, and are kept.
+    Tokens are scanned once.
+    """
 
+    def remove_barriers(tokens: list[str]) -> list[str]:
+        kept: list[str] = []
+        copied = 0
+        for index in [i for i, token in enumerate(tokens) if token == "barrier"]:
+            if index < copied:
+                continue
+            previous = previous_significant(tokens, index)
+            if previous is not None and tokens[previous] not in _BARRIER_BOUNDARIES:
+                continue
+            end = index + 1
+            while end < len(tokens) and tokens[end] not in _BARRIER_BOUNDARIES:
+                end += 1
+            if end == len(tokens) or tokens[end] != ";":
+                continue
+            start = index
+            while start > copied and tokens[start - 1][0].isspace():
+                start -= 1
+            if start > 0 and start - 1 != previous:
+                start = index
+            kept.extend(tokens[copied:start])
+            copied = end + 1
+        kept.extend(tokens[copied:])
+        return kept
+
+    return remove_barriers
 
-def unfold_qasm_gate_defs(qasm_string):
-    """Recursively expands gate definitions in the input OpenQASM string."""
-    # Define regular expression patterns
-    gate_definition_pattern = re.compile(
-        r"gate ([a-zA-Z0-9_]+)(\((.*?)\))? ((q[0-9]+,)*q[0-9]+) {(.*?)}"
-    )
 
-    gate_body = ""
-    params_list = []
-    gate_usage_match = None
+def remove_qasm_barriers(qasm_str: str) -> str:
+    """Returns a copy of the input QASM with all barriers removed.
 
-    # Find gate definition and extract its components
-    gate_definition_match = gate_definition_pattern.search(qasm_string)
-    if gate_definition_match:
-        gate_name, _, params, qubits, _, gate_body = gate_definition_match.groups()
-        params_list = [param.strip() for param in params.split(",")] if params is not None else []
+    Args:
+        qasm_str: QASM to remove barriers from.
+    """
+    return PassManager([remove_barriers_pass()]).run(qasm_str)
 
-        qubits = [qubit.strip() for qubit in qubits.split(",")]
 
-        # pylint: disable=consider-using-f-string
-        gate_usage_pattern = re.compile(
-            r"({})(\((.*?)\))? ((q\[([0-9]+)\],)*(q\[([0-9]+)\]));".format(gate_name)
-        )
+_Call = tuple[str, list[list[str]], list[list[str]]]
 
-        # Replace parameters with their values in gate body
-        gate_usage_match = gate_usage_pattern.search(qasm_string)
 
-    while gate_usage_match:
-        groups = gate_usage_match.groups()
-        param_values, qubits_usage = groups[2], groups[3]
-        param_values_list = (
-            [value.strip() for value in param_values.split(",")] if param_values is not None else []
+def _split_top_level(tokens: list[str]) -> list[list[str]]:
+    """Splits a token list at commas that are not nested in parentheses or brackets."""
+    parts: list[list[str]] = [[]]
+    depth = 0
+    for token in tokens:
+        if token in "([":
+            depth += 1
+        elif token in ")]":
+            depth -= 1
+        if token == "," and depth == 0:
+            parts.append([])
+        else:
+            parts[-1].append(token)
+    return parts if parts != [[]] else []
+
+
+def _closing_paren(tokens: list[str], start: int) -> int:
+    """Returns the index of the parenthesis closing the one at ``tokens[start]``."""
+    depth = 0
+    for index in range(start, len(tokens)):
+        if tokens[index] == "(":
+            depth += 1
+        elif tokens[index] == ")":
+            depth -= 1
+            if depth == 0:
+                return index
+    raise QasmDecompositionError(f"Unbalanced parentheses in '{' '.join(tokens)}'.")
+
+
+def _parse_call(tokens: list[str]) -> _Call:
+    """Parses the tokens of a gate application, without its semicolon."""
+    name, rest = tokens[0], tokens[1:]
+    params: list[list[str]] = []
+    if rest and rest[0] == "(":
+        end = _closing_paren(rest, 0)
+        params = _split_top_level(rest[1:end])
+        rest = rest[end + 1 :]
+    return name, params, _split_top_level(rest)
+
+
+def _render_call(call: _Call) -> str:
+    """Returns the OpenQASM 2 source of a gate application."""
+    name, params, args = call
+    param_str = f"({','.join(''.join(param) for param in params)})" if params else ""
+    return f"{name}{param_str} {','.join(''.join(arg) for arg in args)};"
+
+
+def _substitute_param(expr: list[str], values: dict[str, list[str]]) -> list[str]:
+    """Replaces formal parameters in an expression, parenthesizing compound values."""
+    if len(expr) == 1 and expr[0] in values:
+        return values[expr[0]]
+    substituted: list[str] = []
+    for token in expr:
+        value = values.get(token)
+        if value is None:
+            substituted.append(token)
+        elif len(value) == 1:
+            substituted.extend(value)
+        else:
+            substituted.extend(["(", *value, ")"])
+    return substituted
+
+
+class _GateInliner:
+    """Expands applications of user-defined gates, memoizing each expanded gate body."""
+
+    def __init__(self):
+        self.definitions: dict[str, tuple[list[str], list[str], list[_Call]]] = {}
+        self._expanded: dict[str, list[_Call]] = {}
+        self._expanding: set[str] = set()
+
+    def define(self, tokens: list[str]) -> None:
+        """Adds a gate definition, given its tokens from ``gate`` to the closing brace."""
+        body_start = tokens.index("{")
+        name, params, qubits = _parse_call(tokens[1:body_start])
+        body: list[_Call] = []
+        statement: list[str] = []
+        for token in tokens[body_start + 1 : -1]:
+            if token == ";":
+                if statement:
+                    body.append(_parse_call(statement))
+                statement = []
+            else:
+                statement.append(token)
+        self.definitions[name] = (
+            ["".join(param) for param in params],
+            ["".join(qubit) for qubit in qubits],
+            body,
         )
-        expanded_gate_body = gate_body
-        qubits_usage = [qubit.strip() for qubit in re.findall(r"q\[\d+\]", qubits_usage)]
-
-        for param, value in zip(params_list, param_values_list):
-            expanded_gate_body = expanded_gate_body.replace(param, value)
-
-        for qubit, qubit_usage in zip(qubits, qubits_usage):
-            expanded_gate_body = expanded_gate_body.replace(qubit, qubit_usage)
-
-        # Replace gate usage with the expanded gate body in the input string
-        qasm_string = qasm_string.replace(gate_usage_match.group(0), expanded_gate_body + ";")
-
-        # Search for the next gate usage
-        gate_usage_match = gate_usage_pattern.search(qasm_string)
-
-    # Remove double semicolons
-    qasm_string = _format_qasm_string(qasm_string, gate_definition_pattern)
-
-    return qasm_string
+        self._expanded.pop(name, None)
+
+    def expand(self, call: _Call) -> list[_Call]:
+        """Returns the applications of built-in gates that a gate application expands to."""
+        name, params, args = call
+        if name not in self.definitions:
+            return [call]
+
+        formal_params, formal_qubits, _ = self.definitions[name]
+        if len(params) != len(formal_params) or len(args) != len(formal_qubits):
+            raise QasmDecompositionError(
+                f"Gate '{name}' expects {len(formal_params)} parameters and "
+                f"{len(formal_qubits)} qubits, but got {len(params)} and {len(args)}."
+            )
+        param_map = dict(zip(formal_params, params))
+        qubit_map = dict(zip(formal_qubits, args))
+        return [
+            (
+                body_name,
+                [_substitute_param(param, param_map) for param in body_params],
+                [qubit_map.get("".join(arg), arg) for arg in body_args],
+            )
+            for body_name, body_params, body_args in self._expanded_body(name)
+        ]
+
+    def _expanded_body(self, name: str) -> list[_Call]:
+        """Returns the fully expanded body of a gate, in terms of its formal arguments."""
+        if name not in self._expanded:
+            if name in self._expanding:
+                raise QasmDecompositionError(f"Gate '{name}' is defined recursively.")
+            self._expanding.add(name)
+            try:
+                body = self.definitions[name][2]
+                self._expanded[name] = [inner for call in body for inner in self.expand(call)]
+            finally:
+                self._expanding.discard(name)
+        return self._expanded[name]
+
+
+def unfold_qasm_gate_defs(qasm_string: str) -> str:
+    """Expands applications of gates defined in the input OpenQASM 2 string.
+
+    The program is tokenized and scanned once. Gate definitions are recorded in a table and
+    removed, and each application of a defined gate is replaced by its body, with parameters
+    and qubit arguments substituted. Gate bodies that apply other defined gates are expanded
+    recursively, and the expansion of each definition is computed only once. Qubit arguments
+    may be named freely, and may be indexed qubits or whole registers.
+
+    Returns:
+        The program with one statement per line and no gate definitions.
+
+    Raises:
+        QasmDecompositionError: If a gate is applied with the wrong number of arguments, or
+            is defined in terms of itself.
+    """
+    inliner = _GateInliner()
+    lines: list[str] = []
+    tokens: list[str] = []
+    start = None
+    depth = 0
+
+    token_end = 0
+    for text in tokenize(qasm_string):
+        token_start, token_end = token_end, token_end + len(text)
+        if text[0].isspace():
+            continue
+        if text.startswith(("//", "/*")):
+            if not tokens:
+                lines.append(text)
+            continue
+        if start is None:
+            start = token_start
+        tokens.append(text)
+
+        if text == "{":
+            depth += 1
+        elif text == "}":
+            depth -= 1
+        if depth > 0 or text not in (";", "}"):
+            continue
+        if text == ";" and tokens[0] == "gate":
+            continue
+
+        if tokens[0] == "gate":
+            inliner.define(tokens)
+        else:
+            prefix, call_start = "", 0
+            if tokens[0] == "if" and len(tokens) > 1 and tokens[1] == "(":
+                call_start = _closing_paren(tokens, 1) + 1
+                prefix = f"if({''.join(tokens[2 : call_start - 1])}) "
+            if tokens[-1] == ";" and tokens[call_start] in inliner.definitions:
+                call = _parse_call(tokens[call_start:-1])
+                lines.extend(prefix + _render_call(inner) for inner in inliner.expand(call))
+            else:
+                lines.append(qasm_string[start:token_end])
+        tokens = []
+        start = None
 
+    if tokens:
+        lines.append(qasm_string[start:].strip())
 
-def _find_gate_line(lines):
-    for i, line in enumerate(lines):
-        if line.strip().startswith("gate"):
-            return i
-    return None
+    return "\n".join(lines)
 
 
-def flatten_qasm_program(qasm_str):
+def flatten_qasm_program(qasm_str: str) -> str:
     """Returns a copy of the input QASM compatible with
     the :class:`~qbraid.transpiler.cirq.QasmParser`.
     Conversion includes deconstruction of custom defined gates, and
     decomposition of unsupported gates/operations.
 
     """
-    # temp hack to fix 'r' replacing last char of 'ecr'
-    qasm_str = qasm_str.replace("ecr", "ecr_")
-
     input_str = remove_qasm_barriers(qasm_str)
-
-    lines = input_str.strip("\n").split("\n")
-    gate_lines = [(i, line) for i, line in enumerate(lines) if line.strip().startswith("gate")]
-    gate_lines.reverse()  # Reverse to start removing from the last
-    gate_line_idx = _find_gate_line(lines)
-
-    # Remove all 'gate' lines
-    for idx, _ in gate_lines:
-        lines.pop(idx)
-
-    for _, gate_line in gate_lines:
-        # Insert the current 'gate' line for this iteration
-        lines.insert(gate_line_idx, gate_line)
-
-        new_input = "\n".join(lines)
-        new_input = unfold_qasm_gate_defs(new_input)  # call the conversion function
-        lines = new_input.split("\n")  # update lines after conversion
-
-        # Remove the current 'gate' line for the next iteration
-        lines.pop(gate_line_idx)
-
-    qasm = "\n".join(lines)
+    qasm = unfold_qasm_gate_defs(input_str)
     qasm_out = decompose_qasm_qelib1(qasm)
 
     return qasm_out
@@ -9,147 +9,337 @@
 # THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
 
 """
-Module that implements qelib1.inc qasm gate definitions as python functions
+Module that implements qelib1.inc qasm gate definitions as decomposition templates
 
 """
 import re
-from typing import Optional
+from operator import itemgetter
+from typing import Callable, NamedTuple, Optional, Sequence
 
 from qbraid.passes.exceptions import QasmDecompositionError
+from qbraid.passes.lexer import is_identifier, is_significant, tokenize
+from qbraid.passes.qasm3.expression import (
+    CONSTANTS,
+    FUNCTIONS,
+    CompiledExpression,
+    compile_tokens,
+    evaluate_tokens,
+)
+
+_DEFINITIONS = """
+gate cu(theta,phi,lambda,gamma) c, t {
+  p(gamma) c;
+  p((lambda+phi)/2) c;
+  p((lambda-phi)/2) t;
+  cx c,t;
+  u(-theta/2,0,-(phi+lambda)/2) t;
+  cx c,t;
+  u(theta/2,phi,0) t;
+}
+gate rxx(theta) a, b {
+  h a;
+  h b;
+  cx a,b;
+  rz(theta) b;
+  cx a,b;
+  h b;
+  h a;
+}
+gate rccx a, b, c {
+  u2(0,pi) c;
+  u1(pi/4) c;
+  cx b,c;
+  u1(-pi/4) c;
+  cx a,c;
+  u1(pi/4) c;
+  cx b,c;
+  u1(-pi/4) c;
+  u2(0,pi) c;
+}
+gate rc3x a, b, c, d {
+  u2(0,pi) d;
+  u1(pi/4) d;
+  cx c,d;
+  u1(-pi/4) d;
+  u2(0,pi) d;
+  cx a,d;
+  u1(pi/4) d;
+  cx b,d;
+  u1(-pi/4) d;
+  cx a,d;
+  u1(pi/4) d;
+  cx b,d;
+  u1(-pi/4) d;
+  u2(0,pi) d;
+  u1(pi/4) d;
+  cx c,d;
+  u1(-pi/4) d;
+  u2(0,pi) d;
+}
+"""
+
+_DEFINITION_PATTERN = re.compile(r"gate\s+(\w+)\s*(?:\(([^)]*)\))?\s*([^{]*)\{([^}]*)\}")
+
+_STATEMENT_PATTERN = re.compile(r"\s*([A-Za-z_]\w*)\s*(?:\((.*)\))?\s*([^;()]*)$", re.DOTALL)
+
+_PLACEHOLDER_PATTERN = re.compile(r"\{(\d+)\}")
+
+
+class _Field(NamedTuple):
+    """A parameter expression of a decomposition that depends on the gate parameters."""
+
+    tokens: tuple[str, ...]
+    formals: frozenset[str]
+    function: CompiledExpression
+
+
+class _Template(NamedTuple):
+    """A precompiled decomposition of a gate.
+
+    The decomposition is a text with placeholders, numbered over the values of the
+    parameters that depend on the gate parameters, followed by the actual parameters as
+    written, for parameters used as they are, and by the qubit operands. Parameters that do
+    not depend on the gate parameters are kept as written in the definition. The text is
+    stored split at the placeholders, with a placeholder slot between consecutive pieces.
+    """
+
+    params: tuple[str, ...]
+    num_qubits: int
+    fields: tuple[_Field, ...]
+    pieces: tuple[Optional[str], ...]
+    pick: Callable[[Sequence[str]], tuple[str, ...]]
+
+    def render(self, values: Sequence[str]) -> str:
+        """Return the decomposition, given the values of the placeholders in order."""
+        pieces = list(self.pieces)
+        pieces[1::2] = self.pick(values)
+        return "".join(pieces)
+
+
+def _split_args(text: str) -> list[str]:
+    """Split a comma-separated list, ignoring commas nested in parentheses."""
+    if "(" not in text:
+        args = list(map(str.strip, text.split(",")))
+        return args if all(args) else [arg for arg in args if arg]
+
+    args, depth, start = [], 0, 0
+    for index, char in enumerate(text):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            args.append(text[start:index].strip())
+            start = index + 1
+    args.append(text[start:].strip())
+    return [arg for arg in args if arg]
+
+
+def _expression_tokens(expression: str) -> tuple[str, ...]:
+    """Return the significant tokens of an expression."""
+    return tuple(filter(is_significant, tokenize(expression)))
+
+
+def _compile_template(name: str, params: str, qubits: str, body: str) -> _Template:
+    """Compile the body of a gate definition into a decomposition template."""
+    formals = tuple(_split_args(params or ""))
+    qubit_names = _split_args(qubits)
+    variables = frozenset(formals)
+    fields = []
+    lines = [f"\n// {name} gate"]
+    for statement in filter(str.strip, body.split(";")):
+        gate, args, operands = _STATEMENT_PATTERN.match(statement).groups()
+        rendered = []
+        for arg in _split_args(args or ""):
+            tokens = _expression_tokens(arg)
+            if variables.isdisjoint(tokens):
+                rendered.append(arg)
+            elif len(tokens) == 1:
+                rendered.append(f"{{p{formals.index(arg)}}}")
+            else:
+                rendered.append(f"{{{len(fields)}}}")
+                function = compile_tokens(tokens, variables, caret_power=True)
+                fields.append(_Field(tokens, variables.intersection(tokens), function))
+        targets = ",".join(
+            f"{{q{qubit_names.index(operand)}}}" for operand in _split_args(operands)
+        )
+        lines.append(
+            f"{gate}({','.join(rendered)}) {targets};" if rendered else f"{gate} {targets};"
+        )
+
+    num_fields = len(fields)
+    text = "\n".join(lines) + "\n\n"
+    for index in range(len(formals)):
+        text = text.replace(f"{{p{index}}}", f"{{{num_fields + index}}}")
+    for index in range(len(qubit_names)):
+        text = text.replace(f"{{q{index}}}", f"{{{num_fields + len(formals) + index}}}")
+
+    pieces = _PLACEHOLDER_PATTERN.split(text)
+    slots = [int(slot) for slot in pieces[1::2]]
+    pieces[1::2] = [None] * len(slots)
+    pick = itemgetter(*slots) if len(slots) > 1 else lambda values: (values[slots[0]],)
+    return _Template(formals, len(qubit_names), tuple(fields), tuple(pieces), pick)
 
 
-def _get_param(instr: str) -> Optional[str]:
+def _evaluate_param(text: str) -> Optional[float]:
+    """Evaluate a gate parameter, given as a number or a constant expression.
+
+    Returns None if the parameter refers to variables, such as the parameters of an
+    enclosing gate definition.
+    """
     try:
-        return instr[instr.index("(") + 1 : instr.index(")")]
+        return float(text)
     except ValueError:
+        pass
+    tokens = _expression_tokens(text)
+    if any(
+        is_identifier(token) and token not in CONSTANTS and token not in FUNCTIONS
+        for token in tokens
+    ):
         return None
+    return evaluate_tokens(tokens, caret_power=True)
+
+
+def _substitute(field: _Field, texts: dict[str, str], values: dict[str, Optional[float]]) -> str:
+    """Return the value of a field, or its expression over the actual parameters, given as
+    texts ready to substitute, if one of the parameters it uses has no value."""
+    if all(values[formal] is not None for formal in field.formals):
+        return str(field.function(values))
+    return "".join(texts[token] if token in field.formals else token for token in field.tokens)
+
+
+_TEMPLATES: dict[str, _Template] = {
+    name: _compile_template(name, params, qubits, body)
+    for name, params, qubits, body in _DEFINITION_PATTERN.findall(_DEFINITIONS)
+}
+
+_TEMPLATE_NAMES = tuple(_TEMPLATES)
 
+_TEMPLATE_NAME_PATTERN = re.compile(rf"\b(?:{'|'.join(_TEMPLATES)})\b")
 
-def _remove_spaces_in_parentheses(expression):
-    # Find all parenthesized parts of the input.
-    parenthesized_parts = re.findall(r"\(.*?\)", expression)
+# Comments and statement delimiters, which split a program into statements.
+_DELIMITER_PATTERN = re.compile(r"(//[^\n]*|/\*.*?(?:\*/|\Z)|[;{}])", re.DOTALL)
 
-    for part in parenthesized_parts:
-        # For each parenthesized part, remove all the spaces.
-        cleaned_part = part.replace(" ", "")
 
-        # Replace the original part in the expression with the cleaned part.
-        expression = expression.replace(part, cleaned_part)
+def _statement(name: str, args: Optional[str], operands: str) -> str:
+    """Format an application of a gate, for error messages."""
+    return f"{name}({args}) {operands}" if args is not None else f"{name} {operands}"
 
-    return expression
 
+def _instantiate(name: str, args: Optional[str], operands: str) -> str:
+    """Instantiate the template of a gate for one application of the gate."""
+    template = _TEMPLATES[name]
+    params = _split_args(args) if args else []
+    qubits = _split_args(operands)
+    if len(params) != len(template.params) or len(qubits) != template.num_qubits:
+        raise QasmDecompositionError(
+            f"Gate '{name}' expects {len(template.params)} parameters and "
+            f"{template.num_qubits} qubits, got '{_statement(name, args, operands)}'."
+        )
 
-def _decompose_cu_instr(instr: str) -> str:
-    """controlled-U gate"""
     try:
-        instr = _remove_spaces_in_parentheses(instr)
-        cu_gate, qs = instr.split(" ")
-        a, b = qs.strip(";").split(",")
-        params_lst = _get_param(cu_gate).split(",")
-        params = [float(x) for x in params_lst]
-        theta, phi, lam, gamma = params
-    except (AttributeError, ValueError) as err:
-        raise QasmDecompositionError from err
-    instr_out = "\n// cu gate\n"
-    instr_out += f"p({gamma}) {a};\n"
-    instr_out += f"p({(lam+phi)/2}) {a};\n"
-    instr_out += f"p({(lam-phi)/2}) {b};\n"
-    instr_out += f"cx {a},{b};\n"
-    instr_out += f"u({-1*theta/2},0,{-1*(phi+lam)/2}) {b};\n"
-    instr_out += f"cx {a},{b};\n"
-    instr_out += f"u({theta/2},{phi},0) {b};\n\n"
-    return instr_out
+        values = dict(zip(template.params, map(_evaluate_param, params))) if template.fields else {}
+        if None in values.values():
+            texts = {
+                formal: param if len(_expression_tokens(param)) == 1 else f"({param})"
+                for formal, param in zip(template.params, params)
+            }
+            fields = [_substitute(field, texts, values) for field in template.fields]
+        else:
+            fields = [str(field.function(values)) for field in template.fields]
+    except (ValueError, ZeroDivisionError, OverflowError) as err:
+        raise QasmDecompositionError(
+            f"Cannot evaluate parameters of '{_statement(name, args, operands)}'."
+        ) from err
+
+    return template.render((*fields, *params, *qubits))
+
+
+def _decompose_statement(statement: str) -> str:
+    """Decompose a single application of a templated gate, given without its semicolon."""
+    match = _STATEMENT_PATTERN.match(statement)
+    if match is None or match.group(1) not in _TEMPLATES:
+        raise QasmDecompositionError(f"Cannot decompose statement '{statement.strip()}'.")
+    return _instantiate(*match.groups())
 
 
 def _decompose_rxx_instr(instr: str) -> str:
     """two-qubit XX rotation"""
-    try:
-        instr = instr.replace(", ", ",")
-        rxx_gate, qs = instr.split(" ")
-        a, b = qs.strip(";").split(",")
-        theta = _get_param(rxx_gate)
-    except (AttributeError, ValueError) as err:
-        raise QasmDecompositionError from err
-    instr_out = "\n// rxx gate\n"
-    instr_out += f"h {a};\n"
-    instr_out += f"h {b};\n"
-    instr_out += f"cx {a},{b};\n"
-    instr_out += f"rz({theta}) {b};\n"
-    instr_out += f"cx {a},{b};\n"
-    instr_out += f"h {b};\n"
-    instr_out += f"h {a};\n\n"
-    return instr_out
-
-
-def _decompose_rccx_instr(instr: str) -> str:
-    """relative-phase CCX"""
-    try:
-        _, qs = instr.split(" ")
-        a, b, c = qs.strip(";").split(",")
-    except (AttributeError, ValueError) as err:
-        raise QasmDecompositionError from err
-    instr_out = "\n// rccx gate\n"
-    instr_out += f"u2(0,pi) {c};\n"
-    instr_out += f"u1(pi/4) {c};\n"
-    instr_out += f"cx {b},{c};\n"
-    instr_out += f"u1(-pi/4) {c};\n"
-    instr_out += f"cx {a},{c};\n"
-    instr_out += f"u1(pi/4) {c};\n"
-    instr_out += f"cx {b},{c};\n"
-    instr_out += f"u1(-pi/4) {c};\n"
-    instr_out += f"u2(0,pi) {c};\n\n"
-    return instr_out
-
-
-def _decompose_rc3x_instr(instr: str) -> str:
-    """relative-phase 3-controlled X gate"""
-    try:
-        _, qs = instr.split(" ")
-        a, b, c, d = qs.strip(";").split(",")
-    except (AttributeError, ValueError) as err:
-        raise QasmDecompositionError from err
-    instr_out = "\n// rc3x gate\n"
-    instr_out += f"u2(0,pi) {d};\n"
-    instr_out += f"u1(pi/4) {d};\n"
-    instr_out += f"cx {c},{d};\n"
-    instr_out += f"u1(-pi/4) {d};\n"
-    instr_out += f"u2(0,pi) {d};\n"
-    instr_out += f"cx {a},{d};\n"
-    instr_out += f"u1(pi/4) {d};\n"
-    instr_out += f"cx {b},{d};\n"
-    instr_out += f"u1(-pi/4) {d};\n"
-    instr_out += f"cx {a},{d};\n"
-    instr_out += f"u1(pi/4) {d};\n"
-    instr_out += f"cx {b},{d};\n"
-    instr_out += f"u1(-pi/4) {d};\n"
-    instr_out += f"u2(0,pi) {d};\n"
-    instr_out += f"u1(pi/4) {d};\n"
-    instr_out += f"cx {c},{d};\n"
-    instr_out += f"u1(-pi/4) {d};\n"
-    instr_out += f"u2(0,pi) {d};\n\n"
-    return instr_out
+    return _decompose_statement(instr.strip().rstrip(";"))
+
+
+def _decompose_template_statement(statement: str, instances: dict[str, str]) -> Optional[str]:
+    """Return the decomposition of a statement that starts with the name of a templated gate,
+    with its leading whitespace, or None if the statement does not apply a templated gate.
+
+    Instances are memoized by statement, so that repeated applications of a gate are parsed
+    and instantiated once.
+    """
+    instance = instances.get(statement)
+    if instance is None:
+        stripped = statement.lstrip()
+        match = _STATEMENT_PATTERN.match(stripped)
+        if match is None or match.group(1) not in _TEMPLATES:
+            return None
+        instance = statement[: len(statement) - len(stripped)] + _instantiate(*match.groups())
+        instances[statement] = instance
+    return instance
+
+
+def _decompose_statements(statements: list[str]) -> str:
+    """Decompose the statements of a program without comments or braces, given as the
+    program split on semicolons.
+
+    Only statements that start with the name of a templated gate are visited in Python. The
+    text between them is joined back as it is.
+    """
+    output, start, instances = [], 0, {}
+    last = len(statements) - 1
+    names = _TEMPLATE_NAMES
+    for index in [i for i, text in enumerate(statements) if text.lstrip().startswith(names)]:
+        instance = None
+        if index < last:
+            instance = _decompose_template_statement(statements[index], instances)
+        if instance is not None:
+            if index > start:
+                output.append(";".join(statements[start:index]) + ";")
+            output.append(instance)
+            start = index + 1
+    output.append(";".join(statements[start:]))
+    return "".join(output)
 
 
 def decompose_qasm_qelib1(qasm_str: str) -> str:
-    """Replace edge-case qelib1 gates with equivalent decomposition."""
-    qasm_lst_out = []
-    qasm_lst = qasm_str.split("\n")
-
-    for _, qasm_line in enumerate(qasm_lst):
-        line_str = qasm_line
-        len_line = len(line_str)
-        if len_line > 3 and line_str[0:3] == "cu(":
-            line_str_out = _decompose_cu_instr(line_str)
-        elif len_line > 4 and line_str[0:4] == "rxx(":
-            line_str_out = _decompose_rxx_instr(line_str)
-        elif len_line > 4 and line_str[0:4] == "rccx":
-            line_str_out = _decompose_rccx_instr(line_str)
-        elif len_line > 4 and line_str[0:4] == "rc3x":
-            line_str_out = _decompose_rc3x_instr(line_str)
-        else:
-            line_str_out = line_str
+    """Replace edge-case qelib1 gates with equivalent decomposition.
 
-        qasm_lst_out.append(line_str_out)
+    Each application of the ``cu``, ``rxx``, ``rccx`` and ``rc3x`` gates that starts a
+    statement is parsed once and replaced by an instance of a precompiled decomposition
+    template, in a single scan of the program. Parameters used as they are in the template
+    are substituted as written. Parameters in arithmetic are evaluated, or substituted as
+    expressions if they refer to variables. Comments, gate definitions and conditioned gates
+    are left unchanged.
+    """
+    if _TEMPLATE_NAME_PATTERN.search(qasm_str) is None:
+        return qasm_str
+    if not ("//" in qasm_str or "/*" in qasm_str or "{" in qasm_str or "}" in qasm_str):
+        return _decompose_statements(qasm_str.split(";"))
+
+    # Statements alternate with the semicolons, braces and comments that follow them.
+    pieces = _DELIMITER_PATTERN.split(qasm_str)
+    depth, at_start, instances = 0, True, {}
+    for index in range(1, len(pieces), 2):
+        statement, delimiter = pieces[index - 1], pieces[index]
+        if delimiter == ";":
+            if at_start and depth == 0 and statement.lstrip().startswith(_TEMPLATE_NAMES):
+                instance = _decompose_template_statement(statement, instances)
+                if instance is not None:
+                    pieces[index - 1], pieces[index] = instance, ""
+            at_start = True
+        elif delimiter == "{":
+            depth, at_start = depth + 1, True
+        elif delimiter == "}":
+            depth, at_start = max(depth - 1, 0), True
+        else:
+            at_start = at_start and not statement.strip()
 
-    qasm_str_def = "\n".join(qasm_lst_out)
-    return qasm_str_def
+    return "".join(pieces)
@@ -20,11 +20,13 @@ Functions
    :toctree: ../stubs/
 
    decompose
+   register_decomposition_rule
    insert_gate_def
    replace_gate_name
    add_stdgates_include
    remove_stdgates_include
    convert_qasm_pi_to_decimal
+   evaluate_expression
    remove_unused_gates
 
 """
@@ -35,15 +37,18 @@ from .compat import (
     remove_stdgates_include,
     replace_gate_name,
 )
-from .decompose import decompose
+from .decompose import decompose, register_decomposition_rule
+from .expression import evaluate_expression
 from .format import remove_unused_gates
 
 __all__ = [
     "decompose",
+    "register_decomposition_rule",
     "insert_gate_def",
     "replace_gate_name",
     "add_stdgates_include",
     "remove_stdgates_include",
     "convert_qasm_pi_to_decimal",
+    "evaluate_expression",
     "remove_unused_gates",
 ]
@@ -14,7 +14,23 @@ across various other quantum software frameworks.
 
 """
 import math
-import re
+from typing import Iterable
+
+from qbraid.passes.lexer import (
+    gate_name_indices,
+    is_identifier,
+    is_significant,
+    next_significant,
+    previous_significant,
+    tokenize,
+)
+from qbraid.passes.manager import PassManager, TokenPass
+from qbraid.passes.qasm3.expression import (
+    CONSTANTS,
+    FUNCTIONS,
+    evaluate_tokens,
+    is_expression_token,
+)
 
 GATE_DEFINITIONS = {
     "iswap": """
@@ -74,6 +90,43 @@ def insert_gate_def(qasm3_str: str, gate_name: str, force_insert: bool = False)
     return "\n".join(lines)
 
 
+# Pairs of interchangeable gate names, mapping each gate to its alternate form
+GATE_NAME_PAIRS = {
+    old: new
+    for pair in [
+        ("cnot", "cx"),
+        ("si", "sdg"),
+        ("ti", "tdg"),
+        ("v", "sx"),
+        ("vi", "sxdg"),
+        ("p", "phaseshift"),
+        ("cp", "cphaseshift"),
+    ]
+    for old, new in (pair, pair[::-1])
+}
+
+
+def rename_gates_pass(gate_names: dict[str, str]) -> TokenPass:
+    """Return a token pass that renames applied and defined gates.
+
+    Only identifiers in gate position are renamed, so qubit, register and parameter names
+    that share a gate's name are left untouched.
+
+    Args:
+        gate_names (dict[str, str]): Mapping from old to new gate names.
+    """
+
+    def rename_gates(tokens: list[str]) -> list[str]:
+        if set(gate_names).isdisjoint(tokens):
+            return tokens
+        tokens = list(tokens)
+        for index in list(gate_name_indices(tokens)):
+            tokens[index] = gate_names.get(tokens[index], tokens[index])
+        return tokens
+
+    return rename_gates
+
+
 def replace_gate_name(
     qasm: str, old_gate_name: str, new_gate_name: str, force_replace: bool = False
 ) -> str:
@@ -92,67 +145,226 @@ def replace_gate_name(
     Returns:
         str: The modified QASM program with the gate names replaced.
     """
-    # Define pairs of interchangeable gates
-    gate_pairs = [
-        ("cnot", "cx"),
-        ("si", "sdg"),
-        ("ti", "tdg"),
-        ("v", "sx"),
-        ("vi", "sxdg"),
-        ("p", "phaseshift"),
-        ("cp", "cphaseshift"),
-    ]
+    if force_replace or GATE_NAME_PAIRS.get(old_gate_name) == new_gate_name:
+        return PassManager([rename_gates_pass({old_gate_name: new_gate_name})]).run(qasm)
 
-    # Create a mapping from each gate to its alternate form
-    gate_map = {old: new for pair in gate_pairs for old, new in (pair, pair[::-1])}
+    return qasm
 
-    parameterized_gates = {"p", "cp", "phaseshift", "cphaseshift"}
 
-    suffix = "(" if old_gate_name in parameterized_gates else " "
+def _find_include(tokens: list[str], filename: str) -> tuple[int, int]:
+    """Return the start and end indices of an include statement, or (-1, -1)."""
+    target = f'"{filename}"'
+    index = -1
+    while True:
+        try:
+            index = tokens.index("include", index + 1)
+        except ValueError:
+            return -1, -1
+        string_index = next_significant(tokens, index)
+        if string_index is None or tokens[string_index] != target:
+            continue
+        end_index = next_significant(tokens, string_index)
+        if end_index is not None and tokens[end_index] == ";":
+            return index, end_index
+
+
+def _header_end(tokens: list[str], include_files: bool = False) -> int:
+    """Return the index of the semicolon ending the version declaration, or -1.
+
+    If ``include_files`` is True, returns the end of the last include statement directly
+    following the version declaration instead.
+    """
+    end = -1
+    expected = {"OPENQASM", "include"} if include_files else {"OPENQASM"}
+    index = next_significant(tokens, -1)
+    while index is not None and tokens[index] in expected:
+        while index is not None and tokens[index] != ";":
+            index = next_significant(tokens, index)
+        if index is None or not include_files:
+            return index if index is not None else end
+        end = index
+        expected = {"include"}
+        index = next_significant(tokens, index)
+    return end
 
-    # Replace based on gate map and force_replace flag
-    if old_gate_name in gate_map and (gate_map[old_gate_name] == new_gate_name or force_replace):
-        new_gate_name_with_suffix = new_gate_name + suffix
-        old_gate_name_with_suffix = old_gate_name + suffix
-        return qasm.replace(old_gate_name_with_suffix, new_gate_name_with_suffix)
 
-    if force_replace:
-        return qasm.replace(old_gate_name, new_gate_name)
+def add_include_pass(filename: str = "stdgates.inc") -> TokenPass:
+    """Return a token pass that includes a file after the version declaration, if missing."""
 
-    return qasm
+    def add_include(tokens: list[str]) -> list[str]:
+        if _find_include(tokens, filename)[0] != -1:
+            return tokens
+        header_end = _header_end(tokens)
+        if header_end == -1:
+            return tokens
+        include = ["\n", "include", " ", f'"{filename}"', ";"]
+        return tokens[: header_end + 1] + include + tokens[header_end + 1 :]
 
+    return add_include
 
-def add_stdgates_include(qasm_str: str) -> str:
-    """Add 'include "stdgates.inc";' to the QASM string if it is missing."""
-    if 'include "stdgates.inc";' in qasm_str:
-        return qasm_str
 
-    lines = qasm_str.splitlines()
+def remove_include_pass(filename: str = "stdgates.inc") -> TokenPass:
+    """Return a token pass that removes every include statement of a file."""
 
-    for i, line in enumerate(lines):
-        if "OPENQASM" in line:
-            lines.insert(i + 1, 'include "stdgates.inc";')
-            break
+    def remove_include(tokens: list[str]) -> list[str]:
+        start, end = _find_include(tokens, filename)
+        while start != -1:
+            tokens = tokens[:start] + tokens[end + 1 :]
+            start, end = _find_include(tokens, filename)
+        return tokens
 
-    return "\n".join(lines)
+    return remove_include
+
+
+def insert_gate_defs_pass(gate_names: Iterable[str]) -> TokenPass:
+    """Return a token pass that inserts definitions of gates from :data:`GATE_DEFINITIONS`.
+
+    A definition is inserted after the version declaration and include statements only if the
+    gate is applied in the program and not already defined.
+
+    Raises:
+        ValueError: If a gate definition is not found.
+    """
+    gate_names = list(gate_names)
+    for gate_name in gate_names:
+        if gate_name not in GATE_DEFINITIONS:
+            raise ValueError(
+                f"Gate {gate_name} definition not found. "
+                f"Available gate definitions include: {set(GATE_DEFINITIONS.keys())}"
+            )
+
+    def insert_gate_defs(tokens: list[str]) -> list[str]:
+        if set(gate_names).isdisjoint(tokens):
+            return tokens
+        applied, defined = set(), set()
+        for index in gate_name_indices(tokens):
+            previous = previous_significant(tokens, index)
+            is_definition = previous is not None and tokens[previous] in ("gate", "opaque")
+            (defined if is_definition else applied).add(tokens[index])
+
+        missing = [name for name in gate_names if name in applied and name not in defined]
+        if not missing:
+            return tokens
+
+        definitions = "\n" + "\n".join(GATE_DEFINITIONS[name].strip() for name in missing)
+        insert_index = _header_end(tokens, include_files=True) + 1
+        return tokens[:insert_index] + tokenize(definitions) + tokens[insert_index:]
+
+    return insert_gate_defs
+
+
+def add_stdgates_include(qasm_str: str) -> str:
+    """Add 'include "stdgates.inc";' to the QASM string if it is missing."""
+    return PassManager([add_include_pass("stdgates.inc")]).run(qasm_str)
 
 
 def remove_stdgates_include(qasm: str) -> str:
     """Remove 'include "stdgates.inc";' from the QASM string."""
-    return qasm.replace('include "stdgates.inc";', "")
+    return PassManager([remove_include_pass("stdgates.inc")]).run(qasm)
 
 
-def convert_qasm_pi_to_decimal(qasm_str: str) -> str:
-    """Convert all instances of 'pi' in the QASM string to their decimal value."""
+_PI_NAMES = frozenset({"pi", "π"})
 
-    pattern = r"(\d*\.?\d*\s*[*/+-]\s*)?pi(\s*[*/+-]\s*\d*\.?\d*)?"
+_SEGMENT_BOUNDARIES = frozenset({";", "{", "}", "[", "]", "=", ":"})
 
-    def replace_with_decimal(match):
-        expr = match.group()
-        try:
-            value = eval(expr.replace("pi", str(math.pi)))  # pylint: disable=eval-used
-        except SyntaxError:
-            return expr
-        return str(value)
 
-    return re.sub(pattern, replace_with_decimal, qasm_str)
+def _is_call_paren(tokens: list[str], index: int) -> bool:
+    """Return True if the parenthesis at ``index`` opens the arguments of a call, other
+    than a call to a built-in math function."""
+    previous = previous_significant(tokens, index)
+    return (
+        previous is not None
+        and is_identifier(tokens[previous])
+        and tokens[previous] not in CONSTANTS
+        and tokens[previous] not in FUNCTIONS
+    )
+
+
+def _expression_bounds(tokens: list[str], index: int) -> tuple[int, int]:
+    """Return the first and last index of the expression segment containing ``index``.
+
+    Segments are delimited by punctuation and by the parentheses of calls, such as gate
+    parameter lists, while grouping parentheses and calls to built-in math functions are
+    kept inside their segment.
+    """
+    depth, unclosed = 0, 0
+    start = index
+    while start > 0:
+        token = tokens[start - 1]
+        if token in _SEGMENT_BOUNDARIES or (token == "," and depth == 0):
+            break
+        if token == ")":
+            depth += 1
+        elif token == "(":
+            if depth > 0:
+                depth -= 1
+            elif _is_call_paren(tokens, start - 1):
+                break
+            else:
+                unclosed += 1
+        start -= 1
+
+    depth = 0
+    end = index
+    while end < len(tokens) - 1:
+        token = tokens[end + 1]
+        if token in _SEGMENT_BOUNDARIES or (token == "," and depth == 0 and unclosed == 0):
+            break
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            if depth > 0:
+                depth -= 1
+            elif unclosed > 0:
+                unclosed -= 1
+            else:
+                break
+        end += 1
+    return start, end
+
+
+def pi_to_decimal_pass() -> TokenPass:
+    """Return a token pass that replaces ``pi`` with its decimal value.
+
+    Constant expressions involving ``pi``, such as gate parameters like ``3 * pi / 4``, are
+    evaluated to a single decimal with :func:`~qbraid.passes.qasm3.evaluate_expression`.
+    Elsewhere, each ``pi`` is replaced by its decimal value.
+    """
+
+    def pi_to_decimal(tokens: list[str]) -> list[str]:
+        if _PI_NAMES.isdisjoint(tokens):
+            return tokens
+
+        output: list[str] = []
+        copied = 0
+        for index, token in enumerate(tokens):
+            if index < copied or token not in _PI_NAMES:
+                continue
+            start, end = _expression_bounds(tokens, index)
+            significant = [
+                position for position in range(start, end + 1) if is_significant(tokens[position])
+            ]
+            start, end = significant[0], significant[-1]
+            segment = tuple(tokens[position] for position in significant)
+            try:
+                if not all(map(is_expression_token, segment)):
+                    raise ValueError("Expression is not constant.")
+                value = str(evaluate_tokens(segment))
+                output.extend(tokens[copied:start])
+                output.append(value)
+            except (ValueError, ZeroDivisionError, OverflowError, TypeError):
+                output.extend(tokens[copied:start])
+                output.extend(
+                    str(math.pi) if text in _PI_NAMES else text for text in tokens[start : end + 1]
+                )
+            copied = end + 1
+
+        output.extend(tokens[copied:])
+        return output
+
+    return pi_to_decimal
+
+
+def convert_qasm_pi_to_decimal(qasm_str: str) -> str:
+    """Convert all instances of 'pi' in the QASM string to their decimal value."""
+    return PassManager([pi_to_decimal_pass()]).run(qasm_str)
@@ -8,199 +8,375 @@
 #
 # THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
 
+# pylint:disable=invalid-name
+
 """
 Module for providing transforamtions with basis gates.
 across various other quantum software frameworks.
 
+Decompositions are table-driven: each rule is an OpenQASM 3 gate definition whose
+body gives the replacement of the gate, and rules may refer to other rules.
+
 """
+import copy
+from typing import Any, Callable, Iterable, Optional, Union
+
 from openqasm3 import ast, dumps
 from openqasm3.parser import parse
+from openqasm3.visitor import QASMTransformer, QASMVisitor
 
 from qbraid.passes.exceptions import QasmDecompositionError
 
+DEFAULT_BASIS_GATES = frozenset(
+    {"x", "y", "z", "rx", "ry", "rz", "h", "cx", "s", "sdg", "t", "tdg", "sx", "sxdg", "swap"}
+)
 
-def decompose_crx(gate: ast.QuantumGate) -> list[ast.Statement]:
-    """Decompose a crx gate into its basic gate equivalents."""
-    theta = gate.arguments[0]
-    control = gate.qubits[0]
-    target = gate.qubits[1]
-
-    rz_pos_pi_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="rz"),
-        arguments=[
-            ast.BinaryExpression(
-                op=ast.BinaryOperator(17),
-                lhs=ast.Identifier(name="pi"),
-                rhs=ast.FloatLiteral(value=2),
-            )
-        ],
-        qubits=[target],
-    )
-    ry_pos_theta_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="ry"),
-        arguments=[
-            ast.BinaryExpression(
-                op=ast.BinaryOperator(17), lhs=theta, rhs=ast.FloatLiteral(value=2)
-            )
-        ],
-        qubits=[target],
-    )
-    cx = ast.QuantumGate(
-        modifiers=[], name=ast.Identifier(name="cx"), arguments=[], qubits=[control, target]
-    )
-    ry_neg_theta_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="ry"),
-        arguments=[
-            ast.BinaryExpression(
-                op=ast.BinaryOperator(17),
-                lhs=ast.UnaryExpression(ast.UnaryOperator(3), theta),
-                rhs=ast.FloatLiteral(value=2),
-            )
-        ],
-        qubits=[target],
-    )
-    rz_neg_pi_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="rz"),
-        arguments=[
-            ast.BinaryExpression(
-                op=ast.BinaryOperator(17),
-                lhs=ast.UnaryExpression(ast.UnaryOperator(3), ast.Identifier(name="pi")),
-                rhs=ast.FloatLiteral(value=2),
-            )
-        ],
-        qubits=[target],
-    )
-    return [rz_pos_pi_half, ry_pos_theta_half, cx, ry_neg_theta_half, cx, rz_neg_pi_half]
-
-
-def decompose_cry(gate: ast.QuantumGate) -> list[ast.Statement]:
-    """Decompose a cry gate into its basic gate equivalents."""
-    theta = gate.arguments[0]
-    control = gate.qubits[0]
-    target = gate.qubits[1]
-
-    ry_pos_theta_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="ry"),
-        arguments=[
-            ast.BinaryExpression(
-                op=ast.BinaryOperator(17), lhs=theta, rhs=ast.FloatLiteral(value=2)
+_BUILTIN_RULES = """
+gate crx(theta) c, t {
+  rz(pi / 2) t;
+  ry(theta / 2) t;
+  cx c, t;
+  ry(-theta / 2) t;
+  cx c, t;
+  rz(-pi / 2) t;
+}
+gate cry(theta) c, t {
+  ry(theta / 2) t;
+  cx c, t;
+  ry(-(theta / 2)) t;
+  cx c, t;
+}
+gate crz(theta) c, t {
+  rz(theta / 2) t;
+  cx c, t;
+  rz(-(theta / 2)) t;
+  cx c, t;
+}
+gate cy c, t {
+  cry(pi) c, t;
+  s c;
+}
+gate cz c, t {
+  crz(pi) c, t;
+  s c;
+}
+"""
+
+DECOMPOSITION_RULES: dict[str, ast.QuantumGateDefinition] = {
+    statement.name.name: statement for statement in parse(_BUILTIN_RULES).statements
+}
+
+_Template = Callable[["_Bindings"], ast.QASMNode]
+
+# Rule bodies fully expanded for a given basis and compiled, keyed by basis and gate name.
+_EXPANDED_RULES: dict[Optional[frozenset[str]], dict[str, list[_Template]]] = {}
+
+
+def register_decomposition_rule(
+    definition: Union[str, ast.QuantumGateDefinition], overwrite: bool = False
+) -> None:
+    """
+    Registers a decomposition rule, given as an OpenQASM 3 gate definition.
+
+    The body of the definition replaces each application of the gate, with the gate
+    parameters and qubits substituted. The body may apply gates that have rules of their own.
+
+    Args:
+        definition (Union[str, ast.QuantumGateDefinition]): The gate definition, e.g.
+            ``"gate cs c, t { t c; cx c, t; tdg t; cx c, t; t t; }"``.
+        overwrite (optional, bool): Whether to replace an existing rule for the same gate.
+
+    Raises:
+        ValueError: If the definition is not a single gate definition, or if a rule for the
+                    gate already exists and overwrite is False.
+    """
+    if isinstance(definition, str):
+        statements = parse(definition).statements
+        if len(statements) != 1:
+            raise ValueError("Expected a single gate definition.")
+        definition = statements[0]
+
+    if not isinstance(definition, ast.QuantumGateDefinition):
+        raise ValueError(f"Expected a gate definition, got {type(definition).__name__}.")
+
+    name = definition.name.name
+    if name in DECOMPOSITION_RULES and not overwrite:
+        raise ValueError(f"A decomposition rule for gate '{name}' is already registered.")
+
+    DECOMPOSITION_RULES[name] = definition
+    _EXPANDED_RULES.clear()
+
+
+def _with_span(clone: ast.QASMNode, node: ast.QASMNode) -> ast.QASMNode:
+    """Give a copy built by its constructor the span of the original node."""
+    clone.span = node.span
+    return clone
+
+
+def _fresh_indices(indices: list) -> list:
+    """Return a copy of the indices of an indexed identifier, with new index nodes."""
+    return [
+        [_fresh(value) for value in index] if index.__class__ is list else _fresh(index)
+        for index in indices
+    ]
+
+
+# Copiers for the nodes that operands are usually made of. Building the copies with their
+# constructors, rather than through ``__dict__``, keeps each copy a single object for the
+# garbage collector to track.
+_CLONERS: dict[type, Callable[[Any], Any]] = {
+    ast.Identifier: lambda node: _with_span(ast.Identifier(node.name), node),
+    ast.IntegerLiteral: lambda node: _with_span(ast.IntegerLiteral(node.value), node),
+    ast.FloatLiteral: lambda node: _with_span(ast.FloatLiteral(node.value), node),
+    ast.BooleanLiteral: lambda node: _with_span(ast.BooleanLiteral(node.value), node),
+    ast.IndexedIdentifier: lambda node: _with_span(
+        ast.IndexedIdentifier(_fresh(node.name), _fresh_indices(node.indices)), node
+    ),
+    ast.BinaryExpression: lambda node: _with_span(
+        ast.BinaryExpression(node.op, _fresh(node.lhs), _fresh(node.rhs)), node
+    ),
+    ast.UnaryExpression: lambda node: _with_span(
+        ast.UnaryExpression(node.op, _fresh(node.expression)), node
+    ),
+    list: lambda nodes: [_fresh(node) for node in nodes],
+}
+
+
+def _fresh(node: Any) -> Any:
+    """Return a copy of a node and of its child nodes, so that no node object appears twice
+    in the output. Unlike :func:`copy.deepcopy`, spans and other non-node values are shared."""
+    cloner = _CLONERS.get(node.__class__)
+    if cloner is not None:
+        return cloner(node)
+    if not isinstance(node, ast.QASMNode):
+        return node
+    clone = object.__new__(node.__class__)
+    for key, value in node.__dict__.items():
+        setattr(clone, key, _fresh(value))
+    return clone
+
+
+class _Bindings(dict):
+    """Operands bound to the formals of a rule, for one application of the rule.
+
+    :meth:`take` hands out each operand itself on its first use, and a copy on every later
+    use, so that no operand node appears twice in the output.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.unused = set(self)
+
+    def take(self, name: str) -> ast.QASMNode:
+        """Return the operand bound to a formal, or a copy of it if it was already used."""
+        if name in self.unused:
+            self.unused.discard(name)
+            return self[name]
+        return _fresh(self[name])
+
+
+class _FormalOccurrences(QASMVisitor):
+    """Collects the identifiers in a node that refer to a formal of a rule."""
+
+    def __init__(self, formals: frozenset[str]):
+        self.formals = formals
+        self.occurrences: list[ast.Identifier] = []
+
+    def visit_Identifier(self, node: ast.Identifier) -> None:
+        """Record an identifier if it names a formal."""
+        if node.name in self.formals:
+            self.occurrences.append(node)
+
+
+def _compile(node: ast.QASMNode, formals: frozenset[str]) -> Optional[_Template]:
+    """Compile a node of a rule body into a function of the bindings of its formals.
+
+    Every call of the function builds new statement and expression nodes around the bound
+    operands, copying an operand only when it is used more than once, so that instances can
+    be modified in place independently. Subexpressions and gate names that do not refer to
+    any formal are compiled by :func:`_constant` into shared leaves, which are never copied
+    and must not be modified in place. Returns None for such an expression.
+    """
+    if isinstance(node, ast.Identifier):
+        if node.name not in formals:
+            return None
+        name = node.name
+        return lambda bindings: bindings.take(name)
+
+    if isinstance(node, (ast.IntegerLiteral, ast.FloatLiteral, ast.BooleanLiteral)):
+        return None
+
+    if isinstance(node, ast.BinaryExpression):
+        lhs, rhs = _compile(node.lhs, formals), _compile(node.rhs, formals)
+        if lhs is None and rhs is None:
+            return None
+        lhs, rhs = lhs or _constant(node.lhs), rhs or _constant(node.rhs)
+        return lambda bindings: ast.BinaryExpression(node.op, lhs(bindings), rhs(bindings))
+
+    if isinstance(node, ast.UnaryExpression):
+        expression = _compile(node.expression, formals)
+        if expression is None:
+            return None
+        return lambda bindings: ast.UnaryExpression(node.op, expression(bindings))
+
+    if isinstance(node, ast.FunctionCall):
+        arguments, has_formals = _compile_all(node.arguments, formals)
+        if not has_formals:
+            return None
+        return lambda bindings: ast.FunctionCall(node.name, [arg(bindings) for arg in arguments])
+
+    if isinstance(node, ast.QuantumGate):
+        arguments, _ = _compile_all(node.arguments, formals)
+        qubits, _ = _compile_all(node.qubits, formals)
+        modifiers = [
+            (
+                modifier.modifier,
+                _compile(modifier.argument, formals) or _constant(modifier.argument),
             )
-        ],
-        qubits=[target],
-    )
-    cx = ast.QuantumGate(
-        modifiers=[], name=ast.Identifier(name="cx"), arguments=[], qubits=[control, target]
-    )
-    ry_neg_theta_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="ry"),
-        arguments=[
-            ast.UnaryExpression(
-                ast.UnaryOperator(3),
-                ast.BinaryExpression(
-                    op=ast.BinaryOperator(17), lhs=theta, rhs=ast.FloatLiteral(value=2)
-                ),
+            for modifier in node.modifiers
+        ]
+        return lambda bindings: ast.QuantumGate(
+            modifiers=[ast.QuantumGateModifier(kind, arg(bindings)) for kind, arg in modifiers],
+            name=node.name,
+            arguments=[arg(bindings) for arg in arguments],
+            qubits=[qubit(bindings) for qubit in qubits],
+        )
+
+    finder = _FormalOccurrences(formals)
+    finder.visit(node)
+    occurrences = finder.occurrences
+
+    def substitute(bindings: _Bindings) -> ast.QASMNode:
+        # Copy the node once, with the formals replaced by their operands through the memo.
+        memo = {id(formal): bindings.take(formal.name) for formal in occurrences}
+        return copy.deepcopy(node, memo)
+
+    return substitute
+
+
+def _constant(node: Optional[ast.QASMNode]) -> _Template:
+    """Return a template that shares a node which does not refer to any formal."""
+    return lambda _: node
+
+
+def _compile_all(
+    nodes: list[ast.QASMNode], formals: frozenset[str]
+) -> tuple[list[_Template], bool]:
+    """Compile a list of nodes, and report whether any of them refers to a formal."""
+    compiled = [_compile(node, formals) for node in nodes]
+    templates = [template or _constant(node) for template, node in zip(compiled, nodes)]
+    return templates, any(template is not None for template in compiled)
+
+
+class _Decomposer(QASMTransformer):
+    """Replaces gate applications by their decompositions, to a fixed point."""
+
+    def __init__(self, basis_gates: Optional[frozenset[str]], defined_gates: set[str]):
+        self.basis_gates = basis_gates
+        self.defined_gates = defined_gates
+        self.expanded = _EXPANDED_RULES.setdefault(basis_gates, {})
+        self.in_progress: set[str] = set()
+
+    def _needs_rule(self, gate: ast.QuantumGate) -> bool:
+        name = gate.name.name
+        if gate.modifiers or name in self.defined_gates:
+            return False
+        if self.basis_gates is None:
+            return name in DECOMPOSITION_RULES
+        if name in self.basis_gates:
+            return False
+        if name not in DECOMPOSITION_RULES:
+            raise QasmDecompositionError(
+                f"Gate '{name}' is not in the basis and has no decomposition rule."
             )
-        ],
-        qubits=[target],
-    )
-    return [ry_pos_theta_half, cx, ry_neg_theta_half, cx]
-
-
-def decompose_crz(gate: ast.QuantumGate) -> list[ast.Statement]:
-    """Decompose a cry gate into its basic gate equivalents."""
-    theta = gate.arguments[0]
-    control = gate.qubits[0]
-    target = gate.qubits[1]
-
-    rz_pos_theta_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="rz"),
-        arguments=[
-            ast.BinaryExpression(
-                op=ast.BinaryOperator(17), lhs=theta, rhs=ast.FloatLiteral(value=2)
+        return True
+
+    def _expanded_body(self, name: str) -> list[_Template]:
+        """Return the body of a rule with every gate in it decomposed, compiled into templates
+        and memoized per basis."""
+        if name in self.expanded:
+            return self.expanded[name]
+        if name in self.in_progress:
+            raise QasmDecompositionError(f"Decomposition rule for gate '{name}' is recursive.")
+
+        self.in_progress.add(name)
+        definition = DECOMPOSITION_RULES[name]
+        body = []
+        for statement in definition.body:
+            if isinstance(statement, ast.QuantumGate) and self._needs_rule(statement):
+                body.extend(self._apply(statement))
+            else:
+                body.append(statement)
+        self.in_progress.discard(name)
+
+        formals = frozenset(formal.name for formal in definition.arguments + definition.qubits)
+        templates = [_compile(statement, formals) or _constant(statement) for statement in body]
+        self.expanded[name] = templates
+        return templates
+
+    def _apply(self, gate: ast.QuantumGate) -> list[ast.Statement]:
+        """Return the decomposition of a gate application."""
+        name = gate.name.name
+        definition = DECOMPOSITION_RULES[name]
+        if len(gate.arguments) != len(definition.arguments) or len(gate.qubits) != len(
+            definition.qubits
+        ):
+            raise QasmDecompositionError(
+                f"Gate '{name}' is applied with {len(gate.arguments)} parameters and "
+                f"{len(gate.qubits)} qubits, but its decomposition rule expects "
+                f"{len(definition.arguments)} parameters and {len(definition.qubits)} qubits."
             )
-        ],
-        qubits=[target],
-    )
-    cx = ast.QuantumGate(
-        modifiers=[], name=ast.Identifier(name="cx"), arguments=[], qubits=[control, target]
-    )
-    rz_neg_theta_half = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="rz"),
-        arguments=[
-            ast.UnaryExpression(
-                ast.UnaryOperator(3),
-                ast.BinaryExpression(
-                    op=ast.BinaryOperator(17), lhs=theta, rhs=ast.FloatLiteral(value=2)
-                ),
+
+        bindings = _Bindings(
+            (formal.name, actual)
+            for formal, actual in zip(
+                definition.arguments + definition.qubits, gate.arguments + gate.qubits
             )
-        ],
-        qubits=[target],
-    )
-    return [rz_pos_theta_half, cx, rz_neg_theta_half, cx]
-
-
-def decompose_cy(gate: ast.QuantumGate) -> list[ast.Statement]:
-    """Decompose a cy gate into its basic gate equivalents."""
-    control = gate.qubits[0]
-    target = gate.qubits[1]
-
-    cry_pi = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="cry"),
-        arguments=[ast.Identifier(name="pi")],
-        qubits=[control, target],
-    )
-    s = ast.QuantumGate(modifiers=[], name=ast.Identifier(name="s"), arguments=[], qubits=[control])
-    return _decompose(ast.Program(statements=[cry_pi, s])).statements
-
-
-def decompose_cz(gate: ast.QuantumGate) -> list[ast.Statement]:
-    """Decompose a cz gate into its basic gate equivalents."""
-    control = gate.qubits[0]
-    target = gate.qubits[1]
-
-    crz_pi = ast.QuantumGate(
-        modifiers=[],
-        name=ast.Identifier(name="crz"),
-        arguments=[ast.Identifier(name="pi")],
-        qubits=[control, target],
-    )
-    s = ast.QuantumGate(modifiers=[], name=ast.Identifier(name="s"), arguments=[], qubits=[control])
-    return _decompose(ast.Program(statements=[crz_pi, s])).statements
-
-
-def _decompose(program: ast.Program) -> ast.Program:
-    """Decompose a program into its basic gate equivalents."""
-    transformed_statements = []
-    for statement in program.statements:
-        if isinstance(statement, ast.QuantumGate):
-            if statement.name.name == "crx":
-                transformed_statements.extend(decompose_crx(statement))
-            elif statement.name.name == "cry":
-                transformed_statements.extend(decompose_cry(statement))
-            elif statement.name.name == "crz":
-                transformed_statements.extend(decompose_crz(statement))
-            elif statement.name.name == "cy":
-                transformed_statements.extend(decompose_cy(statement))
-            elif statement.name.name == "cz":
-                transformed_statements.extend(decompose_cz(statement))
-            else:
-                transformed_statements.append(statement)
-        else:
-            transformed_statements.append(statement)
+        )
+        return [template(bindings) for template in self._expanded_body(name)]
+
+    def visit_QuantumGate(
+        self, node: ast.QuantumGate
+    ) -> Union[ast.QuantumGate, list[ast.Statement]]:
+        """Replace a gate application by its decomposition, if it needs one."""
+        if self._needs_rule(node):
+            return self._apply(node)
+        return node
+
 
-    return ast.Program(statements=transformed_statements, version=program.version)
+def decompose_program(
+    program: ast.Program, basis_gates: Optional[Iterable[str]] = None
+) -> ast.Program:
+    """
+    Decompose a parsed OpenQASM 3 program, replacing gates with their decomposition rules
+    until a fixed point is reached. The program is modified in place.
+
+    Each decomposed gate gives new statements with their own copies of the gate operands.
+    Constant parts of the rules, such as gate names and the ``2`` in ``theta / 2``, are
+    shared between instances and must not be modified in place.
+
+    Args:
+        program (ast.Program): The parsed OpenQASM 3 program.
+        basis_gates (optional, Iterable[str]): The gates to keep. If given, every other gate
+            is decomposed, and a gate with no rule raises an error. If None, every gate with
+            a decomposition rule is decomposed.
+
+    Returns:
+        ast.Program: The decomposed program.
+
+    Raises:
+        QasmDecompositionError: If a gate outside the basis cannot be decomposed.
+    """
+    basis = frozenset(basis_gates) if basis_gates is not None else None
+    defined_gates = {
+        statement.name.name
+        for statement in program.statements
+        if isinstance(statement, ast.QuantumGateDefinition)
+    }
+    return _Decomposer(basis, defined_gates).visit(program)
 
 
-def decompose(qasm: str) -> str:
+def decompose(qasm: str, basis_gates: Optional[Iterable[str]] = None) -> str:
     """
     Decompose an OpenQASM 3 program to an equivalent program
     using basis gates from the following set:
@@ -209,17 +385,22 @@ def decompose(qasm: str) -> str:
 
     Args:
         qasm (str): The original OpenQASM 3 program as a string.
+        basis_gates (optional, Iterable[str]): The gates to decompose to, such as
+            ``DEFAULT_BASIS_GATES``. Defaults to decomposing every gate that has a
+            decomposition rule.
 
     Returns:
         str: The decomposed OpenQASM 3 program.
 
     Raises:
-        ValueError: if the decomposition is not possible
+        QasmDecompositionError: if the decomposition is not possible
     """
     program = parse(qasm)
 
     try:
-        converted_program = _decompose(program)
+        converted_program = decompose_program(program, basis_gates)
+    except QasmDecompositionError:
+        raise
     except Exception as err:  # pylint: disable=broad-exception-caught
         raise QasmDecompositionError from err
 
@@ -0,0 +1,263 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module defining an evaluator for constant OpenQASM 3 arithmetic expressions,
+given either as program text or as openqasm3 AST nodes.
+
+"""
+import math
+import operator
+from functools import lru_cache
+from typing import Callable, Mapping, Optional, Union
+
+from openqasm3 import ast
+
+from qbraid.passes.lexer import TokenType, is_significant, token_type, tokenize
+
+CONSTANTS: dict[str, float] = {
+    "pi": math.pi,
+    "π": math.pi,
+    "tau": math.tau,
+    "τ": math.tau,
+    "euler": math.e,
+    "ℇ": math.e,
+}
+
+FUNCTIONS: dict[str, Callable[..., float]] = {
+    "arccos": math.acos,
+    "arcsin": math.asin,
+    "arctan": math.atan,
+    "ceiling": math.ceil,
+    "cos": math.cos,
+    "exp": math.exp,
+    "floor": math.floor,
+    "log": math.log,
+    "mod": math.fmod,
+    "sin": math.sin,
+    "sqrt": math.sqrt,
+    "tan": math.tan,
+}
+
+_BINARY_OPERATORS: dict[str, Callable[[float, float], float]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": math.fmod,
+    "**": operator.pow,
+}
+
+_AST_BINARY_OPERATORS = {
+    ast.BinaryOperator[symbol]: function for symbol, function in _BINARY_OPERATORS.items()
+}
+
+_EXPRESSION_TOKENS = frozenset({*_BINARY_OPERATORS, "(", ")", ","})
+
+
+def is_expression_token(token: str) -> bool:
+    """Return True if a significant token may appear in a constant OpenQASM 3 expression."""
+    return (
+        token in _EXPRESSION_TOKENS
+        or token in CONSTANTS
+        or token in FUNCTIONS
+        or token_type(token) == TokenType.NUMBER
+    )
+
+
+CompiledExpression = Callable[[Mapping[str, float]], float]
+
+
+def _as_function(value: Union[float, CompiledExpression]) -> CompiledExpression:
+    """Return a compiled expression for a constant or compiled subexpression."""
+    return value if callable(value) else lambda _: value
+
+
+def _apply(
+    function: Callable[..., float], *operands: Union[float, CompiledExpression]
+) -> Union[float, CompiledExpression]:
+    """Apply a function to compiled operands, folding it if every operand is constant."""
+    if not any(callable(operand) for operand in operands):
+        return function(*operands)
+    if len(operands) == 1:
+        (operand,) = operands
+        return lambda variables: function(operand(variables))
+    if len(operands) == 2:
+        lhs, rhs = operands
+        if not callable(lhs):
+            return lambda variables: function(lhs, rhs(variables))
+        if not callable(rhs):
+            return lambda variables: function(lhs(variables), rhs)
+        return lambda variables: function(lhs(variables), rhs(variables))
+    compiled = [_as_function(operand) for operand in operands]
+    return lambda variables: function(*(operand(variables) for operand in compiled))
+
+
+class _TokenCompiler:
+    """Recursive-descent compiler over the significant tokens of an expression.
+
+    Subexpressions are compiled to constants where possible, and otherwise to functions of
+    the values of the variables. ``**`` denotes exponentiation, and so does ``^`` if
+    ``caret_power`` is True, as in OpenQASM 2. In OpenQASM 3, ``^`` is bitwise XOR, which is
+    not supported.
+    """
+
+    def __init__(
+        self, tokens: tuple[str, ...], variables: frozenset[str], caret_power: bool = False
+    ):
+        self.tokens = tokens
+        self.variables = variables
+        self.power_operators = ("**", "^") if caret_power else ("**",)
+        self.position = 0
+
+    def compile(self) -> Union[float, CompiledExpression]:
+        """Compile the expression, raising ValueError if it is malformed."""
+        value = self._sum()
+        if self.position != len(self.tokens):
+            raise ValueError(f"Unexpected token '{self.tokens[self.position]}' in expression.")
+        return value
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _take(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise ValueError("Unexpected end of expression.")
+        self.position += 1
+        return token
+
+    def _expect(self, token: str) -> None:
+        if self._take() != token:
+            raise ValueError(f"Expected '{token}' in expression.")
+
+    def _sum(self):
+        value = self._product()
+        while self._peek() in ("+", "-"):
+            value = _apply(_BINARY_OPERATORS[self._take()], value, self._product())
+        return value
+
+    def _product(self):
+        value = self._unary()
+        while self._peek() in ("*", "/", "%"):
+            value = _apply(_BINARY_OPERATORS[self._take()], value, self._unary())
+        return value
+
+    def _unary(self):
+        if self._peek() in ("+", "-"):
+            return self._unary() if self._take() == "+" else _apply(operator.neg, self._unary())
+        value = self._atom()
+        if self._peek() in self.power_operators:
+            self._take()
+            return _apply(operator.pow, value, self._unary())
+        return value
+
+    def _atom(self):
+        token = self._take()
+        if token == "(":
+            value = self._sum()
+            self._expect(")")
+            return value
+        if token in self.variables:
+            return operator.itemgetter(token)
+        if token in CONSTANTS:
+            return CONSTANTS[token]
+        if token in FUNCTIONS:
+            self._expect("(")
+            arguments = [self._sum()]
+            while self._peek() == ",":
+                self._take()
+                arguments.append(self._sum())
+            self._expect(")")
+            return _apply(lambda *args: float(FUNCTIONS[token](*args)), *arguments)
+        if token_type(token) == TokenType.NUMBER:
+            return float(token.replace("_", ""))
+        raise ValueError(f"Unsupported token '{token}' in expression.")
+
+
+@lru_cache(maxsize=4096)
+def compile_tokens(
+    tokens: tuple[str, ...], variables: frozenset[str] = frozenset(), caret_power: bool = False
+) -> CompiledExpression:
+    """Compile an expression, given as a tuple of significant tokens, into a function that
+    maps the values of its variables to the value of the expression.
+
+    Constant subexpressions are evaluated once, when the expression is compiled. Set
+    ``caret_power`` to True to read ``^`` as exponentiation, as in OpenQASM 2.
+
+    Raises:
+        ValueError: If the tokens do not form an expression over the given variables.
+        ZeroDivisionError: If a constant subexpression divides by zero.
+    """
+    return _as_function(_TokenCompiler(tokens, variables, caret_power).compile())
+
+
+@lru_cache(maxsize=4096)
+def evaluate_tokens(tokens: tuple[str, ...], caret_power: bool = False) -> float:
+    """Evaluate a constant expression given as a tuple of significant tokens.
+
+    Results are cached, so that repeated expressions, such as the same rotation angle
+    appearing many times in a program, are only evaluated once. Set ``caret_power`` to True
+    to read ``^`` as exponentiation, as in OpenQASM 2.
+
+    Raises:
+        ValueError: If the tokens do not form a constant expression.
+        ZeroDivisionError: If the expression divides by zero.
+    """
+    value = _TokenCompiler(tokens, frozenset(), caret_power).compile()
+    return float(value)
+
+
+def _evaluate_node(expression: ast.Expression) -> float:
+    """Evaluate a constant expression given as an openqasm3 AST node."""
+    if isinstance(expression, (ast.IntegerLiteral, ast.FloatLiteral)):
+        return expression.value
+
+    if isinstance(expression, ast.Identifier) and expression.name in CONSTANTS:
+        return CONSTANTS[expression.name]
+
+    if isinstance(expression, ast.UnaryExpression) and expression.op == ast.UnaryOperator["-"]:
+        return -_evaluate_node(expression.expression)
+
+    if isinstance(expression, ast.BinaryExpression) and expression.op in _AST_BINARY_OPERATORS:
+        lhs = _evaluate_node(expression.lhs)
+        rhs = _evaluate_node(expression.rhs)
+        return _AST_BINARY_OPERATORS[expression.op](lhs, rhs)
+
+    if isinstance(expression, ast.FunctionCall) and expression.name.name in FUNCTIONS:
+        arguments = [_evaluate_node(argument) for argument in expression.arguments]
+        return float(FUNCTIONS[expression.name.name](*arguments))
+
+    raise ValueError(f"Unsupported expression: {type(expression).__name__}")
+
+
+def evaluate_expression(expression: Union[str, ast.Expression]) -> float:
+    """Evaluate a constant OpenQASM 3 arithmetic expression.
+
+    Supports integer and float literals, the constants ``pi``, ``tau`` and ``euler``, the
+    arithmetic operators ``+``, ``-``, ``*``, ``/``, ``%`` and ``**``, unary minus, and calls
+    to the built-in math functions such as ``sin`` or ``sqrt``. No Python code is evaluated.
+
+    Args:
+        expression (Union[str, openqasm3.ast.Expression]): The expression, either as text,
+            e.g. ``"3 * pi / 4"``, or as an openqasm3 AST expression node.
+
+    Returns:
+        float: The value of the expression.
+
+    Raises:
+        ValueError: If the expression is not a supported constant expression.
+    """
+    try:
+        if isinstance(expression, str):
+            return evaluate_tokens(tuple(filter(is_significant, tokenize(expression))))
+        return float(_evaluate_node(expression))
+    except (ZeroDivisionError, OverflowError, TypeError) as err:
+        raise ValueError(f"Could not evaluate expression {expression!r}: {err}") from err
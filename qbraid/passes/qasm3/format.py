@@ -16,6 +16,8 @@ in the way OpenQASM 3 strings are formatted.
 
 import re
 
+from qbraid.passes.lexer import is_identifier, next_significant, tokenize
+
 
 def _remove_empty_lines(input_string: str) -> str:
     """Removes all empty lines from the provided string."""
@@ -23,54 +25,88 @@ def _remove_empty_lines(input_string: str) -> str:
 
 
 def _remove_double_empty_lines(qasm: str) -> str:
-    """Replace double empty lines with single lines from a QASM string."""
-    return re.sub(r"\n\n\n", "\n\n", qasm)
-
-
-def _remove_gate_definition(qasm: str, gate_name: str) -> str:
-    """Remove a gate definition from a QASM string."""
-    lines = iter(qasm.split("\n"))
-    new_qasm = ""
-
-    for line in lines:
-        if re.search(r"gate\s+(\w+)", line) is not None:
-            # extract the gate name
-            current_gate_name = re.search(r"gate\s+(\w+)", line).group(1)
-            # remove lines from start curly brace to end curly brace
-            if current_gate_name == gate_name:
-                while "{" not in line:
-                    line = next(lines)
-                while "}" not in line:
-                    line = next(lines)
-            else:
-                new_qasm += line + "\n"
-        else:
-            new_qasm += line + "\n"
-
-    new_qasm = _remove_double_empty_lines(new_qasm)
-
-    return new_qasm.strip()
+    """Replace runs of empty lines with a single empty line in a QASM string."""
+    return re.sub(r"\n{3,}", "\n\n", qasm)
+
+
+def _gate_definitions(tokens: list[str]) -> list[tuple[str, int, int, set[str]]]:
+    """Return the name, token span and referenced identifiers of each gate definition."""
+    definitions = []
+    index = 0
+    while True:
+        try:
+            start = tokens.index("gate", index)
+            name_index = next_significant(tokens, start)
+            body_start = tokens.index("{", start)
+        except ValueError:
+            break
+        if name_index is None:
+            break
+        depth, end = 0, body_start
+        for end in range(body_start, len(tokens)):
+            if tokens[end] == "{":
+                depth += 1
+            elif tokens[end] == "}":
+                depth -= 1
+                if depth == 0:
+                    break
+        references = {token for token in tokens[body_start:end] if is_identifier(token)}
+        definitions.append((tokens[name_index], start, end, references))
+        index = end + 1
+    return definitions
 
 
 def remove_unused_gates(qasm: str) -> str:
-    """Remove unused gate definitions from a QASM string."""
-    lines = iter(qasm.split("\n"))
-    all_gates = {}
-
-    for line in lines:
-        if re.search(r"^\s*gate\s+(\w+)", line) is not None:
-            gate_name = re.search(r"^\s*gate\s+(\w+)", line).group(1)
-            all_gates[gate_name] = -1
-        for gate in all_gates:
-            if re.search(r"\b" + re.escape(gate) + r"\b", line):
-                all_gates[gate] += 1
-
-    new_qasm = qasm
-    unused_gates = [gate for gate, count in all_gates.items() if count == 0]
-    for gate in unused_gates:
-        new_qasm = _remove_gate_definition(new_qasm, gate)
-
-    if len(unused_gates) > 0:
-        return remove_unused_gates(new_qasm)
-
-    return new_qasm.strip()
+    """Remove unused gate definitions from a QASM string.
+
+    Gate definitions form a dependency graph, in which a definition depends on the gates
+    referenced in its body. A definition is kept only if it is reachable from the
+    statements outside of gate definitions, so that definitions which are used only by
+    other unused definitions are removed as well. All unused definitions are removed in a
+    single rewrite of the program.
+    """
+    tokens = tokenize(qasm)
+    definitions = _gate_definitions(tokens)
+    if not definitions:
+        return qasm.strip()
+
+    graph: dict[str, set[str]] = {}
+    used: set[str] = set()
+    position = 0
+    for name, start, end, references in definitions:
+        graph.setdefault(name, set()).update(references - {name})
+        used.update(token for token in tokens[position:start] if is_identifier(token))
+        position = end + 1
+    used.update(token for token in tokens[position:] if is_identifier(token))
+
+    pending = [name for name in used if name in graph]
+    reachable = set(pending)
+    while pending:
+        for reference in graph[pending.pop()]:
+            if reference in graph and reference not in reachable:
+                reachable.add(reference)
+                pending.append(reference)
+
+    unused = [(start, end) for name, start, end, _ in definitions if name not in reachable]
+    if not unused:
+        return qasm.strip()
+
+    offsets = [0]
+    for token in tokens:
+        offsets.append(offsets[-1] + len(token))
+
+    pieces = []
+    position = 0
+    for start, end in unused:
+        begin, finish = offsets[start], offsets[end + 1]
+        line_start = qasm.rfind("\n", 0, begin) + 1
+        if not qasm[line_start:begin].strip():
+            begin = line_start
+        line_end = qasm.find("\n", finish)
+        if line_end != -1 and not qasm[finish:line_end].strip():
+            finish = line_end + 1
+        pieces.append(qasm[position:begin])
+        position = finish
+    pieces.append(qasm[position:])
+
+    return _remove_double_empty_lines("".join(pieces)).strip()
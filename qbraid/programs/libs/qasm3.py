@@ -13,25 +13,144 @@ Module defining OpenQasm3Program Class
 
 """
 
+import copy
 import re
-from typing import Optional
+from typing import Optional, Union
 
 import numpy as np
+from openqasm3 import dumps
 from openqasm3.ast import (
+    BinaryExpression,
+    BinaryOperator,
     BitType,
+    BranchingStatement,
     ClassicalDeclaration,
+    DiscreteSet,
+    Identifier,
+    IndexedIdentifier,
+    IndexExpression,
+    IntegerLiteral,
+    Program,
     QuantumBarrier,
     QuantumGate,
     QuantumMeasurement,
     QuantumMeasurementStatement,
+    QuantumReset,
     QubitDeclaration,
+    RangeDefinition,
+    Statement,
+    SubroutineDefinition,
 )
 from openqasm3.parser import parse
+from openqasm3.visitor import QASMTransformer, QASMVisitor
 
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.program import QbraidProgram
 
 
+class _IdentifierCollector(QASMVisitor[None]):
+    """Collects the names of all identifiers in a program."""
+
+    def __init__(self):
+        self.names: set[str] = set()
+
+    def visit_Identifier(self, node: Identifier) -> None:
+        """Record the name of an identifier."""
+        self.names.add(node.name)
+
+
+class _ResetReplacer(QASMTransformer[None]):
+    """Replaces each reset with a measurement into an ancilla bit, followed by an X gate
+    conditioned on the measured bit. Resets of whole registers and of slices with literal
+    indices are expanded to one measurement per qubit. Resets in subroutines are left
+    unchanged, since a subroutine cannot write to the global ancilla register."""
+
+    def __init__(self, register_sizes: dict[str, Optional[int]], ancilla: str):
+        self.register_sizes = register_sizes
+        self.ancilla = ancilla
+        self.num_ancillas = 0
+
+    def _qubits(
+        self, operand: Union[Identifier, IndexedIdentifier]
+    ) -> list[Union[Identifier, IndexedIdentifier]]:
+        """Return the individual qubits of a reset operand."""
+        if isinstance(operand, Identifier):
+            size = self.register_sizes.get(operand.name)
+            if size is None:
+                return [operand]
+            return [_indexed(operand.name, index) for index in range(size)]
+
+        if len(operand.indices) != 1:
+            return [operand]
+
+        index = operand.indices[0]
+        if isinstance(index, list):
+            if len(index) != 1:
+                return [operand]
+            index = index[0]
+        if isinstance(index, DiscreteSet) and all(
+            isinstance(value, IntegerLiteral) for value in index.values
+        ):
+            return [_indexed(operand.name.name, value.value) for value in index.values]
+
+        if isinstance(index, RangeDefinition):
+            size = self.register_sizes.get(operand.name.name)
+            if index.end is None and size is None:
+                return [operand]
+            bounds = (index.start, index.end, index.step)
+            if all(bound is None or isinstance(bound, IntegerLiteral) for bound in bounds):
+                start = 0 if index.start is None else index.start.value
+                end = size - 1 if index.end is None else index.end.value
+                step = 1 if index.step is None else index.step.value
+                return [_indexed(operand.name.name, i) for i in range(start, end + 1, step)]
+
+        return [operand]
+
+    def visit_SubroutineDefinition(self, node: SubroutineDefinition) -> SubroutineDefinition:
+        """Return a subroutine definition unchanged, with any resets in its body."""
+        return node
+
+    def visit_QuantumReset(self, node: QuantumReset) -> list[Statement]:
+        """Return the measurements and conditioned X gates that replace a reset."""
+        qubits = self._qubits(node.qubits)
+        self.num_ancillas = max(self.num_ancillas, len(qubits))
+
+        statements: list[Statement] = []
+        for bit_index, qubit in enumerate(qubits):
+            statements.append(
+                QuantumMeasurementStatement(
+                    measure=QuantumMeasurement(qubit=qubit),
+                    target=_indexed(self.ancilla, bit_index),
+                )
+            )
+            statements.append(
+                BranchingStatement(
+                    condition=BinaryExpression(
+                        op=BinaryOperator["=="],
+                        lhs=IndexExpression(
+                            collection=Identifier(self.ancilla), index=[IntegerLiteral(bit_index)]
+                        ),
+                        rhs=IntegerLiteral(1),
+                    ),
+                    if_block=[
+                        QuantumGate(
+                            modifiers=[],
+                            name=Identifier("x"),
+                            arguments=[],
+                            qubits=[copy.deepcopy(qubit)],
+                        )
+                    ],
+                    else_block=[],
+                )
+            )
+        return statements
+
+
+def _indexed(name: str, index: int) -> IndexedIdentifier:
+    """Return the identifier of one element of a register."""
+    return IndexedIdentifier(name=Identifier(name), indices=[[IntegerLiteral(index)]])
+
+
 class OpenQasm3Program(QbraidProgram):
     """Wrapper class for OpenQASM 3 strings."""
 
@@ -389,49 +508,54 @@ class OpenQasm3Program(QbraidProgram):
         return self.program
 
     def replace_reset_with_ops(self) -> None:
-        """This function finds all the reset operations in QASM string,
-        and replaces them with measurement and conditional X gate operations.
-
-        TODO: Does not account for bits named with identifiers or than 'c'
+        """This function finds all the reset operations in the program, and replaces each
+        reset qubit with a measurement and a conditional X gate operation.
+
+        Measurements are made into a new ancilla bit register, which is declared with a name
+        that does not clash with any identifier in the program. A reset of a whole register is
+        replaced with one measurement per qubit. Bits of the ancilla register are reused
+        across resets, so its size is the largest number of qubits reset by one statement.
+        Resets in subroutine definitions are left unchanged, since OpenQASM 3 subroutines
+        cannot refer to global classical variables.
+
+        The program is rewritten from its parsed form with :func:`openqasm3.dumps`, so
+        comments are dropped and the program is reformatted.
         """
-        qasm_string = self.program
-        lines = qasm_string.split("\n")
-        transformed_lines = []
-        classical_bit_counter = 0
-
-        for line in lines:
-            if line.startswith("reset"):
-                # Extract the qubit name(s) being reset
-                qubit_name = line.split(" ")[1].strip(";")
-
-                # Check if the reset is for multiple qubits
-                if "[" in qubit_name and "]" in qubit_name:
-                    # For array-type qubits, handle them individually
-                    base_name = qubit_name.split("[")[0]
-                    indices = qubit_name[qubit_name.find("[") + 1 : qubit_name.find("]")].split(",")
-                    for index in indices:
-                        # Create new measurement operation
-                        transformed_lines.append(
-                            f"measure {base_name}[{index}] -> c{classical_bit_counter};"
-                        )
-                        # Create new conditional operation
-                        transformed_lines.append(
-                            f"if (c{classical_bit_counter} == 1) x {base_name}[{index}];"
-                        )
-                        # Increment the classical bit counter
-                        classical_bit_counter += 1
-                else:
-                    # For single qubits, just replace directly
-                    transformed_lines.append(f"measure {qubit_name} -> c{classical_bit_counter};")
-                    transformed_lines.append(f"if (c{classical_bit_counter} == 1) x {qubit_name};")
-                    classical_bit_counter += 1
-            else:
-                transformed_lines.append(line)
-
-        transformed_qasm_string = "\n".join(transformed_lines)
+        program: Program = parse(self.program)
+
+        collector = _IdentifierCollector()
+        collector.visit(program)
+        ancilla, suffix = "reset_anc", 0
+        while ancilla in collector.names:
+            suffix += 1
+            ancilla = f"reset_anc_{suffix}"
+
+        replacer = _ResetReplacer(dict(self.qubits), ancilla)
+        statements: list[Statement] = []
+        first_reset = None
+        for statement in program.statements:
+            replaced = replacer.visit(statement)
+            if first_reset is None and replacer.num_ancillas:
+                first_reset = len(statements)
+            statements.extend(replaced if isinstance(replaced, list) else [replaced])
+
+        if first_reset is None:
+            return
+
+        size = replacer.num_ancillas
+        statements.insert(
+            first_reset,
+            ClassicalDeclaration(
+                type=BitType(size=IntegerLiteral(size)),
+                identifier=Identifier(ancilla),
+                init_expression=None,
+            ),
+        )
+        program.statements = statements
 
-        self._program = transformed_qasm_string
-        self._parse_qasm()
+        self._program = dumps(program)
+        self._clbits = [*self._clbits, (ancilla, size)]
+        self._num_clbits += size
 
     def reverse_qubit_order(self) -> None:
         """Reverse the order of the qubits in the circuit."""
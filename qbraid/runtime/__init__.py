@@ -34,6 +34,7 @@ Functions
    :toctree: ../stubs/
 
 	display_jobs_from_data
+	load_result
 
 Classes
 --------
@@ -48,6 +49,9 @@ Classes
 	QuantumProvider
     QuantumJobResult
 	GateModelJobResult
+	PackedMeasurements
+	BatchResult
+	ResultArchive
 
 Exceptions
 ------------
@@ -56,6 +60,7 @@ Exceptions
    :toctree: ../stubs/
 
 	JobStateError
+	JobSubmissionError
 	ProgramValidationError
 	QbraidRuntimeError
 	ResourceNotFoundError
@@ -66,11 +71,13 @@ from qbraid_core import Session
 
 from . import native
 from ._display import display_jobs_from_data
+from .archive import ResultArchive, load_result
 from .device import QuantumDevice
 from .enums import DeviceActionType, DeviceStatus, DeviceType, JobStatus
 from .exceptions import (
     DeviceProgramTypeMismatchError,
     JobStateError,
+    JobSubmissionError,
     ProgramValidationError,
     QbraidRuntimeError,
     ResourceNotFoundError,
@@ -79,7 +86,7 @@ from .job import QuantumJob
 from .native import *
 from .profile import TargetProfile
 from .provider import QuantumProvider
-from .result import GateModelJobResult, QuantumJobResult
+from .result import BatchResult, GateModelJobResult, PackedMeasurements, QuantumJobResult
 
 __all__ = [
     "Session",
@@ -89,7 +96,10 @@ __all__ = [
     "DeviceType",
     "JobStatus",
     "display_jobs_from_data",
+    "load_result",
+    "ResultArchive",
     "JobStateError",
+    "JobSubmissionError",
     "ProgramValidationError",
     "QbraidRuntimeError",
     "ResourceNotFoundError",
@@ -99,11 +109,13 @@ __all__ = [
     "QuantumProvider",
     "GateModelJobResult",
     "QuantumJobResult",
+    "PackedMeasurements",
+    "BatchResult",
 ]
 
 __all__.extend(native.__all__)
 
-_lazy_mods = ["braket", "ionq", "oqc", "qiskit"]
+_lazy_mods = ["braket", "ionq", "oqc", "qiskit", "testing"]
 
 
 def __getattr__(name):
@@ -0,0 +1,387 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module for archiving job results to NPZ, Arrow and Parquet, and loading them back.
+
+Shots are written in chunks of rows, so that only one chunk of encoded shots needs to be
+converted at a time. NPZ archives are loaded with their shots memory-mapped from disk, and
+Parquet archives with their shots read on access, one row group at a time.
+
+"""
+import json
+import struct
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Union
+
+import numpy as np
+from qbraid_core._import import LazyLoader
+
+if TYPE_CHECKING:
+    import pyarrow
+
+pa = LazyLoader("pa", globals(), "pyarrow")
+pq = LazyLoader("pq", globals(), "pyarrow.parquet")
+
+DEFAULT_CHUNK_SIZE = 65536
+
+ENCODING_BITS = "bits"
+ENCODING_STATES = "states"
+
+_METADATA_PREFIX = "qbraid."
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+
+@dataclass
+class ResultArchive:
+    """Job result data loaded from an archive.
+
+    Attributes:
+        shots (Union[np.ndarray, ParquetShots]): 2D ``uint8`` array with one row per shot. For
+            the ``"bits"`` encoding, rows hold bit-packed measurements; for the ``"states"``
+            encoding, rows hold one state code per site. May be a read-only memory map, or a
+            :class:`ParquetShots` that reads row groups on access.
+        num_bits (int): Number of measured bits (or sites) per shot.
+        encoding (str): Either ``"bits"`` or ``"states"``.
+        counts (dict[str, int]): Histogram of measured outcomes.
+        metadata (dict[str, Any]): Job metadata.
+    """
+
+    shots: Union[np.ndarray, "ParquetShots"]
+    num_bits: int
+    encoding: str = ENCODING_BITS
+    counts: dict[str, int] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def num_shots(self) -> int:
+        """Number of shots in the archive."""
+        return self.shots.shape[0]
+
+    def measurements(self, start: int = 0, stop: Union[int, None] = None) -> np.ndarray:
+        """Expand a range of shots into a 2D array with one column per bit or site.
+
+        Only the requested rows are read from disk and unpacked.
+        """
+        rows = self.shots[start:stop]
+        if self.encoding == ENCODING_BITS:
+            return np.unpackbits(rows, axis=1, count=self.num_bits)
+        return np.asarray(rows)
+
+
+def _iter_chunks(rows: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+    """Yields consecutive row chunks of an array."""
+    for start in range(0, rows.shape[0], chunk_size):
+        yield np.ascontiguousarray(rows[start : start + chunk_size], dtype=np.uint8)
+
+
+def _as_binary_rows(shots: np.ndarray) -> np.ndarray:
+    """Returns shots as a 2D ``uint8`` array with at least one byte per row."""
+    shots = np.asarray(shots, dtype=np.uint8)
+    if shots.shape[1] == 0:
+        return np.zeros((shots.shape[0], 1), dtype=np.uint8)
+    return shots
+
+
+def _counts_to_arrays(counts: dict[str, int]) -> tuple[np.ndarray, np.ndarray]:
+    """Converts a histogram to arrays of fixed-width byte-string keys and counts."""
+    width = max((len(key) for key in counts), default=1)
+    keys = np.array([key.encode("ascii") for key in counts], dtype=f"S{width}")
+    values = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    return keys, values
+
+
+def _write_npy_member(
+    archive: zipfile.ZipFile, name: str, array: np.ndarray, chunk_size: int
+) -> None:
+    """Writes an array to an uncompressed archive member in chunks of rows."""
+    header = {
+        "descr": np.lib.format.dtype_to_descr(array.dtype),
+        "fortran_order": False,
+        "shape": array.shape,
+    }
+    with archive.open(name, "w", force_zip64=True) as member:
+        np.lib.format.write_array_header_2_0(member, header)
+        if array.ndim == 0:
+            member.write(array.tobytes())
+            return
+        for start in range(0, array.shape[0], chunk_size):
+            member.write(np.ascontiguousarray(array[start : start + chunk_size]).tobytes())
+
+
+# pylint: disable-next=too-many-arguments
+def write_npz(
+    path: Union[str, Path],
+    shots: np.ndarray,
+    *,
+    num_bits: int,
+    encoding: str,
+    counts: dict[str, int],
+    metadata: dict[str, Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Writes result data to an uncompressed NPZ archive, streaming shots in chunks."""
+    keys, values = _counts_to_arrays(counts)
+    members = {
+        "shots.npy": np.asarray(shots, dtype=np.uint8),
+        "num_bits.npy": np.array(num_bits, dtype=np.int64),
+        "encoding.npy": np.array(encoding),
+        "outcomes.npy": keys,
+        "counts.npy": values,
+        "metadata.npy": np.array(json.dumps(metadata, default=str)),
+    }
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for name, array in members.items():
+            _write_npy_member(archive, name, array, chunk_size)
+
+
+def _memmap_member(path: Path, info: zipfile.ZipInfo) -> np.ndarray:
+    """Memory-maps an uncompressed ``.npy`` archive member."""
+    with open(path, "rb") as file:
+        file.seek(info.header_offset)
+        local_header = _LOCAL_HEADER.unpack(file.read(_LOCAL_HEADER.size))
+        name_length, extra_length = local_header[-2:]
+        data_offset = info.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+        file.seek(data_offset)
+        version = np.lib.format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+        array_offset = file.tell()
+
+    if fortran_order or dtype.hasobject:
+        raise ValueError(f"Archive member '{info.filename}' cannot be memory-mapped.")
+    if int(np.prod(shape)) == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=array_offset, shape=shape)
+
+
+def _load_npz(path: Path, mmap: bool) -> ResultArchive:
+    """Loads a result archive written by :func:`write_npz`."""
+    arrays = {}
+    shots_info = None
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            name = info.filename[: -len(".npy")]
+            if name == "shots" and mmap and info.compress_type == zipfile.ZIP_STORED:
+                shots_info = info
+                continue
+            with archive.open(info) as member:
+                arrays[name] = np.lib.format.read_array(member, allow_pickle=False)
+
+    if shots_info is not None:
+        arrays["shots"] = _memmap_member(path, shots_info)
+
+    counts = dict(
+        zip((key.decode("ascii") for key in arrays["outcomes"]), arrays["counts"].tolist())
+    )
+    return ResultArchive(
+        shots=arrays["shots"],
+        num_bits=int(arrays["num_bits"]),
+        encoding=str(arrays["encoding"]),
+        counts=counts,
+        metadata=json.loads(str(arrays["metadata"])),
+    )
+
+
+def _arrow_schema(
+    num_bits: int, encoding: str, counts: dict[str, int], metadata: dict[str, Any], width: int
+) -> "pyarrow.Schema":
+    """Returns the Arrow schema of an archived result."""
+    return pa.schema(
+        [pa.field("shot", pa.binary(width))],
+        metadata={
+            f"{_METADATA_PREFIX}num_bits": str(num_bits),
+            f"{_METADATA_PREFIX}encoding": encoding,
+            f"{_METADATA_PREFIX}counts": json.dumps(counts),
+            f"{_METADATA_PREFIX}metadata": json.dumps(metadata, default=str),
+        },
+    )
+
+
+def _arrow_batches(
+    shots: np.ndarray, schema: "pyarrow.Schema", chunk_size: int
+) -> Iterator["pyarrow.RecordBatch"]:
+    """Yields record batches of fixed-size binary shot rows."""
+    shot_type = schema.field("shot").type
+    for chunk in _iter_chunks(shots, chunk_size):
+        column = pa.FixedSizeBinaryArray.from_buffers(
+            shot_type, chunk.shape[0], [None, pa.py_buffer(chunk)]
+        )
+        yield pa.RecordBatch.from_arrays([column], schema=schema)
+
+
+# pylint: disable-next=too-many-arguments
+def to_arrow_table(
+    shots: np.ndarray,
+    *,
+    num_bits: int,
+    encoding: str,
+    counts: dict[str, int],
+    metadata: dict[str, Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> "pyarrow.Table":
+    """Builds an Arrow table with one fixed-size binary row per shot.
+
+    The bit width, encoding, counts and metadata are stored in the schema metadata.
+    """
+    shots = _as_binary_rows(shots)
+    schema = _arrow_schema(num_bits, encoding, counts, metadata, shots.shape[1])
+    return pa.Table.from_batches(list(_arrow_batches(shots, schema, chunk_size)), schema=schema)
+
+
+# pylint: disable-next=too-many-arguments
+def write_parquet(
+    path: Union[str, Path],
+    shots: np.ndarray,
+    *,
+    num_bits: int,
+    encoding: str,
+    counts: dict[str, int],
+    metadata: dict[str, Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Writes result data to a Parquet file, with one row group per chunk of shots."""
+    shots = _as_binary_rows(shots)
+    schema = _arrow_schema(num_bits, encoding, counts, metadata, shots.shape[1])
+    with pq.ParquetWriter(path, schema) as writer:
+        for batch in _arrow_batches(shots, schema, chunk_size):
+            writer.write_batch(batch)
+
+
+def _column_rows(column: "pyarrow.Array", width: int) -> np.ndarray:
+    """Returns a fixed-size binary Arrow array as a 2D ``uint8`` array, without copying."""
+    data = column.buffers()[1]
+    if data is None:
+        return np.zeros((0, width), dtype=np.uint8)
+    rows = np.frombuffer(
+        data, dtype=np.uint8, count=len(column) * width, offset=column.offset * width
+    )
+    return rows.reshape(len(column), width)
+
+
+class ParquetShots:
+    """Read-only 2D array of shot rows in a Parquet archive, read one row group at a time.
+
+    Indexing with an integer or a slice of rows reads and decodes only the row groups that
+    hold the requested rows, so that large archives never need to be fully resident in
+    memory. Converting to a NumPy array with :func:`numpy.asarray` reads every row group.
+
+    Args:
+        parquet_file (pyarrow.parquet.ParquetFile): Open Parquet file written by
+            :func:`write_parquet`.
+        num_columns (int): Number of leading bytes of each row to expose.
+    """
+
+    dtype = np.dtype(np.uint8)
+    ndim = 2
+
+    def __init__(self, parquet_file: "pyarrow.parquet.ParquetFile", num_columns: int):
+        self._file = parquet_file
+        self._width = parquet_file.schema_arrow.field("shot").type.byte_width
+        self._num_columns = num_columns
+        metadata = parquet_file.metadata
+        sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        self._offsets = np.concatenate(([0], np.cumsum(sizes, dtype=np.int64)))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(shape={self.shape})"
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Number of shots and number of columns per shot."""
+        return int(self._offsets[-1]), self._num_columns
+
+    def _row_group(self, index: int) -> np.ndarray:
+        """Reads and decodes the shot rows of a single row group."""
+        column = self._file.read_row_group(index, columns=["shot"]).column("shot")
+        chunks = [_column_rows(chunk, self._width) for chunk in column.chunks]
+        rows = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+        return rows[:, : self._num_columns]
+
+    def _rows(self, start: int, stop: int) -> np.ndarray:
+        """Reads the contiguous rows ``start:stop`` from the row groups that hold them."""
+        if start >= stop:
+            return np.zeros((0, self._num_columns), dtype=np.uint8)
+        first = int(np.searchsorted(self._offsets, start, side="right")) - 1
+        last = int(np.searchsorted(self._offsets, stop, side="left"))
+        rows = np.concatenate([self._row_group(index) for index in range(first, last)])
+        offset = int(self._offsets[first])
+        return rows[start - offset : stop - offset]
+
+    def __getitem__(self, index: Union[int, slice]) -> np.ndarray:
+        num_shots = len(self)
+        if isinstance(index, slice):
+            positions = range(*index.indices(num_shots))
+            if not positions:
+                return np.zeros((0, self._num_columns), dtype=np.uint8)
+            low, high = sorted((positions[0], positions[-1]))
+            rows = self._rows(low, high + 1)
+            return rows[positions[0] - low :: positions.step][: len(positions)]
+        if index < 0:
+            index += num_shots
+        if not 0 <= index < num_shots:
+            raise IndexError(f"Shot index out of range for {num_shots} shots.")
+        return self._rows(index, index + 1)[0]
+
+    # pylint: disable-next=unused-argument
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        rows = self._rows(0, len(self))
+        return rows if dtype is None else rows.astype(dtype, copy=False)
+
+
+def _load_parquet(path: Path, mmap: bool) -> ResultArchive:
+    """Loads a result archive written by :func:`write_parquet`."""
+    parquet_file = pq.ParquetFile(path, memory_map=mmap)
+    schema = parquet_file.schema_arrow
+    schema_metadata = {
+        key.decode(): value.decode() for key, value in (schema.metadata or {}).items()
+    }
+    num_bits = int(schema_metadata[f"{_METADATA_PREFIX}num_bits"])
+    encoding = schema_metadata[f"{_METADATA_PREFIX}encoding"]
+    width = schema.field("shot").type.byte_width
+    shots = ParquetShots(parquet_file, num_bits if encoding == ENCODING_STATES else width)
+    return ResultArchive(
+        shots=shots if mmap else np.asarray(shots),
+        num_bits=num_bits,
+        encoding=encoding,
+        counts=json.loads(schema_metadata[f"{_METADATA_PREFIX}counts"]),
+        metadata=json.loads(schema_metadata[f"{_METADATA_PREFIX}metadata"]),
+    )
+
+
+def load_result(path: Union[str, Path], mmap: bool = True) -> ResultArchive:
+    """Load a job result archived with ``to_npz`` or ``to_parquet``.
+
+    Args:
+        path (Union[str, Path]): Path to a ``.npz`` or ``.parquet`` file.
+        mmap (bool): If True, memory-map the shots of NPZ archives, and read the shots of
+            Parquet archives lazily, one row group at a time, instead of reading them into
+            memory. Defaults to True.
+
+    Returns:
+        ResultArchive: The archived shots, counts and metadata.
+
+    Raises:
+        ValueError: If the file extension is not supported.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".npz":
+        return _load_npz(path, mmap)
+    if suffix in (".parquet", ".pq"):
+        return _load_parquet(path, mmap)
+    raise ValueError(f"Unsupported result archive format '{suffix}'. Expected .npz or .parquet.")
@@ -27,6 +27,7 @@ Classes
    BraketQuantumTask
    BraketGateModelJobResult
    BraketAhsJobResult
+   AhsShotResults
 
 Functions
 -----------
@@ -40,7 +41,7 @@ Functions
 from .device import BraketDevice
 from .job import BraketQuantumTask
 from .provider import BraketProvider
-from .result import BraketAhsJobResult, BraketGateModelJobResult
+from .result import AhsShotResults, BraketAhsJobResult, BraketGateModelJobResult
 from .tracker import get_quantum_task_cost
 
 __all__ = [
@@ -49,5 +50,6 @@ __all__ = [
     "BraketQuantumTask",
     "BraketGateModelJobResult",
     "BraketAhsJobResult",
+    "AhsShotResults",
     "get_quantum_task_cost",
 ]
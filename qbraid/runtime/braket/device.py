@@ -42,10 +42,19 @@ class BraketDevice(QuantumDevice):
         self,
         profile: "qbraid.runtime.TargetProfile",
         session: "Optional[braket.aws.AwsSession]" = None,
+        device: "Optional[braket.aws.AwsDevice]" = None,
     ):
-        """Create a BraketDevice."""
+        """Create a BraketDevice.
+
+        Args:
+            profile (TargetProfile): The device profile.
+            session (Optional[AwsSession]): AWS session used to create the underlying device.
+            device (Optional[AwsDevice]): Pre-constructed device to wrap. If provided, no
+                AWS device is created from the profile's ARN, which allows substituting an
+                in-process device such as :class:`~qbraid.runtime.testing.braket.FakeAwsDevice`.
+        """
         super().__init__(profile=profile)
-        self._device = AwsDevice(arn=self.id, aws_session=session)
+        self._device = device or AwsDevice(arn=self.id, aws_session=session)
         self._provider_name = self.profile.get("provider_name")
 
     @property
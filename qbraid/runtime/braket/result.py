@@ -12,7 +12,9 @@
 Module defining BraketGateModelJobResult Class
 
 """
-from collections import Counter
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+from typing import Any, Optional, Union
 
 import numpy as np
 from braket.tasks.analog_hamiltonian_simulation_quantum_task_result import (
@@ -20,6 +22,7 @@ from braket.tasks.analog_hamiltonian_simulation_quantum_task_result import (
     ShotResult,
 )
 
+from qbraid.runtime.archive import ENCODING_STATES
 from qbraid.runtime.exceptions import QbraidRuntimeError
 from qbraid.runtime.result import GateModelJobResult, QuantumJobResult
 
@@ -31,43 +34,164 @@ class ResultDecodingError(QbraidRuntimeError):
 class BraketGateModelJobResult(GateModelJobResult):
     """Wrapper class for Amazon Braket result objects."""
 
-    def measurements(self):
+    def __init__(self, result: Optional[Any] = None):
+        super().__init__(result)
+        self._measurements: Optional[np.ndarray] = None
+        self._counts: Optional[Mapping[str, int]] = None
+
+    def measurements(self, view: bool = False) -> np.ndarray:
         """
         2d array - row is shot and column is qubit. Default is None.
         Only available when shots > 0. The qubits in `measurements` are
         the ones in `GateModelQuantumTaskResult.measured_qubits`.
 
+        The returned array is read-only; copy it to modify it.
+
+        Args:
+            view (bool): If True, return a column-reversed view of the Braket measurements,
+                without allocating a new array. Otherwise, return a C-contiguous array of the
+                reversed measurements, which is computed once and returned on subsequent
+                calls. Defaults to False.
+
         """
-        return np.flip(self._result.measurements, 1)
+        if view:
+            flipped = np.flip(self._result.measurements, 1)
+            flipped.flags.writeable = False
+            return flipped
+
+        if self._measurements is None:
+            self._measurements = np.ascontiguousarray(np.flip(self._result.measurements, 1))
+            self._measurements.flags.writeable = False
+        return self._measurements
+
+    def raw_counts(self, **kwargs) -> Mapping[str, int]:
+        """Returns the histogram data of the run, as a read-only mapping"""
+        if self._counts is None:
+            self._counts = MappingProxyType(
+                {
+                    _reverse_key(key): count
+                    for key, count in dict(self._result.measurement_counts).items()
+                }
+            )
+        return self._counts
+
+
+def _reverse_key(key: Union[str, Sequence[Any]]) -> str:
+    """Reverses a Braket measurement key into a qBraid bitstring."""
+    if isinstance(key, str):
+        return key[::-1]
+    return "".join(map(str, reversed(key)))
+
+
+class AhsShotResults(Sequence):
+    """Read-only sequence of AHS shot results, built lazily from the raw measurements.
+
+    A :class:`ShotResult` is only constructed when a shot is accessed, so wrapping a large
+    result costs no per-shot conversions until individual shots are needed.
+    """
+
+    def __init__(self, measurements: Sequence[Any]):
+        self._measurements = measurements
+
+    def __len__(self) -> int:
+        return len(self._measurements)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ShotResult, list[ShotResult]]:
+        if isinstance(index, slice):
+            return [_to_shot_result(measurement) for measurement in self._measurements[index]]
+        return _to_shot_result(self._measurements[index])
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(num_shots={len(self)})"
 
-    def raw_counts(self, **kwargs):
-        """Returns the histogram data of the run"""
-        braket_counts = dict(self._result.measurement_counts)
-        qbraid_counts = {}
-        for key in braket_counts:
-            str_key = "".join(reversed([str(i) for i in key]))
-            qbraid_counts[str_key] = braket_counts[key]
-        return qbraid_counts
+
+def _shot_fields(measurement: Any) -> tuple[str, Optional[Sequence[int]], Optional[Sequence[int]]]:
+    """Returns the status, pre-sequence and post-sequence of a raw or decoded AHS shot."""
+    if isinstance(measurement, ShotResult):
+        return measurement.status.value, measurement.pre_sequence, measurement.post_sequence
+    shot_result = measurement.shotResult
+    return measurement.shotMetadata.shotStatus, shot_result.preSequence, shot_result.postSequence
+
+
+def _to_shot_result(measurement: Any) -> ShotResult:
+    """Converts a raw AHS shot measurement to a :class:`ShotResult`."""
+    if isinstance(measurement, ShotResult):
+        return measurement
+    status, pre_sequence, post_sequence = _shot_fields(measurement)
+    pre_sequence = np.asarray(pre_sequence, dtype=int) if pre_sequence else None
+    post_sequence = np.asarray(post_sequence, dtype=int) if post_sequence else None
+    return ShotResult(AnalogHamiltonianSimulationShotStatus(status), pre_sequence, post_sequence)
 
 
 class BraketAhsJobResult(QuantumJobResult):
     """Result from an Analog Hamiltonian Simulation (AHS)."""
 
-    def measurements(self):
+    STATES = np.frombuffer(b"erg", dtype=np.uint8)
+
+    def __init__(self, result: Optional[Any] = None):
+        super().__init__(result)
+        self._state_arrays: Optional[list[np.ndarray]] = None
+
+    def measurements(self) -> list[ShotResult]:
         """Get the list of shot results from the AHS job."""
-        measurements = []
-        for measurement in self._result.measurements:
-            status = AnalogHamiltonianSimulationShotStatus(measurement.shotMetadata.shotStatus)
-            if measurement.shotResult.preSequence:
-                pre_sequence = np.asarray(measurement.shotResult.preSequence, dtype=int)
-            else:
-                pre_sequence = None
-            if measurement.shotResult.postSequence:
-                post_sequence = np.asarray(measurement.shotResult.postSequence, dtype=int)
-            else:
-                post_sequence = None
-            measurements.append(ShotResult(status, pre_sequence, post_sequence))
-        return measurements
+        return [_to_shot_result(measurement) for measurement in self._result.measurements]
+
+    def shot_results(self) -> AhsShotResults:
+        """Get a lazy sequence of shot results from the AHS job.
+
+        Unlike :meth:`measurements`, shot results are constructed only as they are accessed.
+        """
+        return AhsShotResults(self._result.measurements)
+
+    def state_arrays(self) -> list[np.ndarray]:
+        """
+        Decode the successful shots into arrays of atom states.
+
+        Each element of the returned list is a 2D ``uint8`` array with one row per successful
+        shot and one column per site, holding 0 for an empty site, 1 for the Rydberg state and
+        2 for the ground state. Shots are grouped into one array per number of sites, so a
+        result with a fixed register yields a single array.
+
+        Raises:
+            ResultDecodingError: If the measurements do not contain the required attributes,
+                or if a successful shot has pre- and post-sequences of different lengths.
+        """
+        if self._state_arrays is None:
+            success = AnalogHamiltonianSimulationShotStatus.SUCCESS.value
+            sequences: dict[int, tuple[list, list]] = {}
+            try:
+                for measurement in self._result.measurements:
+                    status, pre, post = _shot_fields(measurement)
+                    if status != success:
+                        continue
+                    if len(pre) != len(post):
+                        raise ResultDecodingError(
+                            f"Shot has a pre-sequence of length {len(pre)} but a "
+                            f"post-sequence of length {len(post)}."
+                        )
+                    pre_group, post_group = sequences.setdefault(len(pre), ([], []))
+                    pre_group.append(pre)
+                    post_group.append(post)
+            except (AttributeError, TypeError) as err:
+                raise ResultDecodingError from err
+
+            self._state_arrays = []
+            for pre_group, post_group in sequences.values():
+                pre = np.asarray(pre_group)
+                post = np.asarray(post_group)
+                states = np.where(pre == 0, 0, np.where(post == 0, 1, 2)).astype(np.uint8)
+                self._state_arrays.append(states)
+        return self._state_arrays
+
+    def _archive_shots(self) -> tuple[np.ndarray, int, str]:
+        state_arrays = self.state_arrays()
+        if len(state_arrays) > 1:
+            raise ValueError("Cannot export shots with differing numbers of sites.")
+        states = state_arrays[0] if state_arrays else np.zeros((0, 0), dtype=np.uint8)
+        return states, states.shape[1], ENCODING_STATES
+
+    def _archive_counts(self) -> dict[str, int]:
+        return self.get_counts() or {}
 
     def get_counts(self) -> dict[str, int]:
         """
@@ -86,21 +210,15 @@ class BraketAhsJobResult(QuantumJobResult):
             ValueError: If there is an error accessing required attributes within the result object.
 
         """
-        state_counts = Counter()
-        states = ["e", "r", "g"]
-        try:
-            for shot in self.measurements():
-                if shot.status.name == "SUCCESS":
-                    pre = shot.pre_sequence
-                    post = shot.post_sequence
-                    # converting presequence and postsequence measurements to state_idx
-                    state_idx = [
-                        0 if pre_i == 0 else 1 if post_i == 0 else 2
-                        for pre_i, post_i in zip(pre, post)
-                    ]
-                    state = "".join(states[s_idx] for s_idx in state_idx)
-                    state_counts.update([state])
-        except AttributeError as err:
-            raise ResultDecodingError from err
-
-        return None if not state_counts else dict(state_counts)
+        state_counts = {}
+        for states in self.state_arrays():
+            num_sites = states.shape[1]
+            if num_sites == 0:
+                state_counts[""] = states.shape[0]
+                continue
+            configurations, counts = np.unique(states, axis=0, return_counts=True)
+            labels = np.ascontiguousarray(self.STATES[configurations]).view(f"S{num_sites}")
+            for label, count in zip(labels.ravel(), counts.tolist()):
+                state_counts[label.decode("ascii")] = count
+
+        return None if not state_counts else state_counts
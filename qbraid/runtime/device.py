@@ -17,13 +17,19 @@ Module defining abstract QuantumDevice Class
 import logging
 import warnings
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 from qbraid.programs import ProgramSpec, get_program_type_alias, load_program
 from qbraid.transpiler import CircuitConversionError, ConversionGraph, ConversionScheme, transpile
 
 from .enums import DeviceStatus, DeviceType
-from .exceptions import ProgramValidationError, QbraidRuntimeError, ResourceNotFoundError
+from .exceptions import (
+    JobSubmissionError,
+    ProgramValidationError,
+    QbraidRuntimeError,
+    ResourceNotFoundError,
+)
 
 if TYPE_CHECKING:
     import qbraid.programs
@@ -211,6 +217,63 @@ class QuantumDevice(ABC):
 
         return run_input
 
+    @staticmethod
+    def _submit_batch(
+        submit_one: "Callable[[Any], qbraid.runtime.QuantumJob]",
+        run_input: list,
+        max_workers: Optional[int] = None,
+    ) -> "list[qbraid.runtime.QuantumJob]":
+        """Submit each item of a batch, preserving the input order.
+
+        Every input is submitted, even after an earlier one fails, so that one bad input does
+        not leave the rest of the batch unsubmitted. Failures are raised together once the
+        whole batch has been attempted.
+
+        Args:
+            submit_one (Callable): Submits a single run input and returns its job.
+            run_input (list): The run inputs to submit.
+            max_workers (optional, int): If greater than one, submit the inputs concurrently
+                with at most this many submissions in flight. Defaults to None, i.e. inputs
+                are submitted one at a time.
+
+        Returns:
+            list[QuantumJob]: The submitted jobs, in the same order as the run input.
+
+        Raises:
+            JobSubmissionError: If one or more inputs fail to submit. The jobs that were
+                created successfully are available on the exception. If a single input
+                failed, its exception is chained as the cause.
+        """
+        if not run_input:
+            return []
+
+        jobs: list = [None] * len(run_input)
+        errors: dict[int, Exception] = {}
+
+        def collect(index: int, submission: Callable[[], Any]) -> None:
+            try:
+                jobs[index] = submission()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                logger.error("Failed to submit job for run input at index %d: %s", index, err)
+                errors[index] = err
+
+        if not max_workers or max_workers <= 1:
+            for index, item in enumerate(run_input):
+                collect(index, lambda item=item: submit_one(item))
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(run_input))) as executor:
+                futures = {
+                    executor.submit(submit_one, item): index for index, item in enumerate(run_input)
+                }
+                for future in as_completed(futures):
+                    collect(futures[future], future.result)
+
+        if errors:
+            cause = next(iter(errors.values())) if len(errors) == 1 else None
+            raise JobSubmissionError(jobs, errors) from cause
+
+        return jobs
+
     @abstractmethod
     def submit(
         self, run_input: "list[qbraid.programs.QPROGRAM]", *args, **kwargs
@@ -23,6 +23,24 @@ class QbraidRuntimeError(QbraidError):
     """Base class for errors raised while submitting a quantum job."""
 
 
+class JobSubmissionError(QbraidRuntimeError):
+    """Exception raised when one or more jobs in a batch could not be submitted.
+
+    Attributes:
+        jobs (list): The submitted jobs, in input order, with ``None`` in place of each failure.
+        errors (dict[int, Exception]): The exception raised for each failed input, by index.
+    """
+
+    def __init__(self, jobs: list, errors: dict[int, Exception]):
+        self.jobs = jobs
+        self.errors = errors
+        message = (
+            f"Failed to submit {len(errors)} of {len(jobs)} jobs "
+            f"(run input indices: {sorted(errors)})."
+        )
+        super().__init__(message)
+
+
 class ResourceNotFoundError(QbraidError):
     """Exception raised when the desired resource could not be found."""
 
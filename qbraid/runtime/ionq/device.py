@@ -15,12 +15,12 @@ Module defining IonQ device class
 
 """
 import json
-import re
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, Optional, Union
 
 import openqasm3
 
-from qbraid.passes.qasm3.compat import convert_qasm_pi_to_decimal
+from qbraid.passes.qasm3.expression import evaluate_expression
 from qbraid.programs import load_program
 from qbraid.runtime.device import QuantumDevice
 from qbraid.runtime.enums import DeviceStatus
@@ -32,6 +32,11 @@ if TYPE_CHECKING:
     import qbraid.runtime.ionq.provider
 
 
+def _extract_rotation(statement: "openqasm3.ast.QuantumGate") -> float:
+    """Return the rotation angle of a single-parameter gate statement."""
+    return evaluate_expression(statement.arguments[0])
+
+
 class IonQDevice(QuantumDevice):
     """IonQ quantum device interface."""
 
@@ -87,12 +92,10 @@ class IonQDevice(QuantumDevice):
                     if name in ["x", "not", "y", "z", "h", "s", "si", "t", "ti", "v", "vi"]:
                         gate_data = {"gate": name, "target": qubit_values[0]}
                     elif name in ["rx", "ry", "rz"]:
-                        # convert "rz(3 * pi / 4) q[0];" to "3 * pi / 4"
-                        angle_str = re.findall(r"\((.+)\)", openqasm3.dumps(statement))[0]
                         gate_data = {
                             "gate": name,
                             "target": qubit_values[0],
-                            "rotation": float(convert_qasm_pi_to_decimal(angle_str)),
+                            "rotation": _extract_rotation(statement),
                         }
                     # OpenQASM 3 aliases:
                     elif name == "sdg":
@@ -139,23 +142,47 @@ class IonQDevice(QuantumDevice):
         gate_data = self.extract_gate_data(run_input)
         return {"qubits": num_qubits, "circuit": gate_data}
 
-    def submit(self, run_input: list[dict], *args, shots: int = 100, **kwargs) -> IonQJob:
-        """Submit a job to the IonQ device."""
-        is_single_input = not isinstance(run_input, list)
-        run_input = [run_input] if is_single_input else run_input
-        jobs = []
-        for input_data in run_input:
-            data = {
-                "target": self.id,
-                "shots": shots,
-                "input": input_data,
-                **kwargs,
-            }
-            serialized_data = json.dumps(data)
-            job_data = self.session.create_job(serialized_data)
-            job_id = job_data.get("id")
-            if not job_id:
-                raise ValueError("Job ID not found in the response")
-            qbraid_job = IonQJob(job_id=job_id, session=self.session, device=self, shots=shots)
-            jobs.append(qbraid_job)
-        return jobs[0] if is_single_input else jobs
+    def _create_job(self, input_data: dict, shots: int, **kwargs) -> IonQJob:
+        """Submit a single job to the IonQ device."""
+        data = {
+            "target": self.id,
+            "shots": shots,
+            "input": input_data,
+            **kwargs,
+        }
+        serialized_data = json.dumps(data, separators=(",", ":"))
+        job_data = self.session.create_job(serialized_data)
+        job_id = job_data.get("id")
+        if not job_id:
+            raise ValueError("Job ID not found in the response")
+        return IonQJob(job_id=job_id, session=self.session, device=self, shots=shots)
+
+    def submit(
+        self,
+        run_input: Union[dict, list[dict]],
+        *args,
+        shots: int = 100,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> Union[IonQJob, list[IonQJob]]:
+        """Submit a job to the IonQ device.
+
+        Args:
+            run_input (Union[dict, list[dict]]): IonQ circuit data, or a list of circuit data.
+            shots (int): The number of shots to run each job for. Defaults to 100.
+            max_workers (optional, int): If provided, submit a list of inputs concurrently using
+                at most this many requests in flight over the session. Defaults to None, i.e.
+                inputs are submitted one at a time.
+
+        Returns:
+            Union[IonQJob, list[IonQJob]]: The submitted job(s), in the same order as the input.
+
+        Raises:
+            JobSubmissionError: If one or more inputs in a batch fail to submit.
+        """
+        submit_one = partial(self._create_job, shots=shots, **kwargs)
+
+        if not isinstance(run_input, list):
+            return submit_one(run_input)
+
+        return self._submit_batch(submit_one, run_input, max_workers)
@@ -12,10 +12,15 @@
 Module defining IonQ session and provider classes
 
 """
-from typing import Any
+import threading
+import time
+from typing import Any, Optional
 
 import openqasm3
+from qbraid_core.retry import STATUS_FORCELIST
 from qbraid_core.sessions import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from qbraid.programs.spec import ProgramSpec
 from qbraid.runtime.enums import DeviceType
@@ -25,22 +30,105 @@ from qbraid.runtime.provider import QuantumProvider
 from .device import IonQDevice
 
 
+class IonQRetry(Retry):
+    """Retry policy for the IonQ API. Rate-limited (429) ``POST`` requests are retried, since
+    the request was rejected before a job was created. Other ``POST`` errors are not retried,
+    to avoid submitting duplicate jobs."""
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        """Indicate whether the request should be retried."""
+        if method.upper() == "POST" and status_code == 429:
+            return True
+
+        return super().is_retry(method, status_code, has_retry_after)
+
+
 class IonQSession(Session):
     """IonQ session class."""
 
-    def __init__(self, api_key: str):
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        retries_total: int = 5,
+        retries_connect: int = 3,
+        backoff_factor: float = 0.5,
+        pool_maxsize: int = 10,
+        cache_ttl: float = 10.0,
+    ):
+        """Create a new IonQ session.
+
+        Args:
+            api_key (str): IonQ API key.
+            retries_total (int): Number of total retries for each request. Defaults to 5.
+            retries_connect (int): Number of connect retries for each request. Defaults to 3.
+            backoff_factor (float): Backoff factor (seconds) between retry attempts, applied to
+                rate-limited (429) and server error (5xx) responses. Defaults to 0.5.
+            pool_maxsize (int): Maximum number of keep-alive connections to hold open to the
+                IonQ API. Defaults to 10.
+            cache_ttl (float): Number of seconds to cache the ``/backends`` response.
+                Set to 0 to disable caching. Defaults to 10.
+        """
+        self._pool_maxsize = pool_maxsize
         super().__init__(
             base_url="https://api.ionq.co/v0.3",
             headers={"Content-Type": "application/json"},
             auth_headers={"Authorization": f"apiKey {api_key}"},
+            retries_total=retries_total,
+            retries_connect=retries_connect,
+            backoff_factor=backoff_factor,
         )
         self.api_key = api_key
+        self.cache_ttl = cache_ttl
+        self._devices_cache: Optional[dict[str, dict[str, Any]]] = None
+        self._devices_cache_time = 0.0
+        self._devices_cache_lock = threading.Lock()
+
+    def _initialize_retry(
+        self, retries_total: int, retries_connect: int, backoff_factor: float
+    ) -> None:
+        """Mount a pooled adapter that retries with backoff on 429 and 5xx responses."""
+        retry = IonQRetry(
+            total=retries_total,
+            connect=retries_connect,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, *STATUS_FORCELIST),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_maxsize=self._pool_maxsize, max_retries=retry)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def clear_cache(self) -> None:
+        """Clear the cached ``/backends`` response."""
+        with self._devices_cache_lock:
+            self._devices_cache = None
+            self._devices_cache_time = 0.0
 
     def get_devices(self, **kwargs) -> dict[str, dict[str, Any]]:
-        """Get all IonQ devices."""
-        devices_list = self.get("/backends", **kwargs).json()
-        devices_dict = {device["backend"]: device for device in devices_list}
-        return devices_dict
+        """Get all IonQ devices, keyed by backend name.
+
+        Responses to unfiltered requests are cached for ``cache_ttl`` seconds. The request
+        is made without holding the cache lock, and a copy of the cached mapping is returned.
+        """
+        if kwargs:
+            devices_list = self.get("/backends", **kwargs).json()
+            return {device["backend"]: device for device in devices_list}
+
+        with self._devices_cache_lock:
+            devices, cached_at = self._devices_cache, self._devices_cache_time
+
+        if devices is None or time.monotonic() - cached_at >= self.cache_ttl:
+            fetched_at = time.monotonic()
+            devices_list = self.get("/backends").json()
+            devices = {device["backend"]: device for device in devices_list}
+            with self._devices_cache_lock:
+                if fetched_at >= self._devices_cache_time:
+                    self._devices_cache = devices
+                    self._devices_cache_time = fetched_at
+
+        return dict(devices)
 
     def get_device(self, device_id: str) -> dict[str, Any]:
         """Get a specific IonQ device."""
@@ -16,7 +16,11 @@ from typing import Any, Optional
 
 import numpy as np
 
-from qbraid.runtime.result import GateModelJobResult
+from qbraid.runtime.result import (
+    GateModelJobResult,
+    PackedMeasurements,
+    probabilities_to_counts,
+)
 
 
 class IonQJobResult(GateModelJobResult):
@@ -25,27 +29,57 @@ class IonQJobResult(GateModelJobResult):
     def __init__(self, result: dict[str, Any]):
         super().__init__(result)
         self._counts = None
-        self._measurements = None
+        self._measurements: Optional[PackedMeasurements] = None
 
-    def measurements(self) -> np.ndarray:
-        """Return the measurements as a 2D numpy array."""
+    def packed_measurements(self) -> PackedMeasurements:
+        """Return the measurements in bit-packed form."""
         if self._measurements is None:
-            counts = self.raw_counts()
-            if counts:
-                measurements = []
-                for state, count in counts.items():
-                    measurements.extend([list(map(int, state))] * count)
-                self._measurements = np.array(measurements, dtype=int)
+            self._measurements = PackedMeasurements.from_counts(self.raw_counts() or {})
         return self._measurements
 
+    def measurements(self) -> np.ndarray:
+        """Return the measurements as a 2D numpy array."""
+        packed = self.packed_measurements()
+        return None if packed.num_shots == 0 else packed.to_array()
+
+    def _num_qubits(self, states: list[int]) -> int:
+        """Return the bit width of the measured states."""
+        num_qubits = self._result.get("qubits")
+        if num_qubits:
+            return int(num_qubits)
+        return max((state.bit_length() for state in states), default=0) or 1
+
+    def _probabilities(self) -> tuple[list[str], np.ndarray]:
+        """Return the measured bitstrings and their probabilities."""
+        probs_int: Optional[dict] = self._result.get("probabilities")
+        if not probs_int:
+            return [], np.zeros(0)
+
+        states = [int(key) for key in probs_int]
+        width = self._num_qubits(states)
+        keys = [format(state, f"0{width}b") for state in states]
+        probs = np.fromiter(probs_int.values(), dtype=float, count=len(probs_int))
+        return keys, probs
+
+    def raw_probabilities(self) -> dict[str, float]:
+        """Return the measurement probabilities reported by IonQ, keyed by bitstring."""
+        keys, probs = self._probabilities()
+        return dict(zip(keys, probs.tolist()))
+
+    def measurement_probabilities(self) -> dict[str, float]:
+        """Return the sorted measurement probabilities, without materializing counts."""
+        return self.format_counts(self.raw_probabilities())
+
     def raw_counts(self, **kwargs) -> dict[str, int]:
-        """Return the raw counts of the run."""
+        """Return the raw counts of the run.
+
+        Counts are reconstructed from the reported probabilities with largest-remainder
+        rounding, so that they sum exactly to the number of shots.
+        """
         if self._counts is None:
             shots: Optional[int] = self._result.get("shots")
-            probs_int: Optional[dict] = self._result.get("probabilities")
-            if shots and probs_int:
-                probs_binary = {
-                    bin(int(key))[2:].zfill(2): value for key, value in probs_int.items()
-                }
-                self._counts = {state: int(prob * shots) for state, prob in probs_binary.items()}
+            keys, probs = self._probabilities()
+            if shots and keys:
+                counts = probabilities_to_counts(probs, shots)
+                self._counts = dict(zip(keys, counts.tolist()))
         return self._counts
@@ -14,6 +14,7 @@ Module defining QbraidDevice class
 """
 import json
 import logging
+from functools import partial
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from qbraid_core.services.quantum import QuantumClient
@@ -95,8 +96,29 @@ class QbraidDevice(QuantumDevice):
             The qbraid job ID associated with this job
 
         """
-        tags = tags or {}
+        return self._create_job(
+            json.dumps(tags or {}),
+            shots=shots,
+            openqasm=openqasm,
+            bitcode=bitcode,
+            num_qubits=num_qubits,
+            depth=depth,
+            **kwargs,
+        )
 
+    # pylint: disable-next=too-many-arguments
+    def _create_job(
+        self,
+        serialized_tags: str,
+        *,
+        shots: Optional[int] = None,
+        openqasm: Optional[str] = None,
+        bitcode: Optional[bytes] = None,
+        num_qubits: Optional[int] = None,
+        depth: Optional[int] = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Create new qBraid job, with its tags already serialized to JSON."""
         init_data = {
             "bitcode": bitcode,
             "qbraidDeviceId": self.id,
@@ -104,7 +126,7 @@ class QbraidDevice(QuantumDevice):
             "openQasm": openqasm,
             "circuitNumQubits": num_qubits,
             "circuitDepth": depth,
-            "tags": json.dumps(tags),
+            "tags": serialized_tags,
             **kwargs,
         }
 
@@ -113,12 +135,13 @@ class QbraidDevice(QuantumDevice):
     def _create_and_return_job(
         self,
         module: "pyqir.Module",
+        serialized_tags: str,
         entrypoint: Optional[str] = None,
         shots: Optional[int] = None,
         **kwargs,
     ):
-        job_data = self.create_job(
-            bitcode=module.bitcode, entrypoint=entrypoint, shots=shots, **kwargs
+        job_data = self._create_job(
+            serialized_tags, bitcode=module.bitcode, entrypoint=entrypoint, shots=shots, **kwargs
         )
         job_id = job_data.pop("qbraidJobId")
         return QbraidJob(job_id, device=self, client=self.client, **job_data)
@@ -129,6 +152,7 @@ class QbraidDevice(QuantumDevice):
         *args,
         entrypoint: Optional[str] = None,
         shots: Optional[int] = None,
+        max_workers: Optional[int] = None,
         **kwargs,
     ) -> "Union[qbraid.runtime.QbraidJob, list[qbraid.runtime.QbraidJob]]":
         """Runs the qir-runner executable with the given QIR file and shots.
@@ -138,18 +162,31 @@ class QbraidDevice(QuantumDevice):
             entrypoint (optional, str): Name of the entrypoint function to execute in the QIR file.
             shots (optional, int): The number of times to repeat the execution of the chosen entry
                                    point in the program. Defaults to 1.
+            max_workers (optional, int): If provided, submit a list of modules concurrently using
+                at most this many requests in flight over the client session. Defaults to None,
+                i.e. modules are submitted one at a time.
 
         Returns:
-            Union[QbraidJob, list[QbraidJob]: The job object(s) representing the submitted job(s).
+            Union[QbraidJob, list[QbraidJob]: The job object(s) representing the submitted job(s),
+                in the same order as the run input.
+
+        Raises:
+            JobSubmissionError: If one or more modules in a batch fail to submit. The jobs
+                that were created successfully are available on the exception.
         """
         is_single_input = not isinstance(run_input, list)
-        run_input = [run_input] if is_single_input else run_input
-        jobs = [
-            self._create_and_return_job(module, entrypoint, shots, **kwargs) for module in run_input
-        ]
+        submit_one = partial(
+            self._create_and_return_job,
+            serialized_tags=json.dumps(kwargs.pop("tags", None) or {}),
+            entrypoint=entrypoint,
+            shots=shots,
+            **kwargs,
+        )
+
         if is_single_input:
-            return jobs[0]
-        return jobs
+            return submit_one(run_input)
+
+        return self._submit_batch(submit_one, run_input, max_workers)
 
     def try_extracting_info(self, func, error_message):
         """Try to extract information from a function/attribute,
@@ -160,10 +197,75 @@ class QbraidDevice(QuantumDevice):
             logger.info("%s: %s. Field will be omitted in job metadata.", error_message, str(err))
             return None
 
+    def _extract_openqasm(
+        self,
+        program: "qbraid.programs.QPROGRAM",
+        program_spec: "qbraid.programs.ProgramSpec",
+        transpiled_program: "qbraid.programs.QPROGRAM",
+    ) -> Optional[str]:
+        """Return an OpenQASM 3 representation of the program, reusing the source program or
+        the target conversion when either one is already OpenQASM, so that the metadata does not
+        require a second conversion pass through the transpiler."""
+        if program_spec.alias == "qasm3":
+            return program
+
+        target_alias = self._target_spec.alias if self._target_spec else program_spec.alias
+
+        if target_alias == "qasm3":
+            return transpiled_program
+
+        source = transpiled_program if target_alias == "qasm2" else program
+        return transpile(source, "qasm3", **self.scheme.to_dict())
+
+    def _prepare_program(
+        self, program: "qbraid.programs.QPROGRAM", include_metadata: bool = True
+    ) -> "tuple[qbraid.programs.QPROGRAM, dict[str, Any]]":
+        """Load, validate, transpile and transform a single program, and (optionally)
+        extract the circuit metadata attached to the job, sharing intermediate results
+        between each step.
+
+        Args:
+            program: The quantum program to prepare for submission.
+            include_metadata (bool): If False, skip computing the circuit num_qubits,
+                depth and OpenQASM 3 representation. Defaults to True.
+
+        Returns:
+            A tuple of the transformed program and the circuit metadata keyword arguments.
+        """
+        program_alias = get_program_type_alias(program, safe=True)
+        program_spec = ProgramSpec(type(program), alias=program_alias)
+        qbraid_program = load_program(program) if program_spec.native else None
+
+        self.validate(qbraid_program)
+        transpiled_program = self.transpile(program, program_spec)
+        transformed_program = self.transform(transpiled_program)
+
+        program_data = {
+            "num_qubits": None,
+            "depth": None,
+            "openqasm": None,
+        }
+
+        if include_metadata and qbraid_program:
+            program_data["num_qubits"] = self.try_extracting_info(
+                lambda: qbraid_program.num_qubits, "Error calculating circuit num_qubits."
+            )
+            program_data["depth"] = self.try_extracting_info(
+                lambda: qbraid_program.depth, "Error calculating circuit depth."
+            )
+            program_data["openqasm"] = self.try_extracting_info(
+                lambda: self._extract_openqasm(program, program_spec, transpiled_program),
+                "Error converting circuit to OpenQASM 3.",
+            )
+
+        return transformed_program, program_data
+
     def run(
         self,
         run_input: "Union[qbraid.programs.QPROGRAM, list[qbraid.programs.QPROGRAM]]",
         *args,
+        include_metadata: bool = True,
+        max_workers: Optional[int] = None,
         **kwargs,
     ) -> "Union[qbraid.runtime.job.QbraidJob, list[qbraid.runtime.job.QbraidJob]]":
         """
@@ -171,46 +273,28 @@ class QbraidDevice(QuantumDevice):
 
         Args:
             run_input: A single quantum program or a list of quantum programs to run on the device.
+            include_metadata (bool): If True, attach the circuit num_qubits, depth and OpenQASM 3
+                representation to each job. Set to False to skip this extra processing.
+                Defaults to True.
+            max_workers (optional, int): If provided, prepare and submit a list of programs
+                concurrently using at most this many workers. Defaults to None, i.e. programs
+                are submitted one at a time.
 
         Returns:
             A QuantumJob object or a list of QuantumJob objects corresponding to the input.
+
+        Raises:
+            JobSubmissionError: If one or more programs in a list fail to submit. The jobs
+                that were created successfully are available on the exception.
         """
+
+        def run_one(program: "qbraid.programs.QPROGRAM") -> "qbraid.runtime.job.QbraidJob":
+            transformed_program, program_data = self._prepare_program(
+                program, include_metadata=include_metadata
+            )
+            return self.submit(transformed_program, **program_data, **kwargs)
+
         if not isinstance(run_input, list):
-            run_input_list = [run_input]
-            is_single_input = True
-        else:
-            run_input_list = run_input
-            is_single_input = False
-
-        jobs = []
-
-        for program in run_input_list:
-            program_alias = get_program_type_alias(program, safe=True)
-            program_spec = ProgramSpec(type(program), alias=program_alias)
-            qbraid_program = load_program(program) if program_spec.native else None
-            program_data = {
-                "num_qubits": None,
-                "depth": None,
-                "openqasm": None,
-            }
-
-            if qbraid_program:
-                program_data["num_qubits"] = self.try_extracting_info(
-                    lambda program=qbraid_program: program.num_qubits,
-                    "Error calculating circuit num_qubits.",
-                )
-                program_data["depth"] = self.try_extracting_info(
-                    lambda program=qbraid_program: program.depth, "Error calculating circuit depth."
-                )
-                program_data["openqasm"] = self.try_extracting_info(
-                    lambda program=program: transpile(program, "qasm3"),
-                    "Error converting circuit to OpenQASM 3.",
-                )
-
-            self.validate(qbraid_program)
-            transpiled_program = self.transpile(program, program_spec)
-            transformed_program = self.transform(transpiled_program)
-            job = self.submit(transformed_program, **program_data, **kwargs)
-            jobs.append(job)
-
-        return jobs[0] if is_single_input else jobs
+            return run_one(run_input)
+
+        return self._submit_batch(run_one, run_input, max_workers)
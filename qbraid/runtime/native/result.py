@@ -12,12 +12,11 @@
 Module defining QbraidResult class
 
 """
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable, Iterator, NamedTuple, Optional
 
-import numpy as np
-
-from qbraid.runtime.result import GateModelJobResult
+from qbraid.runtime.result import GateModelJobResult, PackedMeasurements
 
 
 @dataclass
@@ -43,6 +42,55 @@ class ExperimentResult:
         )
 
 
+class _Pending(NamedTuple):
+    """The factory of a value that has not been computed yet."""
+
+    factory: Callable[[], Any]
+
+
+class LazyMetadata(MutableMapping):
+    """Mapping that computes the values of selected keys on first access.
+
+    Every key is listed by ``in``, iteration and ``len``, whether or not its value has been
+    computed. The factory of a key is called once, when its value is first read, and the
+    value is then stored. Copying the mapping, e.g. with ``dict(metadata)``, reads and so
+    computes every value.
+    """
+
+    def __init__(
+        self,
+        values: Optional[dict[str, Any]] = None,
+        factories: Optional[dict[str, Callable[[], Any]]] = None,
+    ):
+        self._data: dict[str, Any] = dict(values or {})
+        for key, factory in (factories or {}).items():
+            self._data[key] = _Pending(factory)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        if isinstance(value, _Pending):
+            value = self._data[key] = value.factory()
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
 class QbraidJobResult(GateModelJobResult):
     """Class to represent the results of a quantum circuit simulation."""
 
@@ -55,7 +103,7 @@ class QbraidJobResult(GateModelJobResult):
         self.result = result
         self._cached_histogram = None
         self._cached_metadata = None
-        self._measurements = None
+        self._measurements: Optional[PackedMeasurements] = None
 
     def __repr__(self):
         """Return a string representation of the Result object."""
@@ -64,20 +112,24 @@ class QbraidJobResult(GateModelJobResult):
             f"success={self.success})"
         )
 
-    def measurements(self):
-        """Return the measurement results 2D numpy array."""
+    def packed_measurements(self) -> PackedMeasurements:
+        """Return the measurement results in bit-packed form."""
         if self._measurements is None:
-            counts = self.result.measurement_counts
-            if counts:
-                measurements = []
-                for state, count in counts.items():
-                    measurements.extend([list(map(int, state))] * count)
-                self._measurements = np.array(measurements, dtype=int)
+            self._measurements = PackedMeasurements.from_counts(
+                self.result.measurement_counts or {}
+            )
         return self._measurements
 
+    def measurements(self):
+        """Return the measurement results 2D numpy array."""
+        packed = self.packed_measurements()
+        return None if packed.num_shots == 0 else packed.to_array()
+
     def raw_counts(self, decimal: bool = False, **kwargs):
         """Returns raw histogram data of the run"""
-        counts = self._array_to_histogram(self.measurements())
+        if self._cached_histogram is None:
+            self._cached_histogram = self.format_counts(self.result.measurement_counts or {})
+        counts = self._cached_histogram
 
         if decimal is True:
             counts = {int(key, 2): value for key, value in counts.items()}
@@ -90,13 +142,6 @@ class QbraidJobResult(GateModelJobResult):
         probabilities = self.counts_to_probabilities(counts)
         return probabilities
 
-    def _array_to_histogram(self, arr: np.ndarray) -> dict[str, int]:
-        """Implement caching mechanism here."""
-        if self._cached_histogram is None:
-            row_strings = ["".join(map(str, row)) for row in arr]
-            self._cached_histogram = {row: row_strings.count(row) for row in set(row_strings)}
-        return self._cached_histogram
-
     @staticmethod
     def counts_to_probabilities(counts: dict[str, int]) -> dict[str, float]:
         """
@@ -116,17 +161,44 @@ class QbraidJobResult(GateModelJobResult):
         }
         return measurement_probabilities
 
-    def metadata(self) -> dict[str, int]:
-        """Return metadata about the measurement results."""
+    def _archive_metadata(self) -> dict[str, Any]:
+        return {
+            **super()._archive_metadata(),
+            "device_id": self.device_id,
+            "job_id": self.job_id,
+            "success": self.success,
+            "execution_duration": self.result.execution_duration,
+        }
+
+    def _num_shots(self) -> int:
+        """Return the number of shots, summed from the measurement counts."""
+        return sum((self.result.measurement_counts or {}).values())
+
+    def _num_qubits(self) -> int:
+        """Return the number of measured qubits, from the widest measurement counts key."""
+        counts = self.result.measurement_counts or {}
+        return max((len(key.replace(" ", "")) for key in counts), default=0)
+
+    def metadata(self) -> LazyMetadata:
+        """Return metadata about the measurement results.
+
+        ``num_shots`` and ``num_qubits`` are derived from the measurement counts. The
+        ``measurements``, ``measurement_counts`` and ``measurement_probabilities`` values are
+        computed when their keys are first read, so that the per-shot measurements array is
+        only expanded if it is used.
+        """
         if self._cached_metadata is None:
-            num_shots, num_qubits = self.measurements().shape
-            self._cached_metadata = {
-                "num_shots": num_shots,
-                "num_qubits": num_qubits,
-                "execution_duration": self.result.execution_duration,
-                "measurements": self.measurements(),
-                "measurement_counts": self.measurement_counts(),
-                "measurement_probabilities": self.measurement_probabilities(),
-            }
+            self._cached_metadata = LazyMetadata(
+                {
+                    "num_shots": self._num_shots(),
+                    "num_qubits": self._num_qubits(),
+                    "execution_duration": self.result.execution_duration,
+                },
+                factories={
+                    "measurements": self.measurements,
+                    "measurement_counts": self.measurement_counts,
+                    "measurement_probabilities": self.measurement_probabilities,
+                },
+            )
 
         return self._cached_metadata
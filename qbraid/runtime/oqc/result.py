@@ -12,26 +12,33 @@
 Module for OQC result class.
 
 """
+from typing import Any, Optional
+
 import numpy as np
 
-from qbraid.runtime.result import GateModelJobResult
+from qbraid.runtime.result import GateModelJobResult, PackedMeasurements
 
 
 class OQCJobResult(GateModelJobResult):
     """OQC result class."""
 
+    def __init__(self, result: dict[str, Any]):
+        super().__init__(result)
+        self._measurements: Optional[PackedMeasurements] = None
+
     def raw_counts(self, **kwargs) -> dict[str, int]:
         """Get the raw measurement counts of the task."""
         return self._result.get("counts", {})
 
+    def packed_measurements(self) -> PackedMeasurements:
+        """Get the measurements of the task in bit-packed form."""
+        if self._measurements is None:
+            self._measurements = PackedMeasurements.from_counts(self.raw_counts())
+        return self._measurements
+
     def measurements(self) -> np.ndarray:
         """Get the measurements of the task."""
-        counts = self.raw_counts()
-        res = []
-        for state in counts:
-            new_state = []
-            for bit in state:
-                new_state.append(int(bit))
-            for _ in range(counts[state]):
-                res.append(new_state)
-        return np.array(res, dtype=int)
+        packed = self.packed_measurements()
+        if packed.num_shots == 0:
+            return np.array([], dtype=int)
+        return packed.to_array()
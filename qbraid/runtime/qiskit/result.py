@@ -14,7 +14,7 @@ Module defining QiskitResult Class
 """
 import numpy as np
 
-from qbraid.runtime.result import GateModelJobResult
+from qbraid.runtime.result import GateModelJobResult, bitstrings_to_array
 
 
 class QiskitResult(GateModelJobResult):
@@ -58,13 +58,15 @@ class QiskitResult(GateModelJobResult):
     def measurements(self):
         """Return measurements as list"""
         num_circuits = len(self._result.results)
-        qiskit_meas = [self._result.get_memory(i) for i in range(num_circuits)]
-        qbraid_meas = [self._format_measurements(qiskit_meas[i]) for i in range(num_circuits)]
+        qiskit_meas = [
+            [shot.replace(" ", "") for shot in self._result.get_memory(i)]
+            for i in range(num_circuits)
+        ]
+        num_bits = max((len(shot) for memory in qiskit_meas for shot in memory), default=0)
+        qbraid_meas = [bitstrings_to_array(memory, num_bits).astype(int) for memory in qiskit_meas]
 
         if num_circuits == 1:
-            qbraid_meas = qbraid_meas[0]
-        else:
-            qbraid_meas = self.normalize_tuples(qbraid_meas)
+            return qbraid_meas[0]
 
         return np.array(qbraid_meas)
 
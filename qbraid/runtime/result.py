@@ -9,13 +9,32 @@
 # THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
 
 """
-Module defining abstract GateModelJobResult Class
+Module defining abstract GateModelJobResult Class and shared result data containers
 
 """
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Sequence, Union
 
 import numpy as np
+from qbraid_core._import import LazyLoader
+
+from .archive import (
+    DEFAULT_CHUNK_SIZE,
+    ENCODING_BITS,
+    to_arrow_table,
+    write_npz,
+    write_parquet,
+)
+
+if TYPE_CHECKING:
+    import pyarrow
+
+pa = LazyLoader("pa", globals(), "pyarrow")
+
+MAX_DENSE_BITS = 20
+
+MAX_BATCH_BITS = 64
 
 
 def normalize_measurement_counts(measurements: list[dict[str, int]]) -> list[dict[str, int]]:
@@ -44,6 +63,455 @@ def normalize_measurement_counts(measurements: list[dict[str, int]]) -> list[dic
     return normalized_counts_list
 
 
+def probabilities_to_counts(probabilities: np.ndarray, shots: int) -> np.ndarray:
+    """Converts outcome probabilities to integer counts that sum exactly to ``shots``.
+
+    Uses largest-remainder rounding: each outcome first receives the floor of its expected
+    count, and the remaining shots go to the outcomes with the largest fractional parts, with
+    ties broken in favor of the earlier outcome.
+
+    Args:
+        probabilities (np.ndarray): 1D array of non-negative outcome probabilities. The array
+            is renormalized if it does not sum to one.
+        shots (int): Total number of shots.
+
+    Returns:
+        np.ndarray: 1D ``int64`` array of counts, aligned with ``probabilities``.
+    """
+    probabilities = np.asarray(probabilities, dtype=float)
+    total = probabilities.sum()
+    if probabilities.size == 0 or total <= 0:
+        return np.zeros(probabilities.size, dtype=np.int64)
+
+    expected = probabilities * (shots / total)
+    counts = np.floor(expected).astype(np.int64)
+    remainder = shots - int(counts.sum())
+    if remainder > 0:
+        order = np.argsort(-(expected - counts), kind="stable")
+        counts[order[:remainder]] += 1
+    return counts
+
+
+def bitstrings_to_array(keys: Sequence[str], num_bits: int) -> np.ndarray:
+    """
+    Converts bitstrings to a 2D array of bits, one row per bitstring.
+
+    Args:
+        keys (Sequence[str]): Bitstrings of ``'0'`` and ``'1'`` characters, of at most
+            ``num_bits`` characters each. Shorter bitstrings are padded with zeros on the left.
+        num_bits (int): The number of columns of the array.
+
+    Returns:
+        np.ndarray: 2D ``uint8`` array of shape ``(len(keys), num_bits)``.
+    """
+    joined = "".join(key.zfill(num_bits) for key in keys).encode("ascii")
+    return np.frombuffer(joined, dtype=np.uint8).reshape(len(keys), num_bits) - ord("0")
+
+
+def _strip_counts(counts: dict[str, int]) -> tuple[int, dict[str, int]]:
+    """Removes spaces from the keys of a counts dictionary and pads them to a common length.
+
+    Returns:
+        tuple[int, dict[str, int]]: The number of bits and the normalized counts.
+    """
+    stripped = [(key.replace(" ", ""), value) for key, value in counts.items()]
+    num_bits = max((len(key) for key, _ in stripped), default=0)
+
+    normalized: dict[str, int] = {}
+    for key, value in stripped:
+        key = key.zfill(num_bits)
+        normalized[key] = normalized.get(key, 0) + value
+    return num_bits, normalized
+
+
+def _check_dense_bits(num_bits: int, max_dense_bits: int) -> None:
+    """Raises a ValueError if a dense representation over num_bits bits is too large."""
+    if num_bits > max_dense_bits:
+        raise ValueError(
+            f"Cannot build dense output over {num_bits} bits, which exceeds the limit of "
+            f"max_dense_bits={max_dense_bits}."
+        )
+
+
+def _integers_to_bitstrings(values: np.ndarray, num_bits: int) -> list[str]:
+    """Converts integers to zero-padded bitstrings of the given width."""
+    return [format(value, f"0{num_bits}b") for value in values.tolist()]
+
+
+def _parity(values: np.ndarray) -> np.ndarray:
+    """Returns the parity of the number of set bits of each ``uint64`` value, as 0 or 1."""
+    values = values.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        values ^= values >> np.uint64(shift)
+    return values & np.uint64(1)
+
+
+def _dense_counts(num_bits: int, counts: dict[str, int]) -> np.ndarray:
+    """Returns a length 2**num_bits array of counts, indexed by the integer value of each key."""
+    dense = np.zeros(2**num_bits, dtype=np.int64)
+    if counts:
+        indices = np.fromiter((int(key, 2) for key in counts), dtype=np.int64, count=len(counts))
+        np.add.at(dense, indices, np.fromiter(counts.values(), dtype=np.int64, count=len(counts)))
+    return dense
+
+
+class PackedMeasurements:
+    """Compact, bit-packed storage of per-shot measurement results.
+
+    Shots are stored as rows of a ``uint8`` array produced by :func:`numpy.packbits`, using one
+    bit per measured classical bit instead of one ``int64`` per bit. Bits are expanded into a
+    2D array only when :meth:`to_array` is called, and the expanded array is cached per
+    ``dtype`` so that repeated calls do not unpack the bits again.
+
+    Args:
+        packed (np.ndarray): 2D ``uint8`` array of shape ``(num_shots, ceil(num_bits / 8))``
+            with the bits of each shot packed in big-endian order.
+        num_bits (int): Number of measured bits per shot.
+
+    """
+
+    def __init__(self, packed: np.ndarray, num_bits: int):
+        packed = np.asarray(packed, dtype=np.uint8)
+        if packed.ndim != 2 or packed.shape[1] != -(-num_bits // 8):
+            raise ValueError(
+                f"Packed array of shape {packed.shape} is inconsistent with "
+                f"{num_bits} bits per shot."
+            )
+        self._packed = packed
+        self._num_bits = num_bits
+        self._arrays: dict[np.dtype, np.ndarray] = {}
+
+    def __repr__(self):
+        return f"PackedMeasurements(num_shots={self.num_shots}, num_bits={self.num_bits})"
+
+    def __len__(self):
+        return self.num_shots
+
+    @property
+    def packed(self) -> np.ndarray:
+        """The underlying bit-packed ``uint8`` array."""
+        return self._packed
+
+    @property
+    def num_shots(self) -> int:
+        """Number of shots stored."""
+        return self._packed.shape[0]
+
+    @property
+    def num_bits(self) -> int:
+        """Number of measured bits per shot."""
+        return self._num_bits
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used to store the packed measurements."""
+        return self._packed.nbytes
+
+    @classmethod
+    def from_array(cls, measurements: np.ndarray) -> "PackedMeasurements":
+        """Create packed measurements from a 2D array of bits with one row per shot."""
+        measurements = np.asarray(measurements)
+        if measurements.ndim != 2:
+            raise ValueError("Measurements must be a 2D array with one row per shot.")
+        packed = np.packbits(measurements.astype(bool), axis=1)
+        return cls(packed, measurements.shape[1])
+
+    @classmethod
+    def from_counts(cls, counts: dict[str, int]) -> "PackedMeasurements":
+        """Create packed measurements from a histogram of bitstrings.
+
+        Each distinct bitstring is packed once, and the packed rows are then repeated
+        according to their counts. Spaces in keys are ignored, and keys of different
+        lengths are left-padded with zeros.
+
+        Args:
+            counts (dict[str, int]): Histogram mapping bitstrings to the number of shots.
+
+        Returns:
+            PackedMeasurements: One packed row per shot, grouped by bitstring.
+
+        Raises:
+            ValueError: If a key contains characters other than '0', '1' and spaces.
+        """
+        keys = [key.replace(" ", "") for key in counts]
+        num_bits = max((len(key) for key in keys), default=0)
+        if num_bits == 0:
+            return cls(np.zeros((0, 0), dtype=np.uint8), 0)
+
+        invalid = [key for key in keys if key.strip("01")]
+        if invalid:
+            raise ValueError(f"Measurement counts key {invalid[0]!r} is not a bitstring.")
+
+        packed_states = np.packbits(bitstrings_to_array(keys, num_bits), axis=1)
+        repeats = np.fromiter(counts.values(), dtype=np.int64, count=len(keys))
+        return cls(np.repeat(packed_states, repeats, axis=0), num_bits)
+
+    def to_array(self, dtype: Any = int) -> np.ndarray:
+        """Expand the packed measurements into a 2D array with one bit per column.
+
+        The expanded array is computed on the first call for each ``dtype`` and returned
+        from the cache afterwards.
+
+        Args:
+            dtype (optional): Data type of the returned array. Defaults to ``int``.
+
+        Returns:
+            np.ndarray: Array of shape ``(num_shots, num_bits)``.
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in self._arrays:
+            bits = np.unpackbits(self._packed, axis=1, count=self._num_bits)
+            self._arrays[dtype] = bits.astype(dtype, copy=False)
+        return self._arrays[dtype]
+
+    def to_counts(self) -> dict[str, int]:
+        """Return the histogram of measured bitstrings, sorted by bitstring."""
+        if self.num_shots == 0 or self._num_bits == 0:
+            return {}
+        states, counts = np.unique(self._packed, axis=0, return_counts=True)
+        bits = np.unpackbits(states, axis=1, count=self._num_bits) + ord("0")
+        keys = np.ascontiguousarray(bits).view(f"S{self._num_bits}").ravel()
+        return {key.decode("ascii"): int(count) for key, count in zip(keys, counts)}
+
+
+class BatchResult:
+    """Columnar measurement counts for a batch of experiments.
+
+    Outcomes are stored as integer keys, with bitstring ``b`` stored as ``int(b, 2)``, in one
+    flat ``uint64`` array shared by all experiments, alongside a flat array of counts and an
+    array of offsets marking where each experiment starts. All experiments share one bit
+    width, so shorter keys are implicitly zero-padded on the left. Within each experiment,
+    outcomes are sorted and unique.
+
+    Args:
+        outcomes (np.ndarray): Flat array of integer outcome keys.
+        counts (np.ndarray): Flat array of counts, aligned with ``outcomes``.
+        offsets (np.ndarray): Array of length ``num_experiments + 1``, such that experiment
+            ``i`` spans ``outcomes[offsets[i]:offsets[i + 1]]``.
+        num_bits (int): Number of measured bits shared by all experiments.
+
+    """
+
+    def __init__(
+        self, outcomes: np.ndarray, counts: np.ndarray, offsets: np.ndarray, num_bits: int
+    ):
+        outcomes = np.asarray(outcomes, dtype=np.uint64)
+        counts = np.asarray(counts, dtype=np.int64)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if outcomes.shape != counts.shape or offsets.size == 0 or offsets[-1] != outcomes.size:
+            raise ValueError("Outcomes, counts and offsets arrays are inconsistent.")
+        if not 0 <= num_bits <= MAX_BATCH_BITS:
+            raise ValueError(f"Number of bits must be between 0 and {MAX_BATCH_BITS}.")
+
+        experiments = np.repeat(np.arange(offsets.size - 1), np.diff(offsets))
+        order = np.lexsort((outcomes, experiments))
+        outcomes, counts, experiments = outcomes[order], counts[order], experiments[order]
+
+        is_new = np.ones(outcomes.size, dtype=bool)
+        is_new[1:] = (outcomes[1:] != outcomes[:-1]) | (experiments[1:] != experiments[:-1])
+        starts = np.flatnonzero(is_new)
+
+        self._outcomes = outcomes[starts]
+        self._counts = np.add.reduceat(counts, starts) if starts.size else counts
+        self._experiments = experiments[starts]
+        self._offsets = np.searchsorted(self._experiments, np.arange(offsets.size), side="left")
+        self._num_bits = num_bits
+
+    def __repr__(self):
+        return f"BatchResult(num_experiments={self.num_experiments}, num_bits={self.num_bits})"
+
+    def __len__(self):
+        return self.num_experiments
+
+    @property
+    def num_experiments(self) -> int:
+        """Number of experiments in the batch."""
+        return self._offsets.size - 1
+
+    @property
+    def num_bits(self) -> int:
+        """Number of measured bits shared by all experiments."""
+        return self._num_bits
+
+    @property
+    def outcomes(self) -> np.ndarray:
+        """Flat array of integer outcome keys."""
+        return self._outcomes
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Flat array of counts, aligned with :attr:`outcomes`."""
+        return self._counts
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Offsets of the experiments into :attr:`outcomes` and :attr:`counts`."""
+        return self._offsets
+
+    @property
+    def experiments(self) -> np.ndarray:
+        """Flat array of experiment indices, aligned with :attr:`outcomes`."""
+        return self._experiments
+
+    @classmethod
+    def from_counts(cls, counts: Sequence[dict[str, int]]) -> "BatchResult":
+        """Create a batch result from a list of histograms of bitstrings.
+
+        Spaces in keys are ignored, and duplicate keys after padding are merged.
+
+        Raises:
+            ValueError: If any key is wider than 64 bits.
+        """
+        keys = [key.replace(" ", "") for histogram in counts for key in histogram]
+        num_bits = max((len(key) for key in keys), default=0)
+        if num_bits > MAX_BATCH_BITS:
+            raise ValueError(
+                f"Cannot store {num_bits}-bit outcomes; at most {MAX_BATCH_BITS} are supported."
+            )
+
+        outcomes = np.fromiter(
+            (int(key or "0", 2) for key in keys), dtype=np.uint64, count=len(keys)
+        )
+        values = np.fromiter(
+            (value for histogram in counts for value in histogram.values()),
+            dtype=np.int64,
+            count=len(keys),
+        )
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum([len(histogram) for histogram in counts], out=offsets[1:])
+        return cls(outcomes, values, offsets, num_bits)
+
+    def experiment(self, index: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the outcomes and counts of a single experiment."""
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        return self._outcomes[start:stop], self._counts[start:stop]
+
+    def shots(self) -> np.ndarray:
+        """Return the total number of shots of each experiment."""
+        return np.bincount(
+            self._experiments, weights=self._counts, minlength=self.num_experiments
+        ).astype(np.int64)
+
+    def probabilities(self) -> np.ndarray:
+        """Return the counts normalized by the number of shots of their experiment."""
+        shots = self.shots()[self._experiments]
+        return np.divide(
+            self._counts, shots, out=np.zeros(self._counts.size, dtype=float), where=shots > 0
+        )
+
+    def marginal(self, bits: Sequence[int]) -> "BatchResult":
+        """Marginalize every experiment over a subset of bits.
+
+        Args:
+            bits (Sequence[int]): Positions of the bits to keep, indexed from the left of the
+                bitstring, i.e. the order of the columns of ``measurements()``. The kept bits
+                appear in the given order.
+
+        Returns:
+            BatchResult: A new batch result over ``len(bits)`` bits.
+        """
+        positions = np.asarray(bits, dtype=np.int64)
+        if np.any((positions < 0) | (positions >= self._num_bits)):
+            raise ValueError(f"Bit positions must be between 0 and {self._num_bits - 1}.")
+
+        num_kept = positions.size
+        shifts = (self._num_bits - 1 - positions).astype(np.uint64)
+        kept = (self._outcomes[:, None] >> shifts[None, :]) & np.uint64(1)
+        weights = np.left_shift(np.uint64(1), np.arange(num_kept - 1, -1, -1, dtype=np.uint64))
+        outcomes = (kept * weights[None, :]).sum(axis=1, dtype=np.uint64)
+        return BatchResult(outcomes, self._counts, self._offsets, num_kept)
+
+    def _masks(self, observables: Sequence[Sequence[int]]) -> np.ndarray:
+        """Returns one integer bit mask per observable from its bit positions. Positions that
+        are repeated an even number of times cancel out, since Z squared is the identity."""
+        masks = np.zeros(len(observables), dtype=np.uint64)
+        for index, bits in enumerate(observables):
+            positions = np.asarray(bits, dtype=np.int64).reshape(-1)
+            if np.any((positions < 0) | (positions >= self._num_bits)):
+                raise ValueError(f"Bit positions must be between 0 and {self._num_bits - 1}.")
+            shifts, repeats = np.unique(self._num_bits - 1 - positions, return_counts=True)
+            shifts = shifts[repeats % 2 == 1].astype(np.uint64)
+            masks[index] = np.left_shift(np.uint64(1), shifts).sum(dtype=np.uint64)
+        return masks
+
+    def expectation_z(self, observables: Sequence[Sequence[int]]) -> np.ndarray:
+        """Compute Pauli-Z product expectation values for every experiment.
+
+        The expectation value of the product of Pauli-Z operators on a set of bits is the
+        shot-weighted mean of ``(-1) ** parity``, where ``parity`` is the parity of the kept
+        bits of each outcome, computed with bitwise operations on the integer outcomes.
+
+        Args:
+            observables (Sequence[Sequence[int]]): For each observable, the positions of the
+                bits it acts on, indexed from the left of the bitstring as in :meth:`marginal`.
+                An empty sequence denotes the identity. A repeated position applies Z more
+                than once, so ``[1, 1]`` is also the identity.
+
+        Returns:
+            np.ndarray: Array of shape ``(num_experiments, len(observables))``. Experiments
+            with no shots have NaN expectation values.
+        """
+        masks = self._masks(observables)
+        parities = _parity(self._outcomes[:, None] & masks[None, :])
+        signs = 1.0 - 2.0 * parities.astype(float)
+
+        totals = np.zeros((self.num_experiments, masks.size))
+        np.add.at(totals, self._experiments, signs * self._counts[:, None])
+        shots = self.shots().astype(float)[:, None]
+        return np.divide(totals, shots, out=np.full_like(totals, np.nan), where=shots > 0)
+
+    def to_counts(
+        self, include_zero_values: bool = False, max_dense_bits: int = MAX_DENSE_BITS
+    ) -> list[dict[str, int]]:
+        """Return a list of sorted histograms with keys of a common bit width.
+
+        Raises:
+            ValueError: If ``include_zero_values`` is True and the number of bits exceeds
+                ``max_dense_bits``.
+        """
+        if include_zero_values:
+            dense = self.to_dense(max_dense_bits=max_dense_bits)
+            keys = _integers_to_bitstrings(np.arange(dense.shape[1]), self._num_bits)
+            return [dict(zip(keys, row)) for row in dense.tolist()]
+
+        nonzero = self._counts != 0
+        keys = _integers_to_bitstrings(self._outcomes[nonzero], self._num_bits)
+        values = self._counts[nonzero].tolist()
+        bounds = np.searchsorted(self._experiments[nonzero], np.arange(self.num_experiments + 1))
+        return [
+            dict(zip(keys[start:stop], values[start:stop]))
+            for start, stop in zip(bounds[:-1].tolist(), bounds[1:].tolist())
+        ]
+
+    def to_dense(self, max_dense_bits: int = MAX_DENSE_BITS) -> np.ndarray:
+        """Return a ``(num_experiments, 2**num_bits)`` array of counts.
+
+        Raises:
+            ValueError: If the number of bits exceeds ``max_dense_bits``.
+        """
+        _check_dense_bits(self._num_bits, max_dense_bits)
+        dense = np.zeros((self.num_experiments, 2**self._num_bits), dtype=np.int64)
+        np.add.at(dense, (self._experiments, self._outcomes.astype(np.int64)), self._counts)
+        return dense
+
+    def to_numpy(self) -> dict[str, np.ndarray]:
+        """Return the columns of the batch as NumPy arrays."""
+        return {
+            "experiment": self._experiments.copy(),
+            "outcome": self._outcomes.copy(),
+            "count": self._counts.copy(),
+        }
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Return the batch as a ``pyarrow.Table`` with one row per observed outcome.
+
+        The shared bit width is stored in the table's schema metadata under ``num_bits``.
+        Requires ``pyarrow`` to be installed.
+        """
+        table = pa.table(self.to_numpy())
+        return table.replace_schema_metadata({"num_bits": str(self._num_bits)})
+
+
 class QuantumJobResult:
     """Result of a quantum job.
 
@@ -55,10 +523,114 @@ class QuantumJobResult:
     def __init__(self, result: Optional[Any] = None):
         self._result = result
 
+    def _archive_shots(self) -> tuple[np.ndarray, int, str]:
+        """Returns the encoded shot rows, the number of bits or sites, and the encoding.
+
+        Raises:
+            ValueError: If the result type does not support exporting shots.
+        """
+        raise ValueError(f"{type(self).__name__} does not support exporting shots.")
+
+    def _archive_counts(self) -> dict[str, int]:
+        """Returns the histogram of measured outcomes to archive."""
+        return {}
+
+    def _archive_metadata(self) -> dict[str, Any]:
+        """Returns the job metadata to archive."""
+        return {"result_type": type(self).__name__}
+
+    def _archive_data(self, metadata: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """Collects the shots, counts and metadata written by the export methods."""
+        shots, num_bits, encoding = self._archive_shots()
+        return {
+            "shots": shots,
+            "num_bits": num_bits,
+            "encoding": encoding,
+            "counts": self._archive_counts(),
+            "metadata": {**self._archive_metadata(), **(metadata or {})},
+        }
+
+    def to_npz(
+        self,
+        path: Union[str, Path],
+        metadata: Optional[dict[str, Any]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Write the shots, counts and metadata of the result to an uncompressed NPZ archive.
+
+        Shots are streamed to disk in chunks of ``chunk_size`` rows, and can be loaded back
+        memory-mapped with :func:`~qbraid.runtime.load_result`.
+
+        Args:
+            path (Union[str, Path]): Output file path.
+            metadata (Optional[dict]): Additional metadata to store with the result.
+            chunk_size (int): Number of shots written per chunk.
+
+        Raises:
+            ValueError: If the result type does not support exporting shots.
+        """
+        write_npz(path, chunk_size=chunk_size, **self._archive_data(metadata))
+
+    def to_arrow(
+        self, metadata: Optional[dict[str, Any]] = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> "pyarrow.Table":
+        """Return the result as a ``pyarrow.Table`` with one fixed-size binary row per shot.
+
+        Counts and metadata are stored in the schema metadata. Requires ``pyarrow``.
+
+        Args:
+            metadata (Optional[dict]): Additional metadata to store with the result.
+            chunk_size (int): Number of shots per record batch.
+
+        Raises:
+            ValueError: If the result type does not support exporting shots.
+        """
+        return to_arrow_table(chunk_size=chunk_size, **self._archive_data(metadata))
+
+    def to_parquet(
+        self,
+        path: Union[str, Path],
+        metadata: Optional[dict[str, Any]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Write the result to a Parquet file, with one row group per chunk of shots.
+
+        Requires ``pyarrow``.
+
+        Args:
+            path (Union[str, Path]): Output file path.
+            metadata (Optional[dict]): Additional metadata to store with the result.
+            chunk_size (int): Number of shots per row group.
+
+        Raises:
+            ValueError: If the result type does not support exporting shots.
+        """
+        write_parquet(path, chunk_size=chunk_size, **self._archive_data(metadata))
+
 
 class GateModelJobResult(ABC, QuantumJobResult):
     """Abstract interface for gate model quantum job results."""
 
+    def packed_measurements(self) -> PackedMeasurements:
+        """Return the measurements of a single-experiment run in bit-packed form.
+
+        Raises:
+            ValueError: If the result holds measurements of more than one experiment.
+        """
+        measurements = self.measurements()
+        if measurements is None or np.size(measurements) == 0:
+            return PackedMeasurements(np.zeros((0, 0), dtype=np.uint8), 0)
+        if np.ndim(measurements) != 2:
+            raise ValueError("Only single-experiment measurements can be packed.")
+        return PackedMeasurements.from_array(measurements)
+
+    def _archive_shots(self) -> tuple[np.ndarray, int, str]:
+        packed = self.packed_measurements()
+        return packed.packed, packed.num_bits, ENCODING_BITS
+
+    def _archive_counts(self) -> dict[str, int]:
+        return self.measurement_counts()
+
     @abstractmethod
     def measurements(self) -> np.ndarray:
         """Return measurements as list"""
@@ -68,11 +640,36 @@ class GateModelJobResult(ABC, QuantumJobResult):
         """Returns raw histogram data of the run"""
 
     @staticmethod
-    def format_counts(counts: dict, include_zero_values: bool = False) -> dict:
+    def array_to_histogram(measurements: np.ndarray) -> dict[str, int]:
+        """Computes the histogram of a 2D array of measurements with one row per shot.
+
+        Rows are bit-packed and counted with a single call to :func:`numpy.unique`, so the
+        cost is linear in the number of shots rather than in shots times distinct outcomes.
+
+        For example:
+
+        .. code-block:: python
+
+            >>> GateModelJobResult.array_to_histogram(np.array([[0, 1], [1, 1], [0, 1]]))
+            {'01': 2, '11': 1}
+
+        """
+        if measurements is None or np.size(measurements) == 0:
+            return {}
+        return PackedMeasurements.from_array(measurements).to_counts()
+
+    @staticmethod
+    def format_counts(
+        counts: dict, include_zero_values: bool = False, max_dense_bits: int = MAX_DENSE_BITS
+    ) -> dict:
         """Formats, sorts, and adds missing bit indices to counts dictionary
         Can pass in a 'include_zero_values' parameter to decide whether to include the states
         with zero counts.
 
+        Only the observed keys are sorted unless ``include_zero_values`` is True, in which case
+        all ``2**num_bits`` states are generated. To guard against exponential blow-up, this is
+        only allowed for up to ``max_dense_bits`` bits.
+
         For example:
 
         .. code-block:: python
@@ -84,24 +681,159 @@ class GateModelJobResult(ABC, QuantumJobResult):
             >>> GateModelJobResult.format_counts(counts, include_zero_values=True)
             {'00': 46, '01': 0, '10': 79, '11': 13}
 
+        Raises:
+            ValueError: If ``include_zero_values`` is True and the number of bits exceeds
+                ``max_dense_bits``.
         """
-        counts = {key.replace(" ", ""): value for key, value in counts.items()}
+        num_bits, sparse_counts = _strip_counts(counts)
 
-        num_bits = max(len(key) for key in counts)
-        all_keys = [format(i, f"0{num_bits}b") for i in range(2**num_bits)]
-        final_counts = {key: counts.get(key, 0) for key in sorted(all_keys)}
+        if num_bits == 0:
+            return {}
 
         if not include_zero_values:
-            final_counts = {key: value for key, value in final_counts.items() if value != 0}
+            return {key: sparse_counts[key] for key in sorted(sparse_counts) if sparse_counts[key]}
+
+        _check_dense_bits(num_bits, max_dense_bits)
+        dense = _dense_counts(num_bits, sparse_counts)
+        return {format(i, f"0{num_bits}b"): value for i, value in enumerate(dense.tolist())}
+
+    @staticmethod
+    def counts_to_probability_vector(
+        counts: dict, max_dense_bits: int = MAX_DENSE_BITS
+    ) -> np.ndarray:
+        """Converts a counts dictionary to a dense vector of measurement probabilities.
 
-        return final_counts
+        The probability of bitstring ``b`` is stored at index ``int(b, 2)``.
+
+        For example:
+
+        .. code-block:: python
+
+            >>> GateModelJobResult.counts_to_probability_vector({'00': 3, '11': 1})
+            array([0.75, 0.  , 0.  , 0.25])
+
+        Raises:
+            ValueError: If the number of bits exceeds ``max_dense_bits``.
+        """
+        num_bits, sparse_counts = _strip_counts(counts)
+        if num_bits == 0:
+            return np.zeros(0)
+
+        _check_dense_bits(num_bits, max_dense_bits)
+        dense = _dense_counts(num_bits, sparse_counts).astype(float)
+        total = dense.sum()
+        return dense / total if total > 0 else dense
+
+    def batch_result(self, **kwargs) -> BatchResult:
+        """Returns the histogram data of the run as a columnar :class:`BatchResult`.
+
+        A single-experiment run is returned as a batch of one.
+        """
+        return self._batch_result(**kwargs)[0]
+
+    def _batch_result(self, **kwargs) -> tuple[BatchResult, bool]:
+        """Returns the histogram data as a :class:`BatchResult`, and whether the run is a batch."""
+        raw_counts = self.raw_counts(**kwargs)
+        if isinstance(raw_counts, Mapping):
+            return BatchResult.from_counts([raw_counts]), False
+        return BatchResult.from_counts(raw_counts), True
+
+    def marginal_counts(
+        self, bits: Sequence[int], include_zero_values: bool = False, **kwargs
+    ) -> Union[dict[str, int], list[dict[str, int]]]:
+        """Returns the sorted histogram data of the run, marginalized over a subset of bits.
+
+        Args:
+            bits (Sequence[int]): Positions of the bits to keep, indexed from the left of the
+                bitstring, i.e. the order of the columns of ``measurements()``. The kept bits
+                appear in the given order.
+            include_zero_values (bool): Whether to include outcomes that were never measured.
+
+        Returns:
+            The marginal counts, or a list of marginal counts for a batch of experiments.
+        """
+        batch, is_batch = self._batch_result(**kwargs)
+        counts = batch.marginal(bits).to_counts(include_zero_values=include_zero_values)
+        return counts if is_batch else counts[0]
+
+    def expectation_z(self, observable_bits: Sequence[int], **kwargs) -> Union[float, np.ndarray]:
+        """Returns the expectation value of a product of Pauli-Z operators.
+
+        Args:
+            observable_bits (Sequence[int]): Positions of the bits the observable acts on,
+                indexed from the left of the bitstring as in :meth:`marginal_counts`.
+
+        Returns:
+            The expectation value, or an array with one value per experiment for a batch.
+        """
+        batch, is_batch = self._batch_result(**kwargs)
+        values = batch.expectation_z([observable_bits])[:, 0]
+        return values if is_batch else float(values[0])
+
+    def expectation_values(
+        self, paulis: Sequence[Union[str, Sequence[int]]], **kwargs
+    ) -> np.ndarray:
+        """Returns the expectation values of several diagonal Pauli observables at once.
+
+        Each observable is either a Pauli string over ``"I"`` and ``"Z"``, with one character
+        per measured bit in the order of the bitstring, or a sequence of bit positions on
+        which it applies Pauli-Z.
+
+        For example:
+
+        .. code-block:: python
+
+            >>> result.measurement_counts()
+            {'00': 3, '11': 1}
+            >>> result.expectation_values(["ZI", "ZZ", [1]])
+            array([0.5, 1. , 0.5])
+
+        Returns:
+            np.ndarray: Array of shape ``(len(paulis),)``, or ``(num_experiments, len(paulis))``
+            for a batch of experiments.
+
+        Raises:
+            ValueError: If a Pauli string contains operators other than ``"I"`` and ``"Z"``, or
+                its length does not match the number of measured bits.
+        """
+        batch, is_batch = self._batch_result(**kwargs)
+        observables = [
+            self._pauli_z_positions(pauli, batch.num_bits) if isinstance(pauli, str) else pauli
+            for pauli in paulis
+        ]
+        values = batch.expectation_z(observables)
+        return values if is_batch else values[0]
+
+    @staticmethod
+    def _pauli_z_positions(pauli: str, num_bits: int) -> list[int]:
+        """Returns the positions of the Pauli-Z operators in a Pauli string."""
+        pauli = pauli.upper()
+        if set(pauli) - {"I", "Z"}:
+            raise ValueError(
+                f"Pauli string '{pauli}' is not diagonal in the computational basis; "
+                "only 'I' and 'Z' operators can be estimated from measurement counts."
+            )
+        if len(pauli) != num_bits:
+            raise ValueError(
+                f"Pauli string '{pauli}' has length {len(pauli)}, but {num_bits} bits were "
+                "measured."
+            )
+        return [position for position, operator in enumerate(pauli) if operator == "Z"]
 
     def measurement_counts(self, include_zero_values: bool = False, **kwargs) -> dict:
         """Returns the sorted histogram data of the run"""
         raw_counts = self.raw_counts(**kwargs)
-        if isinstance(raw_counts, dict):
+        if isinstance(raw_counts, Mapping):
             return self.format_counts(raw_counts, include_zero_values=include_zero_values)
 
+        num_bits = max(
+            (len(key.replace(" ", "")) for counts in raw_counts for key in counts), default=0
+        )
+        if num_bits <= MAX_BATCH_BITS:
+            return BatchResult.from_counts(raw_counts).to_counts(
+                include_zero_values=include_zero_values
+            )
+
         batch_counts = [
             self.format_counts(counts, include_zero_values=include_zero_values)
             for counts in raw_counts
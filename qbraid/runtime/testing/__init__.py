@@ -0,0 +1,49 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module providing in-process fake provider backends for offline testing and load testing.
+
+The fakes stand in for the provider clients used by :mod:`qbraid.runtime`, so devices,
+jobs and results run through the same code paths as against the live services, with
+configurable latency, failure injection and queue behavior.
+
+.. currentmodule:: qbraid.runtime.testing
+
+Classes
+--------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+	FakeServiceConfig
+	FakeQuantumService
+	FakeJob
+	FakeQuantumClient
+	FakeIonQSession
+	FakeOQCClient
+
+The Amazon Braket fakes, ``FakeAwsDevice`` and ``FakeAwsQuantumTask``, require the
+``braket`` extra and are imported from :mod:`qbraid.runtime.testing.braket`.
+
+"""
+from .ionq import FakeIonQSession
+from .native import FakeQuantumClient
+from .oqc import FakeOQCClient
+from .service import FakeJob, FakeQuantumService, FakeServiceConfig
+
+__all__ = [
+    "FakeServiceConfig",
+    "FakeQuantumService",
+    "FakeJob",
+    "FakeQuantumClient",
+    "FakeIonQSession",
+    "FakeOQCClient",
+]
@@ -0,0 +1,142 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module defining in-process stand-ins for Amazon Braket devices and quantum tasks.
+
+"""
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from braket.aws.queue_information import QuantumTaskQueueInfo, QueueDepthInfo, QueueType
+from braket.circuits import Circuit
+from braket.ir.openqasm import Program as OpenQasmProgram
+from braket.task_result import AdditionalMetadata, GateModelTaskResult, TaskMetadata
+from braket.tasks import GateModelQuantumTaskResult
+
+from .service import FakeQuantumService, FakeServiceConfig
+
+DEFAULT_DEVICE_ARN = "arn:aws:braket:::device/quantum-simulator/amazon/sv1"
+
+
+class FakeAwsQuantumTask:
+    """In-process stand-in for a gate-model :class:`braket.aws.AwsQuantumTask`."""
+
+    def __init__(self, task_id: str, service: FakeQuantumService, device_arn: str):
+        self.id = task_id
+        self.arn = task_id
+        self._service = service
+        self._device_arn = device_arn
+
+    def state(self) -> str:
+        """Return the state of the task, advancing it through the fake queue."""
+        self._service.request("get_quantum_task")
+        return self._service.state(self.id)
+
+    def queue_position(self) -> QuantumTaskQueueInfo:
+        """Return the position of the task in the fake queue."""
+        self._service.request("get_quantum_task")
+        job = self._service.get_job(self.id)
+        if self._service.state(self.id, advance=False) != "QUEUED":
+            return QuantumTaskQueueInfo(QueueType.NORMAL, None, "Task is not queued.")
+        pending = [
+            other
+            for other in self._service.jobs()
+            if other.index < job.index
+            and self._service.state(other.job_id, advance=False) == "QUEUED"
+        ]
+        return QuantumTaskQueueInfo(QueueType.NORMAL, str(len(pending) + 1))
+
+    def cancel(self) -> None:
+        """Cancel the task."""
+        self._service.request("cancel_quantum_task")
+        self._service.cancel(self.id)
+
+    def result(self) -> Optional[GateModelQuantumTaskResult]:
+        """Return the result of the task, or None if the task did not complete."""
+        self._service.request("get_quantum_task")
+        if self._service.state(self.id, advance=False) != "COMPLETED":
+            return None
+        job = self._service.get_job(self.id)
+        task_result = GateModelTaskResult(
+            measurements=self._service.measurements(self.id).tolist(),
+            measuredQubits=list(range(job.num_qubits)),
+            taskMetadata=TaskMetadata(id=self.id, shots=job.shots, deviceId=self._device_arn),
+            additionalMetadata=AdditionalMetadata(
+                action=OpenQasmProgram(source=job.data["source"])
+            ),
+        )
+        return GateModelQuantumTaskResult.from_object(task_result)
+
+
+@dataclass
+class FakeAwsQuantumTaskBatch:
+    """Stand-in for a :class:`braket.aws.AwsQuantumTaskBatch`."""
+
+    tasks: list[FakeAwsQuantumTask]
+
+
+class FakeAwsDevice:
+    """In-process stand-in for a gate-model :class:`braket.aws.AwsDevice`.
+
+    Can be passed to :class:`~qbraid.runtime.braket.BraketDevice` via its ``device`` argument.
+    Analog Hamiltonian simulation programs are not supported.
+    """
+
+    def __init__(
+        self,
+        arn: str = DEFAULT_DEVICE_ARN,
+        name: str = "SV1",
+        config: Optional[FakeServiceConfig] = None,
+    ):
+        """Create a new fake AWS device.
+
+        Args:
+            arn (str): The device ARN. Defaults to the ARN of the Braket SV1 simulator.
+            name (str): The device name. Defaults to "SV1".
+            config (Optional[FakeServiceConfig]): Latency, failure and queue configuration.
+        """
+        self.arn = arn
+        self.name = name
+        self.status = "ONLINE"
+        self.is_available = True
+        self.service = FakeQuantumService(config, prefix=f"{arn}/fake-task")
+
+    def queue_depth(self) -> QueueDepthInfo:
+        """Return the number of tasks in the fake queue."""
+        self.service.request("search_quantum_tasks")
+        return QueueDepthInfo(
+            quantum_tasks={
+                QueueType.NORMAL: str(self.service.queue_depth()),
+                QueueType.PRIORITY: "0",
+            },
+            jobs="0",
+        )
+
+    def run(
+        self, task_specification: Circuit, *args, shots: int = 1000, **kwargs
+    ) -> FakeAwsQuantumTask:
+        """Submit a circuit to the fake device."""
+        # pylint: disable=unused-argument
+        self.service.request("create_quantum_task")
+        job = self.service.create_job(
+            task_specification.qubit_count,
+            shots,
+            {"source": task_specification.to_ir("OPENQASM").source},
+        )
+        return FakeAwsQuantumTask(job.job_id, self.service, self.arn)
+
+    def run_batch(
+        self, task_specifications: list[Circuit], *args, shots: int = 1000, **kwargs: Any
+    ) -> FakeAwsQuantumTaskBatch:
+        """Submit a batch of circuits to the fake device."""
+        return FakeAwsQuantumTaskBatch(
+            [self.run(circuit, *args, shots=shots, **kwargs) for circuit in task_specifications]
+        )
@@ -0,0 +1,139 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module defining an in-process stand-in for the IonQ REST API.
+
+"""
+import json
+import re
+import time
+from typing import Any, Optional
+
+import requests
+from qbraid_core.exceptions import RequestsApiError
+
+from qbraid.runtime.ionq.provider import IonQSession
+
+from .service import FakeQuantumService, FakeServiceConfig
+
+FAKE_IONQ_DEVICES = [
+    {"backend": "qpu.aria-1", "status": "available", "qubits": 25, "degraded": False},
+    {"backend": "qpu.forte-1", "status": "available", "qubits": 30, "degraded": False},
+    {"backend": "simulator", "status": "available", "qubits": 29, "degraded": False},
+]
+
+JOB_STATUS_MAP = {
+    "QUEUED": "ready",
+    "RUNNING": "running",
+    "COMPLETED": "completed",
+    "FAILED": "failed",
+    "CANCELLED": "canceled",
+}
+
+JOB_PATH = re.compile(r"^/jobs/(?P<job_id>[^/]+)(?P<suffix>/results|/status/cancel)?$")
+
+
+class FakeIonQSession(IonQSession):
+    """In-process stand-in for :class:`~qbraid.runtime.ionq.IonQSession`.
+
+    Requests are routed to a :class:`~qbraid.runtime.testing.FakeQuantumService` instead of
+    the network, so the session's caching and serialization logic is exercised unchanged.
+    """
+
+    def __init__(
+        self,
+        devices: Optional[list[dict[str, Any]]] = None,
+        config: Optional[FakeServiceConfig] = None,
+        **kwargs,
+    ):
+        """Create a new fake IonQ session.
+
+        Args:
+            devices (Optional[list[dict]]): Backend data served by ``/backends``. Defaults to
+                a set of IonQ QPUs and the IonQ simulator.
+            config (Optional[FakeServiceConfig]): Latency, failure and queue configuration.
+            **kwargs: Additional keyword arguments passed to :class:`IonQSession`.
+        """
+        super().__init__(api_key="fake_api_key", **kwargs)
+        self.devices = devices if devices is not None else FAKE_IONQ_DEVICES
+        self.service = FakeQuantumService(config, error_type=RequestsApiError, prefix="ionq-fake")
+
+    def request(self, method: str, url: str, *args, **kwargs) -> requests.Response:
+        """Serve a request to the IonQ API from the in-process fake service."""
+        path = "/" + url.split("/v0.3", 1)[-1].lstrip("/")
+        method = method.upper()
+        self.service.request(f"{method} {path}")
+
+        if method == "GET" and path == "/backends":
+            return self._response(self.devices)
+
+        if method == "POST" and path == "/jobs":
+            return self._response(self._create_job(kwargs.get("data") or kwargs.get("json")))
+
+        match = JOB_PATH.match(path)
+        if match is None:
+            raise RequestsApiError(f"404 Client Error: Not Found for url: {url}")
+
+        job_id, suffix = match.group("job_id"), match.group("suffix")
+
+        if method == "GET" and suffix is None:
+            return self._response(self._get_job(job_id))
+
+        if method == "GET" and suffix == "/results":
+            return self._response(self._get_results(job_id))
+
+        if method == "PUT" and suffix == "/status/cancel":
+            self.service.cancel(job_id)
+            return self._response({"id": job_id, "status": "canceled"})
+
+        raise RequestsApiError(f"405 Client Error: Method Not Allowed for url: {url}")
+
+    @staticmethod
+    def _response(payload: Any) -> requests.Response:
+        """Return a successful response with a JSON payload."""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(payload).encode("utf-8")
+        return response
+
+    def _create_job(self, data: Any) -> dict[str, Any]:
+        """Add a job to the fake service from a serialized IonQ job request."""
+        data = json.loads(data) if isinstance(data, (str, bytes)) else data
+        circuit_input = data.get("input", {})
+        job = self.service.create_job(
+            circuit_input.get("qubits", 1), data.get("shots", 100), {"target": data.get("target")}
+        )
+        return {"id": job.job_id, "status": "ready", "request": int(job.created_at)}
+
+    def _get_job(self, job_id: str) -> dict[str, Any]:
+        """Return IonQ job data, advancing the job through the fake queue."""
+        state = self.service.state(job_id)
+        job = self.service.get_job(job_id)
+        job_data = {
+            "id": job_id,
+            "status": JOB_STATUS_MAP[state],
+            "target": job.data.get("target"),
+            "qubits": job.num_qubits,
+            "shots": job.shots,
+            "request": int(job.created_at),
+        }
+        if state == "COMPLETED":
+            job_data["results_url"] = f"/v0.3/jobs/{job_id}/results"
+            job_data["response"] = int(time.time())
+        elif state == "FAILED":
+            job_data["failure"] = {"code": "InternalError", "error": "Injected job failure."}
+        return job_data
+
+    def _get_results(self, job_id: str) -> dict[str, float]:
+        """Return the probabilities of a completed job, keyed by integer state."""
+        shots = self.service.get_job(job_id).shots
+        counts = self.service.counts(job_id)
+        return {str(int(state, 2)): count / shots for state, count in counts.items()}
@@ -0,0 +1,133 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module defining an in-process stand-in for the qBraid QuantumClient.
+
+"""
+from typing import Any, Optional
+
+from qbraid_core.services.quantum import QuantumServiceRequestError
+
+from .service import FakeQuantumService, FakeServiceConfig
+
+FAKE_QBRAID_DEVICES = [
+    {
+        "numberQubits": 64,
+        "qbraid_id": "qbraid_qir_simulator",
+        "name": "QIR sparse simulator",
+        "provider": "qBraid",
+        "paradigm": "gate-based",
+        "type": "SIMULATOR",
+        "vendor": "qBraid",
+        "runPackage": "pyqir",
+        "status": "ONLINE",
+        "isAvailable": True,
+        "processorType": "State vector",
+    },
+]
+
+
+class FakeQuantumClient:
+    """In-process stand-in for :class:`qbraid_core.services.quantum.QuantumClient`.
+
+    Serves device and job requests from a :class:`~qbraid.runtime.testing.FakeQuantumService`,
+    and can be passed to :class:`~qbraid.runtime.QbraidProvider` in place of a live client.
+    """
+
+    def __init__(
+        self,
+        devices: Optional[list[dict[str, Any]]] = None,
+        config: Optional[FakeServiceConfig] = None,
+    ):
+        """Create a new fake qBraid quantum client.
+
+        Args:
+            devices (Optional[list[dict]]): Device data served by the client. Defaults to a
+                single qBraid QIR simulator.
+            config (Optional[FakeServiceConfig]): Latency, failure and queue configuration.
+        """
+        self.devices = devices if devices is not None else FAKE_QBRAID_DEVICES
+        self.service = FakeQuantumService(
+            config, error_type=QuantumServiceRequestError, prefix="qbraid-fake-qjob"
+        )
+
+    def search_devices(self, query: Optional[dict[str, Any]] = None) -> list[dict[str, Any]]:
+        """Returns a list of quantum devices that match the given query filters."""
+        self.service.request("search_devices")
+        query = query or {}
+        return [
+            {**device, "pendingJobs": self.service.queue_depth()}
+            for device in self.devices
+            if all(device.get(key) == value for key, value in query.items())
+        ]
+
+    # pylint: disable-next=unused-argument
+    def get_device(self, qbraid_id: Optional[str] = None, **kwargs) -> dict[str, Any]:
+        """Returns the metadata corresponding to the specified quantum device."""
+        self.service.request("get_device")
+        for device in self.devices:
+            if device["qbraid_id"] == qbraid_id:
+                return {**device, "pendingJobs": self.service.queue_depth()}
+        raise QuantumServiceRequestError("No devices found matching given criteria")
+
+    def create_job(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Creates a new quantum job with the given data."""
+        self.service.request("create_job")
+        shots = data.get("shots") or 1
+        num_qubits = data.get("circuitNumQubits") or 1
+        job = self.service.create_job(num_qubits, shots, data)
+        return {
+            "qbraidJobId": job.job_id,
+            "qbraidDeviceId": data.get("qbraidDeviceId"),
+            "shots": shots,
+            "circuitNumQubits": data.get("circuitNumQubits"),
+            "status": "INITIALIZING",
+            "vendor": "qbraid",
+            "provider": "qbraid",
+        }
+
+    # pylint: disable-next=unused-argument
+    def get_job(self, qbraid_id: Optional[str] = None, **kwargs) -> dict[str, Any]:
+        """Returns the metadata corresponding to the specified quantum job."""
+        self.service.request("get_job")
+        state = self.service.state(qbraid_id)
+        job = self.service.get_job(qbraid_id)
+        job_data = {
+            "qbraidJobId": job.job_id,
+            "qbraidDeviceId": job.data.get("qbraidDeviceId"),
+            "shots": job.shots,
+            "circuitNumQubits": job.num_qubits,
+            "status": state,
+            "vendor": "qbraid",
+            "provider": "qbraid",
+        }
+        if state == "COMPLETED":
+            job_data["measurementCounts"] = self.service.counts(qbraid_id)
+            job_data["timeStamps"] = {"executionDuration": 0}
+        return job_data
+
+    def search_jobs(self, query: Optional[dict[str, Any]] = None) -> list[dict[str, Any]]:
+        """Returns a list of quantum jobs that match the given query filters."""
+        self.service.request("search_jobs")
+        query = query or {}
+        device_id = query.get("qbraidDeviceId")
+        return [
+            {"qbraidJobId": job.job_id, "qbraidDeviceId": job.data.get("qbraidDeviceId")}
+            for job in self.service.jobs()
+            if device_id is None or job.data.get("qbraidDeviceId") == device_id
+        ]
+
+    # pylint: disable-next=unused-argument
+    def cancel_job(self, qbraid_id: Optional[str] = None, **kwargs) -> dict[str, Any]:
+        """Cancels the quantum job with the given qBraid ID."""
+        self.service.request("cancel_job")
+        self.service.cancel(qbraid_id)
+        return {"qbraidJobId": qbraid_id, "status": "CANCELLED"}
@@ -0,0 +1,186 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module defining an in-process stand-in for the OQC cloud client.
+
+"""
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from .service import FakeQuantumService, FakeServiceConfig
+
+FAKE_OQC_DEVICES = [
+    {
+        "id": "qpu:uk:2:d865b5a184",
+        "name": "Lucy Simulator",
+        "region": "uk",
+        "url": "https://uk.cloud.oqc.app/d865b5a184",
+        "active": True,
+    },
+]
+
+TASK_STATUS_MAP = {
+    "QUEUED": "SUBMITTED",
+    "RUNNING": "RUNNING",
+    "COMPLETED": "COMPLETED",
+    "FAILED": "FAILED",
+    "CANCELLED": "CANCELLED",
+}
+
+TASK_CONFIG = {
+    "$type": "<class 'scc.compiler.config.CompilerConfig'>",
+    "$data": {
+        "repeats": None,
+        "repetition_period": None,
+        "results_format": {
+            "$type": "<class 'scc.compiler.config.QuantumResultsFormat'>",
+            "$data": {
+                "format": None,
+                "transforms": {
+                    "$type": "<enum 'scc.compiler.config.ResultsFormatting'>",
+                    "$value": 3,
+                },
+            },
+        },
+        "metrics": {"$type": "<enum 'scc.compiler.config.MetricsType'>", "$value": 6},
+        "active_calibrations": [],
+        "optimizations": None,
+        "error_mitigation": None,
+    },
+}
+
+
+@dataclass
+class FakeQPUTaskResult:
+    """Stand-in for a ``qcaas_client.client.QPUTaskResult``."""
+
+    id: str
+    result: dict[str, Any]
+
+
+@dataclass
+class FakeQPUTaskErrors:
+    """Stand-in for a ``qcaas_client.client.QPUTaskErrors``."""
+
+    error_message: str
+
+
+class FakeOQCClient:
+    """In-process stand-in for ``qcaas_client.client.OQCClient``.
+
+    Tasks are scheduled on a :class:`~qbraid.runtime.testing.FakeQuantumService`, and the
+    client can be passed to :class:`~qbraid.runtime.oqc.OQCDevice` in place of a live client.
+    """
+
+    def __init__(
+        self,
+        devices: Optional[list[dict[str, Any]]] = None,
+        config: Optional[FakeServiceConfig] = None,
+    ):
+        """Create a new fake OQC client.
+
+        Args:
+            devices (Optional[list[dict]]): QPU data served by the client. Defaults to the
+                OQC Lucy simulator.
+            config (Optional[FakeServiceConfig]): Latency, failure and queue configuration.
+        """
+        self.devices = devices if devices is not None else FAKE_OQC_DEVICES
+        self.service = FakeQuantumService(config, prefix="oqc-fake")
+
+    def get_qpus(self) -> list[dict[str, Any]]:
+        """Return the list of available QPUs."""
+        self.service.request("get_qpus")
+        return self.devices
+
+    def schedule_tasks(self, tasks: Any, qpu_id: Optional[str] = None) -> list[Any]:
+        """Schedule one or more QPU tasks, assigning each a task ID."""
+        self.service.request("schedule_tasks")
+        tasks = tasks if isinstance(tasks, list) else [tasks]
+        for task in tasks:
+            config = getattr(task, "config", None)
+            shots = getattr(config, "repeats", None) or 1000
+            job = self.service.create_job(
+                _count_qasm2_clbits(task.program),
+                shots,
+                {"qpu_id": qpu_id, "program": task.program},
+            )
+            task.task_id = job.job_id
+        return tasks
+
+    def get_task_status(self, task_id: str, qpu_id: Optional[str] = None) -> str:
+        """Return the status of a task, advancing it through the fake queue."""
+        # pylint: disable=unused-argument
+        self.service.request("get_task_status")
+        return TASK_STATUS_MAP[self.service.state(task_id)]
+
+    def get_task_results(
+        self, task_id: str, qpu_id: Optional[str] = None
+    ) -> Optional[FakeQPUTaskResult]:
+        """Return the measurement counts of a completed task."""
+        # pylint: disable=unused-argument
+        self.service.request("get_task_results")
+        if self.service.state(task_id, advance=False) != "COMPLETED":
+            return None
+        return FakeQPUTaskResult(id=task_id, result={"c": self.service.counts(task_id)})
+
+    def get_task_timings(self, task_id: str, qpu_id: Optional[str] = None) -> dict[str, Any]:
+        """Return the timings of a task."""
+        # pylint: disable=unused-argument
+        self.service.request("get_task_timings")
+        created = datetime.fromtimestamp(self.service.get_job(task_id).created_at, timezone.utc)
+        return {"RECEIVER_DEQUEUED": created.isoformat(), "RECEIVER_FROM_SCC": None}
+
+    def get_task_metrics(self, task_id: str, qpu_id: Optional[str] = None) -> dict[str, Any]:
+        """Return the metrics of a task."""
+        # pylint: disable=unused-argument
+        self.service.request("get_task_metrics")
+        self.service.get_job(task_id)
+        return {"optimized_circuit": None, "optimized_instruction_count": None}
+
+    def get_task_metadata(self, task_id: str, qpu_id: Optional[str] = None) -> dict[str, Any]:
+        """Return the metadata of a task."""
+        # pylint: disable=unused-argument
+        self.service.request("get_task_metadata")
+        job = self.service.get_job(task_id)
+        config = json.loads(json.dumps(TASK_CONFIG))
+        config["$data"]["repeats"] = job.shots
+        return {
+            "id": task_id,
+            "config": json.dumps(config),
+            "created_at": datetime.fromtimestamp(job.created_at, timezone.utc).isoformat(),
+            "qpu_id": job.data.get("qpu_id"),
+            "tag": None,
+        }
+
+    def get_task_errors(
+        self, task_id: str, qpu_id: Optional[str] = None
+    ) -> Optional[FakeQPUTaskErrors]:
+        """Return the errors of a failed task."""
+        # pylint: disable=unused-argument
+        self.service.request("get_task_errors")
+        if self.service.state(task_id, advance=False) != "FAILED":
+            return None
+        return FakeQPUTaskErrors(error_message="Injected task failure.")
+
+    def cancel_task(self, task_id: str, qpu_id: Optional[str] = None) -> None:
+        """Cancel a task."""
+        # pylint: disable=unused-argument
+        self.service.request("cancel_task")
+        self.service.cancel(task_id)
+
+
+def _count_qasm2_clbits(program: str) -> int:
+    """Return the total size of the classical registers declared in an OpenQASM 2 program."""
+    sizes = [int(size) for size in re.findall(r"\bcreg\s+\w+\s*\[\s*(\d+)\s*\]", program)]
+    return sum(sizes) or 1
@@ -0,0 +1,223 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module defining the in-process job service shared by all fake provider backends.
+
+"""
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Optional, Type
+
+import numpy as np
+
+from qbraid.runtime.result import GateModelJobResult
+
+JOB_STATES_FINAL = ("COMPLETED", "FAILED", "CANCELLED")
+
+
+@dataclass
+class FakeServiceConfig:
+    """
+    Configuration for the behavior of an in-process fake quantum service.
+
+    Attributes:
+        latency (float): Seconds to sleep before serving each request. Defaults to 0.
+        request_failure_rate (float): Probability that any single request raises an error.
+            Defaults to 0.
+        job_failure_rate (float): Probability that a submitted job ends in a failed state.
+            Defaults to 0.
+        queue_polls (int): Number of status requests for which a new job reports as queued.
+            Defaults to 0.
+        running_polls (int): Number of subsequent status requests for which a job reports
+            as running, before reaching a final state. Defaults to 0.
+        queue_capacity (Optional[int]): Maximum number of jobs allowed in a non-final state.
+            Submissions beyond this limit raise an error. Defaults to None, i.e. no limit.
+        seed (Optional[int]): Seed used for failure injection and for generating results.
+            Defaults to None.
+    """
+
+    latency: float = 0.0
+    request_failure_rate: float = 0.0
+    job_failure_rate: float = 0.0
+    queue_polls: int = 0
+    running_polls: int = 0
+    queue_capacity: Optional[int] = None
+    seed: Optional[int] = None
+
+
+@dataclass
+class FakeJob:
+    """Record of a job submitted to a :class:`FakeQuantumService`."""
+
+    job_id: str
+    num_qubits: int
+    shots: int
+    index: int
+    will_fail: bool = False
+    cancelled: bool = False
+    polls: int = 0
+    created_at: float = field(default_factory=time.time)
+    data: dict[str, Any] = field(default_factory=dict)
+    measurements: Optional[np.ndarray] = None
+
+
+class FakeQuantumService:
+    """Thread-safe, in-process job queue that backs the fake provider clients.
+
+    Each job progresses through the states ``QUEUED`` -> ``RUNNING`` -> ``COMPLETED``
+    (or ``FAILED``) as its status is polled, so that polling behavior is deterministic
+    and independent of wall-clock time. Results are sampled uniformly at random from a
+    generator seeded per job.
+    """
+
+    def __init__(
+        self,
+        config: Optional[FakeServiceConfig] = None,
+        error_type: Type[Exception] = RuntimeError,
+        prefix: str = "fake",
+    ):
+        """Create a new fake quantum service.
+
+        Args:
+            config (Optional[FakeServiceConfig]): Latency, failure and queue configuration.
+            error_type (Type[Exception]): Exception raised for injected request failures and
+                for requests referencing unknown jobs. Defaults to RuntimeError.
+            prefix (str): Prefix used to generate job IDs. Defaults to "fake".
+        """
+        self.config = config or FakeServiceConfig()
+        self.error_type = error_type
+        self.prefix = prefix
+        self.request_counts: Counter = Counter()
+        self._jobs: dict[str, FakeJob] = {}
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+
+    def request(self, operation: str) -> None:
+        """Record a request, applying the configured latency and failure injection.
+
+        Raises:
+            error_type: If the request is selected for failure injection.
+        """
+        with self._lock:
+            self.request_counts[operation] += 1
+            fail = self._rng.random() < self.config.request_failure_rate
+
+        if self.config.latency > 0:
+            time.sleep(self.config.latency)
+
+        if fail:
+            raise self.error_type(f"Injected failure in '{operation}' request.")
+
+    def queue_depth(self) -> int:
+        """Return the number of jobs that have not reached a final state."""
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if self._state(job) not in JOB_STATES_FINAL)
+
+    def create_job(
+        self, num_qubits: int, shots: int, data: Optional[dict[str, Any]] = None
+    ) -> FakeJob:
+        """Add a new job to the queue.
+
+        Args:
+            num_qubits (int): Number of qubits measured by the job.
+            shots (int): Number of shots to sample.
+            data (Optional[dict]): Provider-specific job data stored with the job.
+
+        Raises:
+            error_type: If the queue is at capacity.
+        """
+        with self._lock:
+            capacity = self.config.queue_capacity
+            if capacity is not None:
+                pending = sum(
+                    1 for job in self._jobs.values() if self._state(job) not in JOB_STATES_FINAL
+                )
+                if pending >= capacity:
+                    raise self.error_type(f"Queue capacity of {capacity} jobs exceeded.")
+
+            index = len(self._jobs)
+            job = FakeJob(
+                job_id=f"{self.prefix}-{index}",
+                num_qubits=num_qubits,
+                shots=shots,
+                index=index,
+                will_fail=self._rng.random() < self.config.job_failure_rate,
+                data=data or {},
+            )
+            self._jobs[job.job_id] = job
+        return job
+
+    def get_job(self, job_id: str) -> FakeJob:
+        """Return the job with the given ID.
+
+        Raises:
+            error_type: If no job with the given ID exists.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise self.error_type(f"Job '{job_id}' not found.")
+        return job
+
+    def jobs(self) -> list[FakeJob]:
+        """Return all jobs submitted to the service, in submission order."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def _state(self, job: FakeJob) -> str:
+        """Return the current state of a job without advancing it."""
+        if job.cancelled:
+            return "CANCELLED"
+        if job.polls < self.config.queue_polls:
+            return "QUEUED"
+        if job.polls < self.config.queue_polls + self.config.running_polls:
+            return "RUNNING"
+        return "FAILED" if job.will_fail else "COMPLETED"
+
+    def state(self, job_id: str, advance: bool = True) -> str:
+        """Return the state of a job, advancing it one step through the queue if requested."""
+        job = self.get_job(job_id)
+        with self._lock:
+            state = self._state(job)
+            if advance and state not in JOB_STATES_FINAL:
+                job.polls += 1
+        return state
+
+    def cancel(self, job_id: str) -> None:
+        """Cancel a job.
+
+        Raises:
+            error_type: If the job is already in a final state.
+        """
+        job = self.get_job(job_id)
+        with self._lock:
+            if self._state(job) in JOB_STATES_FINAL:
+                raise self.error_type(f"Cannot cancel job '{job_id}' in a final state.")
+            job.cancelled = True
+
+    def measurements(self, job_id: str) -> np.ndarray:
+        """Return the per-shot measurements of a job as a 2D array of bits."""
+        job = self.get_job(job_id)
+        with self._lock:
+            if job.measurements is None:
+                seed = None if self.config.seed is None else [self.config.seed, job.index]
+                rng = np.random.default_rng(seed)
+                job.measurements = rng.integers(
+                    0, 2, size=(job.shots, job.num_qubits), dtype=np.uint8
+                )
+            return job.measurements
+
+    def counts(self, job_id: str) -> dict[str, int]:
+        """Return the measurement counts of a job, keyed by bitstring."""
+        return GateModelJobResult.array_to_histogram(self.measurements(job_id))
@@ -23,9 +23,12 @@
 Module defining qBraid Cirq QASM parser.
 
 """
+import copy
 import functools
 import operator
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Union, cast
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, Union, cast
 
 import numpy as np
 from cirq import CX, Circuit, NamedQubit, ops
@@ -165,16 +168,14 @@ class QasmParser:
         parsedQasm = QasmParser().parse(qasm)
     """
 
+    # LALR tables shared by all instances of a parser class, built once per process
+    _lr_tables: dict[type, Any] = {}
+    _lr_tables_lock = threading.Lock()
+
     def __init__(self):
-        self.parser = yacc.yacc(module=self, debug=False, write_tables=False)
-        self.circuit = Circuit()
-        self.qregs: dict[str, int] = {}
-        self.cregs: dict[str, int] = {}
-        self.qelibinc = False
+        self.parser = self._build_parser()
         self.lexer = QasmLexer()
-        self.supported_format = False
-        self.parsedQasm: Optional[Qasm] = None
-        self.qubits: dict[str, ops.Qid] = {}
+        self.reset()
         self.functions = {
             'sin': np.sin,
             'cos': np.cos,
@@ -195,6 +196,46 @@ class QasmParser:
             '^': operator.pow,
         }
 
+    def reset(self) -> None:
+        """Clear the state of the last parse, so that the parser can be reused."""
+        self.circuit = Circuit()
+        self.qregs: dict[str, int] = {}
+        self.cregs: dict[str, int] = {}
+        self.qelibinc = False
+        self.supported_format = False
+        self.parsedQasm: Optional[Qasm] = None
+        self.qubits: dict[str, ops.Qid] = {}
+        self.qasm: Optional[str] = None
+        self.lexer.lex.lineno = 1
+
+    def _build_parser(self) -> Any:
+        """Return an LR parser whose grammar actions are bound to this instance.
+
+        The LALR tables are generated by the first instance of each parser class and shared
+        by later instances, which only bind their own copies of the grammar productions.
+        """
+        cls = type(self)
+        with cls._lr_tables_lock:
+            table = cls._lr_tables.get(cls)
+            if table is None:
+                parser = yacc.yacc(module=self, debug=False, write_tables=False)
+                table = yacc.LRTable()
+                table.lr_action = parser.action
+                table.lr_goto = parser.goto
+                table.lr_productions = [copy.copy(production) for production in parser.productions]
+                for production in table.lr_productions:
+                    production.callable = None
+                cls._lr_tables[cls] = table
+                return parser
+
+        productions = [copy.copy(production) for production in table.lr_productions]
+        bound = copy.copy(table)
+        bound.lr_productions = productions
+        bound.bind_callables(
+            {production.func: getattr(self, production.func) for production in productions if production.func}
+        )
+        return yacc.LRParser(bound, self.p_error)
+
     basic_gates: dict[str, QasmGateStatement] = {
         'CX': QasmGateStatement(qasm_gate='CX', cirq_gate=CX, num_params=0, num_args=2),
         'U': QasmGateStatement(
@@ -630,6 +671,8 @@ at line {p.lineno}, column {self.find_column(p)}"""
         """empty :"""
 
     def parse(self, qasm: str) -> Qasm:
+        if self.parsedQasm is not None and qasm != self.qasm:
+            self.reset()
         if self.parsedQasm is None:
             self.qasm = qasm
             self.lexer.input(self.qasm)
@@ -647,3 +690,51 @@ at line {p.lineno}, column {self.find_column(p)}"""
             + (" " * (3 + p.lexpos - debug_start))
             + "^"
         )
+
+
+class QasmParserPool:
+    """Thread-safe pool of reusable :class:`QasmParser` instances.
+
+    Example:
+        pool = QasmParserPool()
+        circuit = pool.parse("OPENQASM 2.0; qreg q[2]; CX q[0], q[1];").circuit
+    """
+
+    def __init__(self, max_size: int = 8, parser_class: type[QasmParser] = QasmParser):
+        if max_size < 1:
+            raise ValueError("Parser pool size must be at least 1.")
+        self.max_size = max_size
+        self.parser_class = parser_class
+        self._idle: list[QasmParser] = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._idle)
+
+    @contextmanager
+    def parser(self) -> Iterator[QasmParser]:
+        """Borrow a parser for the duration of a ``with`` block.
+
+        Parsers are reset when returned to the pool, so objects produced by a parse are never
+        modified by later parses. Parsers returned to a full pool are discarded.
+        """
+        with self._lock:
+            parser = self._idle.pop() if self._idle else None
+        if parser is None:
+            parser = self.parser_class()
+        try:
+            yield parser
+        finally:
+            parser.reset()
+            with self._lock:
+                if len(self._idle) < self.max_size:
+                    self._idle.append(parser)
+
+    def parse(self, qasm: str) -> Qasm:
+        """Parse a QASM string with a parser borrowed from the pool."""
+        with self.parser() as parser:
+            return parser.parse(qasm)
+
+
+DEFAULT_PARSER_POOL = QasmParserPool()
@@ -41,6 +41,6 @@ def qasm2_to_cirq(qasm: str) -> "cirq.Circuit":
     """
     try:
         qasm = flatten_qasm_program(qasm)
-        return cirq_qasm_parser.QasmParser().parse(qasm).circuit
+        return cirq_qasm_parser.DEFAULT_PARSER_POOL.parse(qasm).circuit
     except cirq_qasm_import.QasmException as err:
         raise QasmError from err
@@ -14,14 +14,17 @@ Module containing OpenQASM conversion function
 """
 import os
 import textwrap
+from functools import cache
 
 from qbraid._version import __version__ as qbraid_version
+from qbraid.passes.lexer import emit, is_identifier, tokenize
 from qbraid.passes.qasm2.decompose import _decompose_rxx_instr
-from qbraid.passes.qasm3.format import remove_unused_gates
+from qbraid.passes.qasm3.format import _gate_definitions, remove_unused_gates
 from qbraid.programs import parse_qasm_type_alias
 from qbraid.transpiler.annotations import weight
 
 
+@cache
 def _get_qasm3_gate_defs() -> str:
     """Helper function to get openqasm 3 gate defs from .qasm file"""
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -31,6 +34,49 @@ def _get_qasm3_gate_defs() -> str:
     return gate_defs
 
 
+def _parse_gate_library(gate_defs: str) -> dict[str, tuple[str, frozenset[str]]]:
+    """Helper function to map each gate in a library to its definition and the
+    identifiers referenced in its body, in the order of the library."""
+    tokens = tokenize(gate_defs)
+    return {
+        name: (emit(tokens[start : end + 1]), frozenset(references - {name}))
+        for name, start, end, references in _gate_definitions(tokens)
+    }
+
+
+_QASM3_GATE_LIBRARY = _parse_gate_library(_get_qasm3_gate_defs())
+
+
+def _required_gate_defs(program: str) -> str:
+    """Helper function to get the openqasm 3 gate defs transitively used by a program.
+
+    Args:
+        program (str): openqasm 3 statements, without the gate library
+
+    Returns:
+        str: the definitions of the library gates used by the program, or by the
+            definitions of other used gates, in the order of the library
+    """
+    tokens = tokenize(program)
+    identifiers = {token for token in tokens if is_identifier(token)}
+    defined = {name for name, _, _, _ in _gate_definitions(tokens)}
+
+    pending = [name for name in identifiers if name in _QASM3_GATE_LIBRARY]
+    required = set(pending)
+    while pending:
+        _, references = _QASM3_GATE_LIBRARY[pending.pop()]
+        for name in references:
+            if name in _QASM3_GATE_LIBRARY and name not in required:
+                required.add(name)
+                pending.append(name)
+
+    return "".join(
+        definition + "\n"
+        for name, (definition, _) in _QASM3_GATE_LIBRARY.items()
+        if name in required and name not in defined
+    )
+
+
 def _build_qasm_3_reg(line: str, qreg_type: bool) -> str:
     """Helper function to build openqasm 3 register statements
 
@@ -121,12 +167,8 @@ def qasm2_to_qasm3(qasm_str: str) -> str:
     """
     )
 
-    gate_defs = _get_qasm3_gate_defs()
-
-    for line in gate_defs:
-        qasm3_str += line
-
     last_line_was_blank = False
+    qasm3_lines = []
 
     for line in qasm_str.splitlines():
         if line.strip().startswith("//"):
@@ -141,8 +183,10 @@ def qasm2_to_qasm3(qasm_str: str) -> str:
         else:
             last_line_was_blank = False
 
-        line = _convert_line_to_qasm3(line)
-        qasm3_str += line
+        qasm3_lines.append(_convert_line_to_qasm3(line))
+
+    program = "".join(qasm3_lines)
+    qasm3_str += _required_gate_defs(program) + program
 
     qasm3_str = remove_unused_gates(qasm3_str)
 
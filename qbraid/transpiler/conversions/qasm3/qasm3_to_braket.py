@@ -16,11 +16,8 @@ from typing import TYPE_CHECKING
 
 from qbraid_core._import import LazyLoader
 
-from qbraid.passes.qasm3.compat import (
-    convert_qasm_pi_to_decimal,
-    remove_stdgates_include,
-    replace_gate_name,
-)
+from qbraid.passes import PassManager
+from qbraid.passes.qasm3.compat import pi_to_decimal_pass, remove_include_pass, rename_gates_pass
 from qbraid.programs import QasmError
 from qbraid.transpiler.annotations import weight
 
@@ -31,27 +28,34 @@ if TYPE_CHECKING:
     import braket.circuits
 
 
+BRAKET_GATE_NAMES = {
+    "cx": "cnot",
+    "ccx": "ccnot",
+    "sdg": "si",
+    "tdg": "ti",
+    "sx": "v",
+    "csx": "cv",
+    "sxdg": "vi",
+    "p": "phaseshift",
+    "cp": "cphaseshift",
+}
+
+_BRAKET_NOTATION = PassManager(
+    [
+        remove_include_pass("stdgates.inc"),
+        rename_gates_pass(BRAKET_GATE_NAMES),
+        pi_to_decimal_pass(),
+    ]
+)
+
+
 def transform_notation(qasm3: str) -> str:
     """
     Process an OpenQASM 3 program that was generated by
     an external tool to make it compatible with Amazon Braket.
 
     """
-    replacements = {
-        "cx": "cnot",
-        "sdg": "si",
-        "tdg": "ti",
-        "sx": "v",
-        "sxdg": "vi",
-        "p": "phaseshift",
-        "cp": "cphaseshift",
-    }
-
-    qasm3 = remove_stdgates_include(qasm3)
-    for old, new in replacements.items():
-        qasm3 = replace_gate_name(qasm3, old, new)
-    qasm3 = convert_qasm_pi_to_decimal(qasm3)
-    return qasm3
+    return _BRAKET_NOTATION.run(qasm3)
 
 
 @weight(1)
@@ -16,7 +16,12 @@ from typing import TYPE_CHECKING
 
 from qbraid_core._import import LazyLoader
 
-from qbraid.passes.qasm3.compat import add_stdgates_include, insert_gate_def, replace_gate_name
+from qbraid.passes import PassManager
+from qbraid.passes.qasm3.compat import (
+    add_include_pass,
+    insert_gate_defs_pass,
+    rename_gates_pass,
+)
 from qbraid.transpiler.annotations import weight
 
 qiskit_qasm3 = LazyLoader("qiskit_qasm3", globals(), "qiskit.qasm3")
@@ -26,29 +31,33 @@ if TYPE_CHECKING:
     import qiskit as qiskit_
 
 
+QISKIT_GATE_NAMES = {
+    "cnot": "cx",
+    "ccnot": "ccx",
+    "si": "sdg",
+    "ti": "tdg",
+    "v": "sx",
+    "vi": "sxdg",
+    "phaseshift": "p",
+    "cphaseshift": "cp",
+}
+
+_QISKIT_NOTATION = PassManager(
+    [
+        rename_gates_pass(QISKIT_GATE_NAMES),
+        add_include_pass("stdgates.inc"),
+        insert_gate_defs_pass(["iswap", "sxdg"]),
+    ]
+)
+
+
 def transform_notation(qasm3: str) -> str:
     """
     Process an OpenQASM 3 program that was generated by
     an external tool to make it compatible with Qiskit.
 
     """
-    replacements = {
-        "cnot": "cx",
-        "si": "sdg",
-        "ti": "tdg",
-        "v": "sx",
-        "vi": "sxdg",
-        "phaseshift": "p",
-        "cphaseshift": "cp",
-    }
-
-    for old, new in replacements.items():
-        qasm3 = replace_gate_name(qasm3, old, new)
-    qasm3 = add_stdgates_include(qasm3)
-    qasm3 = insert_gate_def(qasm3, "iswap")
-    qasm3 = insert_gate_def(qasm3, "sxdg")
-
-    return qasm3
+    return _QISKIT_NOTATION.run(qasm3)
 
 
 @weight(1)
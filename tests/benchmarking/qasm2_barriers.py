@@ -0,0 +1,46 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Benchmarking barrier removal on multi-megabyte OpenQASM 2 programs
+
+"""
+from time import perf_counter
+
+from qbraid.passes.qasm2 import remove_qasm_barriers
+
+NUM_BLOCKS = 50_000
+REPEATS = 3
+
+BLOCK = """// layer with a "quoted; barrier" comment
+h q[0]; cx q[0],q[1]; barrier q[0],q[1];
+include "barrier;{}.inc";
+rz(pi/4) q[1];
+barrier q;
+"""
+
+programs = {
+    "regular": "OPENQASM 2.0;\nqreg q[2];\n" + BLOCK * NUM_BLOCKS,
+    # Unterminated final statement, which made the previous backtracking pattern
+    # take exponential time in the length of the statement.
+    "unterminated": "OPENQASM 2.0;\nqreg q[2];\n" + BLOCK * NUM_BLOCKS + "h" * 10_000,
+}
+
+for label, program in programs.items():
+    timings = []
+    for _ in range(REPEATS):
+        start = perf_counter()
+        remove_qasm_barriers(program)
+        timings.append(perf_counter() - start)
+
+    best = min(timings)
+    size = len(program) / 1e6
+    print(f"remove_qasm_barriers on {size:.1f} MB ({label}): {best:.3f} s")
+    print(f"Throughput: {size / best:.1f} MB per second")
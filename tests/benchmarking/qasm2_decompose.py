@@ -0,0 +1,63 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Benchmarking throughput of qelib1 gate decomposition on large OpenQASM 2 programs
+
+"""
+import random
+from time import perf_counter
+
+from qbraid.passes.qasm2 import decompose_qasm_qelib1
+
+NUM_INSTRUCTIONS = 100_000
+NUM_QUBITS = 8
+REPEATS = 3
+
+
+def random_instruction(rng: random.Random) -> str:
+    """Return a random instruction, half of which are gates that are decomposed."""
+    a, b, c, d = (f"q[{index}]" for index in rng.sample(range(NUM_QUBITS), 4))
+    angles = [f"{rng.uniform(0, 6.28):.6f}" for _ in range(4)]
+    return rng.choice(
+        [
+            f"cu({angles[0]},{angles[1]}, {angles[2]},{angles[3]}) {a},{b};",
+            f"rxx({angles[0]}) {a},{b};",
+            f"rccx {a},{b},{c};",
+            f"rc3x {a},{b},{c},{d};",
+            f"h {a};",
+            f"cx {a},{b};",
+            f"rz(pi/{rng.randint(1, 8)}) {a};",
+            f"u3({angles[0]},{angles[1]},{angles[2]}) {a};",
+        ]
+    )
+
+
+def main() -> None:
+    """Time decompose_qasm_qelib1 on a random program and print its throughput."""
+    rng = random.Random(0)
+    program = "\n".join(
+        ["OPENQASM 2.0;", 'include "qelib1.inc";', f"qreg q[{NUM_QUBITS}];"]
+        + [random_instruction(rng) for _ in range(NUM_INSTRUCTIONS)]
+    )
+
+    timings = []
+    for _ in range(REPEATS):
+        start = perf_counter()
+        decompose_qasm_qelib1(program)
+        timings.append(perf_counter() - start)
+
+    best = min(timings)
+    print(f"decompose_qasm_qelib1 on {NUM_INSTRUCTIONS} instructions: {best:.3f} s")
+    print(f"Throughput: {NUM_INSTRUCTIONS / best:,.0f} instructions per second")
+
+
+if __name__ == "__main__":
+    main()
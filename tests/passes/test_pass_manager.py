@@ -0,0 +1,130 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the OpenQASM token-stream lexer and pass manager
+
+"""
+import math
+
+import pytest
+
+from qbraid.passes import PassManager, TokenType, emit, token_type, tokenize
+from qbraid.passes.lexer import gate_name_indices
+from qbraid.passes.qasm3.compat import (
+    add_include_pass,
+    insert_gate_defs_pass,
+    pi_to_decimal_pass,
+    remove_include_pass,
+    rename_gates_pass,
+)
+
+QASM3_PROGRAM = """OPENQASM 3.0;
+include "stdgates.inc";
+/* block
+   comment */
+qubit[2] q; // trailing
+bit[2] c;
+ctrl @ x q[0], q[1];
+cp(pi / 2) q[0], q[1];
+if (c[0] == 1) x q[1];
+c = measure q;
+"""
+
+
+def test_tokenize_is_lossless():
+    """Test that emitting the tokens of a program reproduces it exactly"""
+    tokens = tokenize(QASM3_PROGRAM)
+    assert emit(tokens) == QASM3_PROGRAM
+    assert token_type(tokens[tokens.index("// trailing")]) == TokenType.COMMENT
+    assert token_type(tokens[tokens.index("==")]) == TokenType.OPERATOR
+    assert token_type(tokens[tokens.index('"stdgates.inc"')]) == TokenType.STRING
+    assert token_type("3.5e-2") == TokenType.NUMBER
+
+
+def test_tokenize_unterminated_block_comment():
+    """Test that an unterminated block comment extends to the end of the program"""
+    assert tokenize("x q; /* a /* b") == ["x", " ", "q", ";", " ", "/* a /* b"]
+
+
+def test_gate_name_indices():
+    """Test that only identifiers in gate position are reported as gate names"""
+    tokens = tokenize(QASM3_PROGRAM + "gate g(t) a { rz(t) a; }\nx = 1;\n")
+    names = [tokens[index] for index in gate_name_indices(tokens)]
+    assert names == ["x", "cp", "x", "g", "rz"]
+
+
+def test_pass_manager_chains_passes():
+    """Test that a pass manager applies its passes in order on one token stream"""
+    calls = []
+
+    def record(name):
+        def token_pass(tokens):
+            calls.append((name, len(tokens)))
+            return tokens
+
+        return token_pass
+
+    manager = PassManager([record("first")]).append(record("second"))
+    assert len(manager) == 2
+    assert manager.run("x q;") == "x q;"
+    assert calls == [("first", 4), ("second", 4)]
+    assert PassManager().run("not tokenized") == "not tokenized"
+
+
+def test_rename_gates_pass_skips_operands():
+    """Test that renaming gates leaves qubits and variables with the same name untouched"""
+    manager = PassManager([rename_gates_pass({"cx": "cnot", "x": "not"})])
+    program = "qubit[2] x;\ncx x[0], x[1];\nx x[0];\nctrl @ x x[0], x[1];\n"
+    assert manager.run(program) == (
+        "qubit[2] x;\ncnot x[0], x[1];\nnot x[0];\nctrl @ not x[0], x[1];\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "program, expected",
+    [
+        ("rz(3 * pi/4) q[0];", f"rz({3 * math.pi / 4}) q[0];"),
+        ("u(-pi, (pi + 1) * 2, 0) q;", f"u({-math.pi}, {(math.pi + 1) * 2}, 0) q;"),
+        ("rz(theta * pi) q;", f"rz(theta * {math.pi}) q;"),
+        ("rz(sin(pi / 2)) q;", "rz(1.0) q;"),
+        (
+            "u(mod(3 * pi, 2), f(pi, 1), 0) q;",
+            f"u({math.fmod(3 * math.pi, 2)}, f({math.pi}, 1), 0) q;",
+        ),
+        ("float[64] a = 2 ** pi;", f"float[64] a = {2 ** math.pi};"),
+        ("rz(pi / 0) q;", f"rz({math.pi} / 0) q;"),
+        ("int[8] a = 2 ^ pi;", f"int[8] a = 2 ^ {math.pi};"),
+    ],
+)
+def test_pi_to_decimal_pass(program, expected):
+    """Test folding constant expressions involving pi"""
+    assert PassManager([pi_to_decimal_pass()]).run(program) == expected
+
+
+def test_include_and_gate_def_passes():
+    """Test adding and removing includes and inserting missing gate definitions"""
+    program = "OPENQASM 3.0;\nqubit[2] q;\niswap q[0], q[1];\n"
+    manager = PassManager([add_include_pass(), insert_gate_defs_pass(["iswap", "sxdg"])])
+    transformed = manager.run(program)
+    lines = transformed.splitlines()
+    assert lines[:3] == [
+        "OPENQASM 3.0;",
+        'include "stdgates.inc";',
+        "gate iswap _gate_q_0, _gate_q_1 {",
+    ]
+    assert "gate sxdg" not in transformed
+    assert manager.run(transformed) == transformed
+
+    removed = PassManager([remove_include_pass()]).run(transformed)
+    assert "include" not in removed
+
+    with pytest.raises(ValueError):
+        insert_gate_defs_pass(["not_a_gate"])
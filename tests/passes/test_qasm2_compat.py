@@ -12,7 +12,15 @@
 Unit tests for QASM preprocessing functions
 
 """
-from qbraid.passes.qasm2.compat import flatten_qasm_program, remove_qasm_barriers
+import pytest
+
+from qbraid.passes.exceptions import QasmDecompositionError
+from qbraid.passes.qasm2 import decompose_qasm_qelib1
+from qbraid.passes.qasm2.compat import (
+    flatten_qasm_program,
+    remove_qasm_barriers,
+    unfold_qasm_gate_defs,
+)
 
 
 def strings_equal(s1, s2):
@@ -126,6 +134,19 @@ measure cout[0] -> ans[4];
     )
 
 
+@pytest.mark.parametrize(
+    "qasm_in, expected",
+    [
+        ("x q; // c; barrier q;\nbarrier q;x q;", "x q; // c; barrier q;\nx q;"),
+        ("if(c==1) barrier q; barrier q;", "if(c==1) barrier q;"),
+        ("barrier q;\nx q;\n" + "h" * 100, "\nx q;\n" + "h" * 100),
+    ],
+)
+def test_remove_qasm_barriers_statements(qasm_in, expected):
+    """Test that only barrier statements are removed, in linear time"""
+    assert remove_qasm_barriers(qasm_in) == expected
+
+
 def test_convert_qasm_one_param():
     """Test converting qasm string from one-parameter gate"""
 
@@ -250,3 +271,120 @@ h q[1];
 """
     qasm_out = flatten_qasm_program(qasm_in)
     assert strings_equal(qasm_out, expected_out)
+
+
+def test_unfold_gate_defs_arbitrary_names():
+    """Test inlining multi-line gate definitions with arbitrary qubit and register names"""
+
+    qasm_in = """
+OPENQASM 2.0;
+include "qelib1.inc";
+gate majority a,b,c
+{
+  cx c,b;
+  cx c,a;
+  ccx a,b,c;
+}
+gate shifted(theta, phi) ctrl, tgt { majority ctrl, tgt, tgt; rz(theta*phi) tgt; }
+qreg anc[2];
+qreg data[3];
+creg out[1];
+majority anc[0], data[1], anc[1]; // comment
+shifted(pi/2+0.1, -2) data[0], anc[1];
+majority anc, data, data;
+if(out==1) majority data[2], anc[0], data[0];
+"""
+    expected_out = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg anc[2];
+qreg data[3];
+creg out[1];
+cx anc[1],data[1];
+cx anc[1],anc[0];
+ccx anc[0],data[1],anc[1];
+// comment
+cx anc[1],anc[1];
+cx anc[1],data[0];
+ccx data[0],anc[1],anc[1];
+rz((pi/2+0.1)*(-2)) anc[1];
+cx data,data;
+cx data,anc;
+ccx anc,data,data;
+if(out==1) cx data[0],anc[0];
+if(out==1) cx data[0],data[2];
+if(out==1) ccx data[2],anc[0],data[0];
+"""
+    assert strings_equal(unfold_qasm_gate_defs(qasm_in), expected_out)
+
+
+def test_unfold_gate_defs_whole_expression_param():
+    """Test that a parameter forming a whole argument is substituted without parentheses"""
+    qasm_in = "gate g(t) a { rz(t) a; rx(t/2) a; } qreg r[1]; g(-pi/4) r[0];"
+    assert unfold_qasm_gate_defs(qasm_in).split("\n") == [
+        "qreg r[1];",
+        "rz(-pi/4) r[0];",
+        "rx((-pi/4)/2) r[0];",
+    ]
+
+
+def test_unfold_gate_defs_block_comments():
+    """Test that block comments are kept between statements and skipped inside statements"""
+    qasm_in = "qreg q[1];\n/* g is\n a gate */ gate g a { h /* in body */ a; }\ng q[0]; // done"
+    assert unfold_qasm_gate_defs(qasm_in).split("\n") == [
+        "qreg q[1];",
+        "/* g is",
+        " a gate */",
+        "h q[0];",
+        "// done",
+    ]
+
+
+@pytest.mark.parametrize(
+    "qasm_in, match",
+    [
+        ("gate g a { x a; } qreg q[2]; g q[0], q[1];", "expects 0 parameters and 1 qubits"),
+        ("gate g a { g a; } qreg q[1]; g q[0];", "defined recursively"),
+    ],
+)
+def test_unfold_gate_defs_errors(qasm_in, match):
+    """Test errors raised for invalid gate applications and definitions"""
+    with pytest.raises(QasmDecompositionError, match=match):
+        unfold_qasm_gate_defs(qasm_in)
+
+
+def test_decompose_qelib1_evaluates_expression_params():
+    """Test that qelib1 gates are decomposed per statement, with expression parameters
+    evaluated where the template does arithmetic on them"""
+    qasm_in = "qreg q[2]; // cu(0,0,0,0) q[0],q[1];\ncu(pi, pi/2, 0, 0) q[0], q[1]; h q[0];"
+    qasm_out = decompose_qasm_qelib1(qasm_in)
+    assert qasm_out.startswith("qreg q[2]; // cu(0,0,0,0) q[0],q[1];\n\n// cu gate\n")
+    assert "u(-1.5707963267948966,0,-0.7853981633974483) q[1];" in qasm_out
+    assert qasm_out.endswith("u(1.5707963267948966,pi/2,0) q[1];\n\n h q[0];")
+
+
+def test_decompose_qelib1_skips_definitions_and_conditions():
+    """Test that gate definitions and conditioned gates are left unchanged"""
+    qasm_in = "gate g(t) a, b { rxx(t) a, b; }\nif(c==1) rccx q[0],q[1],q[2];"
+    assert decompose_qasm_qelib1(qasm_in) == qasm_in
+
+
+def test_decompose_qelib1_substitutes_variable_params():
+    """Test that parameters referring to variables are substituted as expressions"""
+    qasm_out = decompose_qasm_qelib1("cu(theta, 0.5, a + b, 0) q[0], q[1];")
+    assert "p(0) q[0];\np(((a + b)+0.5)/2) q[0];\np(((a + b)-0.5)/2) q[1];" in qasm_out
+    assert "u(-theta/2,0,-(0.5+(a + b))/2) q[1];" in qasm_out
+    assert "u(theta/2,0.5,0) q[1];" in qasm_out
+
+
+@pytest.mark.parametrize(
+    "qasm_in, match",
+    [
+        ("rxx(0.1) q[0];", "expects 1 parameters and 2 qubits"),
+        ("cu(1/0, 0, 0, 0) q[0], q[1];", "Cannot evaluate parameters"),
+    ],
+)
+def test_decompose_qelib1_errors(qasm_in, match):
+    """Test errors raised for invalid applications of qelib1 gates"""
+    with pytest.raises(QasmDecompositionError, match=match):
+        decompose_qasm_qelib1(qasm_in)
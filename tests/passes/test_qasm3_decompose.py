@@ -14,8 +14,18 @@ Unit tests for QASM transform to basic gates
 """
 
 import pytest
+from openqasm3 import dumps
+from openqasm3.parser import parse
+from openqasm3.visitor import QASMTransformer, QASMVisitor
 
-from qbraid.passes.qasm3.decompose import decompose
+from qbraid.passes.exceptions import QasmDecompositionError
+from qbraid.passes.qasm3.decompose import (
+    DECOMPOSITION_RULES,
+    DEFAULT_BASIS_GATES,
+    decompose,
+    decompose_program,
+    register_decomposition_rule,
+)
 
 
 @pytest.mark.parametrize(
@@ -107,3 +117,76 @@ def test_convert_to_basis_gates(original_program, expected_program):
     """Test conversion of QASM3 program to basis gates"""
     converted_program = decompose(original_program)
     assert converted_program == expected_program
+
+
+def test_decompose_to_basis_with_registered_rule():
+    """Test decomposing to a basis with a user-registered rule that uses other rules"""
+    register_decomposition_rule("gate ccz a, b, c { h c; ccx a, b, c; h c; }")
+    register_decomposition_rule(
+        "gate ccx a, b, c { h c; cx b, c; tdg c; cx a, c; t c; cx b, c; tdg c; cx a, c;"
+        " t b; t c; h c; cx a, b; t a; tdg b; cx a, b; }"
+    )
+    try:
+        program = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[3] q;
+ccz q[0], q[1], q[2];
+if (true) {
+  cz q[1], q[2];
+}
+"""
+        converted_program = decompose(program, basis_gates=DEFAULT_BASIS_GATES)
+        assert "ccx" not in converted_program
+        assert "cz" not in converted_program
+        assert converted_program.count("cx") == 8
+        assert "  rz(-(pi / 2)) q[2];\n" in converted_program
+
+        with pytest.raises(ValueError):
+            register_decomposition_rule("gate ccz a, b, c { z c; }")
+
+        with pytest.raises(QasmDecompositionError):
+            decompose("OPENQASM 3.0;\nqubit[2] q;\nch q[0], q[1];", basis_gates=["h", "cx"])
+    finally:
+        DECOMPOSITION_RULES.pop("ccz")
+        DECOMPOSITION_RULES.pop("ccx")
+
+
+def test_decompose_recursive_rule_raises():
+    """Test that a rule which refers to itself is rejected when applied"""
+    register_decomposition_rule("gate loop a { loop a; }")
+    try:
+        with pytest.raises(QasmDecompositionError):
+            decompose("OPENQASM 3.0;\nqubit q;\nloop q;")
+    finally:
+        DECOMPOSITION_RULES.pop("loop")
+
+
+def test_decompose_program_builds_distinct_nodes():
+    """Test that decomposed instances share no statements or operands, so that they can be
+    modified in place, while constants of the rules are shared"""
+
+    class _Scale(QASMTransformer):
+        def visit_FloatLiteral(self, node):  # pylint: disable=invalid-name
+            """Scale a float literal by 100."""
+            node.value *= 100
+            return node
+
+    program = parse(
+        "OPENQASM 3.0;\nqubit[4] q;\ncrz(0.5) q[0], q[1];\ncrz(0.5) q[2], q[3];\ncz q[0], q[1];"
+    )
+    program = decompose_program(program)
+
+    statements = program.statements[1:]
+    qubits = [qubit for statement in statements for qubit in statement.qubits]
+    operand_ids = [id(qubit) for qubit in qubits] + [id(qubit.name) for qubit in qubits]
+    assert len({id(statement) for statement in statements}) == len(statements)
+    assert len(set(operand_ids)) == len(operand_ids)
+    assert statements[0].name is statements[4].name
+
+    _Scale().visit(program.statements[1])
+    _Scale().visit(program.statements[3])
+    converted_program = dumps(program)
+    assert converted_program.count("rz(50.0 / 2) q[1];") == 1
+    assert converted_program.count("rz(-(50.0 / 2)) q[1];") == 1
+    assert converted_program.count("rz(0.5 / 2) q[3];") == 1
+    assert converted_program.count("cx q[0], q[1];") == 4
@@ -0,0 +1,74 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for evaluating constant OpenQASM 3 expressions
+
+"""
+import math
+
+import openqasm3
+import pytest
+
+from qbraid.passes.qasm3 import evaluate_expression
+from qbraid.passes.qasm3.expression import evaluate_tokens
+
+EXPRESSIONS = [
+    ("3 * pi / 4", 3 * math.pi / 4),
+    ("-pi", -math.pi),
+    ("-(pi + 1) * 2", -(math.pi + 1) * 2),
+    ("tau - euler", math.tau - math.e),
+    ("2 ** 3 ** 2", 2**9),
+    ("-2 ** 2", -4),
+    ("7 % 4 + 1_000", 1003),
+    ("sin(pi / 2) + sqrt(4)", 3.0),
+    ("exp(0) * mod(7, 4)", 3.0),
+    ("1.5e-1 * π", 0.15 * math.pi),
+]
+
+
+@pytest.mark.parametrize("expression, expected", EXPRESSIONS)
+def test_evaluate_expression_text(expression, expected):
+    """Test evaluating constant expressions given as text"""
+    assert evaluate_expression(expression) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("expression, expected", EXPRESSIONS)
+def test_evaluate_expression_ast(expression, expected):
+    """Test evaluating constant expressions given as openqasm3 AST nodes"""
+    program = openqasm3.parse(f"qubit q; rz({expression}) q;")
+    argument = program.statements[1].arguments[0]
+    assert evaluate_expression(argument) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["theta * pi", "pi / 0", "__import__('os')", "sin(pi", "1 +", "sqrt(-1)", "", "2 ^ 3"],
+)
+def test_evaluate_expression_rejects(expression):
+    """Test that non-constant or malformed expressions raise ValueError"""
+    with pytest.raises(ValueError):
+        evaluate_expression(expression)
+
+
+def test_evaluate_expression_caches_text():
+    """Test that repeated text expressions are evaluated once"""
+    evaluate_tokens.cache_clear()
+    for _ in range(3):
+        evaluate_expression("pi / 8")
+    info = evaluate_tokens.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
+def test_evaluate_tokens_caret_power():
+    """Test that ``^`` is exponentiation only when requested, as in OpenQASM 2"""
+    assert evaluate_tokens(("2", "^", "3", "^", "2"), caret_power=True) == 2**9
+    with pytest.raises(ValueError, match="Unexpected token '\\^'"):
+        evaluate_tokens(("2", "^", "3"))
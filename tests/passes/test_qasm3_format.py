@@ -189,3 +189,27 @@ cx q[1],q[0];
 z q[1];
 """
     assert remove_unused_gates(input_qasm).strip() == expected_qasm.strip()
+
+
+def test_remove_unused_gate_chain_in_one_pass():
+    """Test removing a chain of unused gates, keeping gates reachable through other gates."""
+    input_qasm = """
+OPENQASM 3.0;
+qubit[1] q;
+gate g1 a { x a; }
+gate g2 a { g1 a; }
+gate g3 a { g2 a; }
+gate k1 a { h a; }
+gate k2 a { k1 a; }
+// g3 q[0];
+k2 q[0];
+"""
+    expected_qasm = """
+OPENQASM 3.0;
+qubit[1] q;
+gate k1 a { h a; }
+gate k2 a { k1 a; }
+// g3 q[0];
+k2 q[0];
+"""
+    assert remove_unused_gates(input_qasm).strip() == expected_qasm.strip()
@@ -14,12 +14,13 @@ Unit tests for qbraid.programs.qasm3.OpenQasm3Program
 """
 import numpy as np
 import pytest
+from openqasm3.ast import Identifier, IndexedIdentifier, IntegerLiteral, QuantumReset
 from qiskit.qasm3 import dumps, loads
 
 from qbraid.interface.random.qasm3_random import _qasm3_random
 from qbraid.interface.random.qiskit_random import _qiskit_random
 from qbraid.programs.exceptions import ProgramTypeError
-from qbraid.programs.libs.qasm3 import OpenQasm3Program
+from qbraid.programs.libs.qasm3 import OpenQasm3Program, _ResetReplacer
 from qbraid.programs.registry import unregister_program_type
 from qbraid.transpiler.conversions.qasm2.qasm2_to_qasm3 import _get_qasm3_gate_defs
 
@@ -369,25 +370,111 @@ reset q1;
 measure q1 -> c1;
     """
 
-    expected_output = """
-OPENQASM 3;
+    expected_output = """OPENQASM 3;
 include "stdgates.inc";
 qubit q0;
 qubit q1;
 bit c0;
 bit c1;
-measure q0 -> c0;
-if (c0 == 1) x q0;
+bit[1] reset_anc;
+reset_anc[0] = measure q0;
+if (reset_anc[0] == 1) {
+  x q0;
+}
 h q1;
 cx q0, q1;
-measure q1 -> c1;
-if (c1 == 1) x q1;
-measure q1 -> c1;
-    """
+reset_anc[0] = measure q1;
+if (reset_anc[0] == 1) {
+  x q1;
+}
+c1 = measure q1;
+"""
 
     program = OpenQasm3Program(qasm_input)
     program.replace_reset_with_ops()
     assert program.program == expected_output
+    assert program.clbits == [("c0", None), ("c1", None), ("reset_anc", 1)]
+    assert program.num_clbits == 3
+
+
+def test_replace_reset_broadcast_and_fresh_register():
+    """Test replacing a reset of a whole register with a fresh ancilla register"""
+    qasm_input = """
+OPENQASM 3;
+include "stdgates.inc";
+qubit[3] q;
+bit[3] reset_anc;
+reset q;
+for int i in [0:2] {
+  reset q[i];
+}
+"""
+    program = OpenQasm3Program(qasm_input)
+    program.replace_reset_with_ops()
+    statements = program.program.splitlines()
+    assert statements[4] == "bit[3] reset_anc_1;"
+    assert statements[5:9] == [
+        "reset_anc_1[0] = measure q[0];",
+        "if (reset_anc_1[0] == 1) {",
+        "  x q[0];",
+        "}",
+    ]
+    assert "reset" not in program.program.replace("reset_anc", "")
+    assert program.clbits == OpenQasm3Program(program.program).clbits
+
+
+def test_replace_reset_open_slice_of_unknown_size():
+    """Test that a reset of an open-ended slice of a register of unknown size is kept whole"""
+    qasm_input = """
+OPENQASM 3;
+include "stdgates.inc";
+qubit[4] q;
+let r = q[1:3];
+reset r[1:];
+reset q[0:1];
+"""
+    program = OpenQasm3Program(qasm_input)
+    program.replace_reset_with_ops()
+    statements = program.program.splitlines()
+    assert statements[5:8] == [
+        "reset_anc[0] = measure r[1:];",
+        "if (reset_anc[0] == 1) {",
+        "  x r[1:];",
+    ]
+    assert "reset_anc[1] = measure q[1];" in statements
+    assert program.clbits == [("reset_anc", 2)]
+
+
+def test_replace_reset_leaves_subroutines_unchanged():
+    """Test that resets in subroutines, which cannot write to the global ancilla register,
+    are left unchanged, and that the previously returned clbits list is not modified"""
+    qasm_input = """
+OPENQASM 3;
+include "stdgates.inc";
+qubit[2] q;
+def f(qubit r) {
+  reset r;
+}
+reset q[0];
+f(q[1]);
+"""
+    program = OpenQasm3Program(qasm_input)
+    clbits = program.clbits
+    program.replace_reset_with_ops()
+    statements = program.program.splitlines()
+    assert statements[3:6] == ["def f(qubit r) {", "  reset r;", "}"]
+    assert statements[6:8] == ["bit[1] reset_anc;", "reset_anc[0] = measure q[0];"]
+    assert program.clbits == [("reset_anc", 1)]
+    assert not clbits
+
+
+def test_reset_replacer_builds_distinct_qubit_nodes():
+    """Test that the measurement and the X gate replacing a reset do not share qubit nodes"""
+    replacer = _ResetReplacer({"q": 2}, "reset_anc")
+    for operand in (Identifier("q"), IndexedIdentifier(Identifier("q"), [[IntegerLiteral(1)]])):
+        measurement, branch = replacer.visit(QuantumReset(qubits=operand))[:2]
+        assert measurement.measure.qubit == branch.if_block[0].qubits[0]
+        assert measurement.measure.qubit is not branch.if_block[0].qubits[0]
 
 
 def test_qasm3_depth_sparse_operations():
@@ -37,13 +37,17 @@ from braket.task_result import (
     AnalogHamiltonianSimulationTaskResult,
     TaskMetadata,
 )
+from braket.tasks.analog_hamiltonian_simulation_quantum_task_result import (
+    AnalogHamiltonianSimulationShotStatus,
+    ShotResult,
+)
 from braket.timings.time_series import TimeSeries
 
 from qbraid.programs import ProgramSpec
 from qbraid.runtime.braket.device import BraketDevice
 from qbraid.runtime.braket.job import BraketQuantumTask
 from qbraid.runtime.braket.provider import BraketProvider
-from qbraid.runtime.braket.result import BraketAhsJobResult
+from qbraid.runtime.braket.result import AhsShotResults, BraketAhsJobResult, ResultDecodingError
 from qbraid.runtime.enums import DeviceActionType, DeviceStatus, DeviceType
 from qbraid.runtime.exceptions import DeviceProgramTypeMismatchError
 from qbraid.runtime.profile import TargetProfile
@@ -513,3 +517,71 @@ def test_get_counts(ahs_result):
     counts = result.get_counts()
     expected_counts = {"rrrgeggrrgr": 1, "grggrgrrrrg": 1}
     assert counts == expected_counts
+
+
+def test_measurements_list_of_shot_results(ahs_result):
+    """Test that AHS measurements are returned as a list of shot results."""
+    result = BraketAhsJobResult(ahs_result)
+    shots = result.measurements()
+    assert isinstance(shots, list)
+    assert [shot.status for shot in shots] == [AnalogHamiltonianSimulationShotStatus.SUCCESS] * 2
+    np.testing.assert_array_equal(shots[1].post_sequence, [1, 0, 1, 1, 0, 1, 0, 0, 0, 0, 1])
+
+
+def test_shot_results_lazy(ahs_result):
+    """Test that AHS shot results are exposed as a lazy sequence."""
+    result = BraketAhsJobResult(ahs_result)
+    shots = result.shot_results()
+    assert isinstance(shots, AhsShotResults)
+    assert len(shots) == 2
+    assert isinstance(shots[0], ShotResult)
+    assert shots[0].status == AnalogHamiltonianSimulationShotStatus.SUCCESS
+    np.testing.assert_array_equal(shots[1].post_sequence, [1, 0, 1, 1, 0, 1, 0, 0, 0, 0, 1])
+    assert [shot.status for shot in shots[:1]] == [AnalogHamiltonianSimulationShotStatus.SUCCESS]
+
+
+def test_state_arrays(ahs_result):
+    """Test decoding AHS shots into arrays of atom state codes."""
+    result = BraketAhsJobResult(ahs_result)
+    (states,) = result.state_arrays()
+    assert states.shape == (2, 11)
+    np.testing.assert_array_equal(states[0], [1, 1, 1, 2, 0, 2, 2, 1, 1, 2, 1])
+
+
+def test_get_counts_from_shot_results():
+    """Test counting decoded shot results, skipping failed shots and mixed site counts."""
+    success = AnalogHamiltonianSimulationShotStatus.SUCCESS
+    failure = AnalogHamiltonianSimulationShotStatus.FAILURE
+    rng = np.random.default_rng(0)
+    pre = rng.integers(0, 2, size=(1000, 8))
+    post = rng.integers(0, 2, size=(1000, 8))
+    shots = [ShotResult(success, pre[i], post[i]) for i in range(1000)]
+    shots += [ShotResult(failure, None, None), ShotResult(success, np.ones(2), np.zeros(2))]
+
+    mock_result = MagicMock()
+    mock_result.measurements = shots
+    counts = BraketAhsJobResult(mock_result).get_counts()
+
+    expected = {}
+    for pre_i, post_i in zip(pre, post):
+        state = "".join("e" if p == 0 else "r" if q == 0 else "g" for p, q in zip(pre_i, post_i))
+        expected[state] = expected.get(state, 0) + 1
+    expected["rr"] = 1
+    assert counts == expected
+
+
+def test_state_arrays_rejects_ragged_shots():
+    """Test that shots with pre- and post-sequences of different lengths are rejected."""
+    success = AnalogHamiltonianSimulationShotStatus.SUCCESS
+    mock_result = MagicMock()
+    mock_result.measurements = [ShotResult(success, np.ones(3), np.zeros(2))]
+    with pytest.raises(ResultDecodingError, match="pre-sequence of length 3"):
+        BraketAhsJobResult(mock_result).state_arrays()
+
+
+def test_get_counts_raises_decoding_error():
+    """Test that malformed measurements raise a ResultDecodingError."""
+    mock_result = MagicMock()
+    mock_result.measurements = [object()]
+    with pytest.raises(ResultDecodingError):
+        BraketAhsJobResult(mock_result).get_counts()
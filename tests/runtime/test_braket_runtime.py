@@ -390,6 +390,44 @@ def test_raw_counts():
     assert result.raw_counts() == expected_output
 
 
+def test_measurements_memoized_and_view():
+    """Test that flipped measurements are computed once and returned read-only, and that
+    views do not copy."""
+    mock_measurements = np.array([[0, 1, 1], [1, 0, 1]])
+    mock_result = MagicMock()
+    mock_result.measurements = mock_measurements
+    result = BraketGateModelJobResult(mock_result)
+
+    measurements = result.measurements()
+    assert measurements.flags.c_contiguous
+    assert not measurements.flags.writeable
+    with pytest.raises(ValueError):
+        measurements[0, 0] = 5
+    mock_result.measurements = np.zeros((2, 3), dtype=int)
+    assert result.measurements() is measurements
+    np.testing.assert_array_equal(measurements, [[1, 1, 0], [1, 0, 1]])
+
+    mock_result.measurements = mock_measurements
+
+    view = result.measurements(view=True)
+    assert np.shares_memory(view, mock_measurements)
+    assert not view.flags.writeable
+    np.testing.assert_array_equal(view, result.measurements())
+
+
+def test_raw_counts_memoized():
+    """Test that reversed counts are computed once and returned as a read-only mapping."""
+    mock_result = MagicMock()
+    mock_result.measurement_counts = {"011": 10, "101": 5}
+    result = BraketGateModelJobResult(mock_result)
+    counts = result.raw_counts()
+    with pytest.raises(TypeError):
+        counts["000"] = 1
+    mock_result.measurement_counts = {}
+    assert result.raw_counts() == {"110": 10, "101": 5}
+    assert result.measurement_counts() == {"101": 5, "110": 10}
+
+
 @patch("qbraid.runtime.braket.device.AwsDevice")
 def test_transform_circuit_sv1(mock_aws_device, sv1_profile):
     """Test transform method for device with OpenQASM action type."""
@@ -0,0 +1,205 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+# pylint: disable=redefined-outer-name
+
+"""
+Unit tests for the in-process fake provider backends.
+
+"""
+from types import SimpleNamespace
+
+import cirq
+import pytest
+from qbraid_core.exceptions import RequestsApiError
+from qbraid_core.services.quantum import QuantumServiceRequestError
+
+from qbraid.runtime import JobStatus, QbraidProvider
+from qbraid.runtime.ionq import IonQDevice, IonQProvider
+from qbraid.runtime.testing import (
+    FakeIonQSession,
+    FakeOQCClient,
+    FakeQuantumClient,
+    FakeQuantumService,
+    FakeServiceConfig,
+)
+
+QASM3_BELL = """
+OPENQASM 3.0;
+qubit[2] q;
+h q[0];
+cnot q[0], q[1];
+"""
+
+
+@pytest.fixture
+def cirq_bell():
+    """Cirq Bell circuit with terminal measurements."""
+    q0, q1 = cirq.LineQubit.range(2)
+    return cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.measure(q0, q1))
+
+
+def test_fake_service_advances_states_on_poll():
+    """Test that jobs move from queued to running to completed as their status is polled."""
+    service = FakeQuantumService(FakeServiceConfig(queue_polls=2, running_polls=1))
+    job = service.create_job(2, 10)
+    states = [service.state(job.job_id) for _ in range(5)]
+    assert states == ["QUEUED", "QUEUED", "RUNNING", "COMPLETED", "COMPLETED"]
+    assert service.queue_depth() == 0
+
+
+def test_fake_service_results_are_seeded():
+    """Test that results are reproducible for a given seed and sum to the number of shots."""
+    config = FakeServiceConfig(seed=42)
+    counts = []
+    for _ in range(2):
+        service = FakeQuantumService(config)
+        job = service.create_job(3, 100)
+        counts.append(service.counts(job.job_id))
+    assert counts[0] == counts[1]
+    assert sum(counts[0].values()) == 100
+    assert all(len(key) == 3 for key in counts[0])
+
+
+def test_fake_service_failure_injection():
+    """Test that injected request and job failures are raised and reported."""
+    service = FakeQuantumService(FakeServiceConfig(request_failure_rate=1.0), error_type=ValueError)
+    with pytest.raises(ValueError, match="Injected failure in 'submit' request"):
+        service.request("submit")
+    assert service.request_counts["submit"] == 1
+
+    service = FakeQuantumService(FakeServiceConfig(job_failure_rate=1.0))
+    job = service.create_job(1, 10)
+    assert service.state(job.job_id) == "FAILED"
+
+
+def test_fake_service_queue_capacity_and_cancel():
+    """Test that submissions beyond the queue capacity are rejected until a job is cancelled."""
+    service = FakeQuantumService(FakeServiceConfig(queue_polls=1, queue_capacity=1))
+    job = service.create_job(1, 10)
+    with pytest.raises(RuntimeError, match="Queue capacity of 1 jobs exceeded"):
+        service.create_job(1, 10)
+    service.cancel(job.job_id)
+    assert service.state(job.job_id) == "CANCELLED"
+    with pytest.raises(RuntimeError, match="final state"):
+        service.cancel(job.job_id)
+    service.create_job(1, 10)
+
+
+def test_fake_qbraid_client_runs_job(cirq_bell):
+    """Test running a job end-to-end on a qBraid device backed by the fake client."""
+    client = FakeQuantumClient(config=FakeServiceConfig(queue_polls=1, seed=7))
+    provider = QbraidProvider(client=client)
+    device = provider.get_device("qbraid_qir_simulator")
+
+    job = device.run(cirq_bell, shots=20)
+    assert device.queue_depth() == 1
+    assert job.status() == JobStatus.QUEUED
+    assert job.status() == JobStatus.COMPLETED
+
+    counts = job.result().measurement_counts()
+    assert sum(counts.values()) == 20
+    assert client.service.request_counts["create_job"] == 1
+
+
+def test_fake_qbraid_client_raises_service_error():
+    """Test that the fake client raises the same error type as the live client."""
+    client = FakeQuantumClient()
+    with pytest.raises(QuantumServiceRequestError):
+        client.get_device("not_a_device")
+    with pytest.raises(QuantumServiceRequestError):
+        client.get_job("not_a_job")
+
+
+def test_fake_ionq_session_runs_job():
+    """Test running a job end-to-end on an IonQ device backed by the fake session."""
+    session = FakeIonQSession(config=FakeServiceConfig(queue_polls=1, seed=1))
+    provider = IonQProvider("fake_api_key")
+    provider.session = session
+
+    device = provider.get_device("qpu.aria-1")
+    assert isinstance(device, IonQDevice)
+    assert session.get_device("simulator")["qubits"] == 29
+
+    job = device.run(QASM3_BELL, shots=50)
+    assert job.status() == JobStatus.QUEUED
+    assert job.status() == JobStatus.COMPLETED
+
+    counts = job.result().measurement_counts()
+    assert sum(counts.values()) == 50
+    assert session.service.request_counts["GET /backends"] == 1
+
+
+def test_fake_ionq_session_cancel_and_errors():
+    """Test cancelling jobs and unknown routes on the fake IonQ session."""
+    session = FakeIonQSession(config=FakeServiceConfig(queue_polls=3))
+    provider = IonQProvider("fake_api_key")
+    provider.session = session
+    job = provider.get_device("simulator").run(QASM3_BELL, shots=10)
+    job.cancel()
+    assert job.status() == JobStatus.CANCELLED
+
+    with pytest.raises(RequestsApiError):
+        session.get("/characterizations")
+
+
+def test_fake_oqc_client_schedules_tasks():
+    """Test scheduling and retrieving the results of a task on the fake OQC client."""
+    client = FakeOQCClient(config=FakeServiceConfig(running_polls=2, seed=3))
+    qasm = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\ncreg c[2];\nh q[0];\n'
+    task = SimpleNamespace(program=qasm, config=SimpleNamespace(repeats=30), task_id=None)
+    (task,) = client.schedule_tasks(task, qpu_id="qpu:uk:2:d865b5a184")
+
+    assert client.get_task_status(task.task_id) == "RUNNING"
+    assert client.get_task_results(task.task_id) is None
+    assert client.get_task_status(task.task_id) == "RUNNING"
+    assert client.get_task_status(task.task_id) == "COMPLETED"
+
+    counts = client.get_task_results(task.task_id).result["c"]
+    assert sum(counts.values()) == 30
+    assert all(len(key) == 2 for key in counts)
+    assert client.get_task_metadata(task.task_id)["id"] == task.task_id
+    assert client.get_task_errors(task.task_id) is None
+
+
+def test_fake_braket_device_runs_task():
+    """Test running a task end-to-end on a Braket device backed by a fake AWS device."""
+    pytest.importorskip("braket.circuits", reason="braket not installed")
+
+    # pylint: disable-next=import-outside-toplevel
+    from braket.circuits import Circuit
+
+    from qbraid.programs import ProgramSpec  # pylint: disable=import-outside-toplevel
+    from qbraid.runtime import DeviceType, TargetProfile  # pylint: disable=import-outside-toplevel
+    from qbraid.runtime.braket import BraketDevice  # pylint: disable=import-outside-toplevel
+    from qbraid.runtime.testing.braket import (  # pylint: disable=import-outside-toplevel
+        FakeAwsDevice,
+    )
+
+    aws_device = FakeAwsDevice(config=FakeServiceConfig(queue_polls=1, seed=5))
+    profile = TargetProfile(
+        device_id=aws_device.arn,
+        device_type=DeviceType.SIMULATOR,
+        num_qubits=34,
+        program_spec=ProgramSpec(Circuit),
+        provider_name="Amazon Braket",
+        action_type="OpenQASM",
+    )
+    device = BraketDevice(profile, device=aws_device)
+    assert device.name == "SV1"
+
+    tasks = device.run([Circuit().h(0).cnot(0, 1), Circuit().h(0)], shots=10)
+    assert device.queue_depth() == 2
+    assert tasks[1].queue_position() == 2
+    assert [task.status() for task in tasks] == [JobStatus.QUEUED, JobStatus.QUEUED]
+    assert [task.status() for task in tasks] == [JobStatus.COMPLETED, JobStatus.COMPLETED]
+
+    counts = tasks[0].result().measurement_counts()
+    assert sum(counts.values()) == 10
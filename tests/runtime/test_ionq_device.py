@@ -8,13 +8,20 @@
 #
 # THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
 
+# pylint: disable=redefined-outer-name
+
 """
 Unit tests for IonQDevice
 
 """
+from unittest.mock import Mock
+
 import openqasm3
+import pytest
 
-from qbraid.runtime.ionq import IonQDevice
+from qbraid.programs import ProgramSpec
+from qbraid.runtime import JobSubmissionError, TargetProfile
+from qbraid.runtime.ionq import IonQDevice, IonQJob
 
 
 def test_extract_gate_data():
@@ -78,3 +85,68 @@ swap q[0], q[1];
     actual = IonQDevice.extract_gate_data(qasm3_program)
 
     assert actual == expected
+
+
+def test_extract_gate_data_rotation_expressions():
+    """Test evaluating rotation angles directly from OpenQASM 3 expression nodes."""
+    qasm3_str = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[1] q;
+rx(-pi / 2) q[0];
+ry(2 ** 0.5) q[0];
+rz(tau - euler) q[0];
+rx(1.5) q[0];
+"""
+    qasm3_program = openqasm3.parser.parse(qasm3_str)
+    actual = IonQDevice.extract_gate_data(qasm3_program)
+    rotations = [gate["rotation"] for gate in actual]
+    assert rotations == pytest.approx([-1.5707963267948966, 1.4142135623730951, 3.564903552, 1.5])
+
+
+@pytest.fixture
+def ionq_device():
+    """Return an IonQ device backed by a mock session."""
+    profile = TargetProfile(
+        device_id="simulator",
+        device_type="SIMULATOR",
+        num_qubits=29,
+        program_spec=ProgramSpec(openqasm3.ast.Program),
+    )
+    session = Mock()
+    session.create_job.side_effect = lambda data: {"id": f"job-{data.count('gate')}"}
+    return IonQDevice(profile, session)
+
+
+def test_submit_concurrently_preserves_order(ionq_device):
+    """Test that concurrent IonQ submission returns jobs in input order."""
+    run_input = [{"qubits": 1, "circuit": [{"gate": "x", "target": 0}] * i} for i in range(10)]
+    jobs = ionq_device.submit(run_input, shots=10, max_workers=4)
+    assert all(isinstance(job, IonQJob) for job in jobs)
+    assert [job.id for job in jobs] == [f"job-{i}" for i in range(10)]
+
+
+def test_submit_concurrently_reports_partial_failures(ionq_device):
+    """Test that failed IonQ submissions in a concurrent batch are reported by index."""
+    ionq_device.session.create_job.side_effect = lambda data: (
+        {} if '"gate"' not in data else {"id": "job"}
+    )
+    run_input = [{"qubits": 1, "circuit": []}, {"qubits": 1, "circuit": [{"gate": "x"}]}]
+    with pytest.raises(JobSubmissionError) as excinfo:
+        ionq_device.submit(run_input, max_workers=2)
+
+    assert set(excinfo.value.errors) == {0}
+    assert excinfo.value.jobs[1].id == "job"
+
+
+def test_submit_sequentially_reports_partial_failures(ionq_device):
+    """Test that failed IonQ submissions in a sequential batch are reported by index."""
+    ionq_device.session.create_job.side_effect = lambda data: (
+        {} if '"gate"' not in data else {"id": "job"}
+    )
+    run_input = [{"qubits": 1, "circuit": [{"gate": "x"}]}, {"qubits": 1, "circuit": []}]
+    with pytest.raises(JobSubmissionError) as excinfo:
+        ionq_device.submit(run_input)
+
+    assert set(excinfo.value.errors) == {1}
+    assert excinfo.value.jobs[0].id == "job"
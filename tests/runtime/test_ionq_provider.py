@@ -24,6 +24,7 @@ from qbraid.programs import NATIVE_REGISTRY, ProgramSpec
 from qbraid.runtime import DeviceType
 from qbraid.runtime.enums import JobStatus
 from qbraid.runtime.ionq import IonQDevice, IonQJob, IonQJobResult, IonQProvider, IonQSession
+from qbraid.runtime.ionq.provider import IonQRetry
 
 FIXTURE_COUNT = sum(key in NATIVE_REGISTRY for key in ["qiskit", "braket", "cirq"])
 
@@ -112,8 +113,8 @@ GET_JOB_RESULT_RESPONSE = {"0": 0.5, "1": 0.5}
 
 def test_ionq_provider_device():
     """Test getting IonQ provider and device."""
-    with patch("qbraid_core.sessions.Session") as mock_session:
-        mock_session.return_value.get.return_value.json.return_value = DEVICE_DATA
+    with patch.object(IonQSession, "get") as mock_get:
+        mock_get.return_value.json.return_value = DEVICE_DATA
 
         provider = IonQProvider(api_key="fake_api_key")
         assert isinstance(provider, IonQProvider)
@@ -147,8 +148,7 @@ def test_run_fake_job(mock_post, mock_get, circuit):
     """Test running a fake job."""
     mock_get_response = Mock()
     mock_get_response.json.side_effect = [
-        DEVICE_DATA,  # provider.get_device("simulator")
-        DEVICE_DATA,  # ionq_device.run(circuit, shots=2)
+        DEVICE_DATA,  # provider.get_device("simulator"), cached for ionq_device.run()
         GET_JOB_RESPONSE,  # job.status()
         GET_JOB_RESPONSE,  # job.metadata()
         GET_JOB_RESPONSE,  # job.result()
@@ -178,4 +178,72 @@ def test_run_fake_job(mock_post, mock_get, circuit):
 
     res = job.result()
     assert isinstance(res, IonQJobResult)
-    np.testing.assert_array_equal(res.measurements(), np.array([[0, 0], [0, 1]]))
+    np.testing.assert_array_equal(res.measurements(), np.array([[0], [1]]))
+
+
+@patch("qbraid_core.sessions.Session.get")
+def test_ionq_session_caches_backends(mock_get):
+    """Test that the IonQ /backends response is cached for the configured TTL."""
+    mock_get.return_value.json.return_value = DEVICE_DATA
+
+    session = IonQSession(api_key="fake_api_key", cache_ttl=60)
+    assert session.get_device("qpu.harmony")["qubits"] == 11
+    assert session.get_device("simulator")["qubits"] == 29
+    assert mock_get.call_count == 1
+
+    session.clear_cache()
+    session.get_devices()
+    assert mock_get.call_count == 2
+
+    session.cache_ttl = 0
+    session.get_devices()
+    assert mock_get.call_count == 3
+
+
+@patch("qbraid_core.sessions.Session.get")
+def test_ionq_session_returns_copy_of_cache(mock_get):
+    """Test that mutating the returned devices does not corrupt the cached response."""
+    mock_get.return_value.json.return_value = DEVICE_DATA
+
+    session = IonQSession(api_key="fake_api_key", cache_ttl=60)
+    session.get_devices().clear()
+    assert "simulator" in session.get_devices()
+    assert mock_get.call_count == 1
+
+
+def test_ionq_session_retry_policy():
+    """Test that the IonQ session retries with backoff on rate limiting and server errors."""
+    session = IonQSession(api_key="fake_api_key", retries_total=7, pool_maxsize=4)
+    adapter = session.get_adapter("https://api.ionq.co/v0.3/jobs")
+    retry = adapter.max_retries
+    assert isinstance(retry, IonQRetry)
+    assert retry.total == 7
+    assert adapter._pool_maxsize == 4
+    assert retry.is_retry("POST", 429)
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("POST", 503)
+
+
+def test_ionq_result_counts_sum_to_shots():
+    """Test that counts reconstructed from probabilities sum exactly to the number of shots."""
+    probabilities = {"0": 1 / 3, "3": 1 / 3, "5": 1 / 3}
+    result = IonQJobResult({"shots": 100, "qubits": 3, "probabilities": probabilities})
+    counts = result.raw_counts()
+    assert counts == {"000": 34, "011": 33, "101": 33}
+    assert sum(counts.values()) == 100
+    assert result.measurements().shape == (100, 3)
+
+
+def test_ionq_result_probabilities_first():
+    """Test reading probabilities keyed by bitstrings of the job's qubit width."""
+    probabilities = {"1": 0.25, "0": 0.75}
+    result = IonQJobResult({"shots": 8, "qubits": 4, "probabilities": probabilities})
+    assert result.raw_probabilities() == {"0001": 0.25, "0000": 0.75}
+    assert list(result.measurement_probabilities().items()) == [("0000", 0.75), ("0001", 0.25)]
+    assert result._counts is None
+
+
+def test_ionq_result_width_without_qubits():
+    """Test that the bit width falls back to the widest measured state."""
+    result = IonQJobResult({"shots": 4, "probabilities": {"6": 0.5, "1": 0.5}})
+    assert result.raw_counts() == {"110": 2, "001": 2}
@@ -418,6 +418,13 @@ def test_result_format_measurements():
     assert qr._format_measurements(memory_list) == expected
 
 
+def test_result_normalize_tuples():
+    """Test padding measurement tuples with zeros on the left to a common length."""
+    measurements = [[(1,), [0, 1]], [(1, 1, 0)]]
+    expected = [[(0, 0, 1), (0, 0, 1)], [(1, 1, 0)]]
+    assert QiskitResult.normalize_tuples(measurements) == expected
+
+
 def test_result_measurements_single_circuit(mock_runtime_result):
     """Test getting measurements from a single circuit."""
     qr = QiskitResult()
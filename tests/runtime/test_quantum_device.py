@@ -22,8 +22,9 @@ import numpy as np
 import pytest
 from qbraid_core.services.quantum.exceptions import QuantumServiceRequestError
 
+from qbraid.programs import ProgramSpec
 from qbraid.runtime.device import QuantumDevice
-from qbraid.runtime.exceptions import ResourceNotFoundError
+from qbraid.runtime.exceptions import JobSubmissionError, ResourceNotFoundError
 from qbraid.runtime.native import (
     ExperimentResult,
     QbraidDevice,
@@ -31,6 +32,7 @@ from qbraid.runtime.native import (
     QbraidJobResult,
     QbraidProvider,
 )
+from qbraid.runtime.native.result import LazyMetadata
 from qbraid.runtime.profile import TargetProfile
 from qbraid.transpiler import Conversion, ConversionGraph, ConversionScheme
 
@@ -270,6 +272,42 @@ def test_qir_simulator_workflow(mock_client, cirq_uniform):
     assert _is_uniform_comput_basis(measurements)
 
 
+def test_result_metadata_is_lazy():
+    """Test that job result metadata is derived from counts and expands shots on first access."""
+    experiment = ExperimentResult(measurement_counts={"0 1": 3, "11": 5}, execution_duration=7)
+    result = QbraidJobResult("qbraid_qir_simulator", "job-id", True, experiment)
+
+    metadata = result.metadata()
+    assert isinstance(metadata, LazyMetadata)
+    assert list(metadata) == [
+        "num_shots",
+        "num_qubits",
+        "execution_duration",
+        "measurements",
+        "measurement_counts",
+        "measurement_probabilities",
+    ]
+    assert len(metadata) == 6
+    assert "measurements" in metadata
+    assert metadata["num_shots"] == 8
+    assert metadata["num_qubits"] == 2
+    assert metadata["execution_duration"] == 7
+    assert result._measurements is None
+    assert result._cached_histogram is None
+
+    assert metadata["measurement_counts"] == {"01": 3, "11": 5}
+    assert metadata["measurement_probabilities"] == {"01": 0.375, "11": 0.625}
+    assert result._measurements is None
+
+    assert metadata["measurements"].shape == (8, 2)
+    assert metadata.get("measurements") is metadata["measurements"]
+    assert metadata.get("missing") is None
+    assert result.metadata() is metadata
+    metadata["tag"] = "nightly"
+    assert dict(metadata)["tag"] == "nightly"
+    assert dict(metadata)["measurements"] is metadata["measurements"]
+
+
 def test_update_scheme(mock_qbraid_device):
     """Test updating ConversionScheme."""
     graph = mock_qbraid_device.scheme.conversion_graph.copy()
@@ -287,3 +325,117 @@ def test_queue_depth_raises(mock_basic_device):
     """Test raising exception when queue depth is unavailable."""
     with pytest.raises(ResourceNotFoundError):
         mock_basic_device.queue_depth()
+
+
+@pytest.fixture
+def qasm3_qbraid_device(mock_client):
+    """Mock QbraidDevice targeting OpenQASM 3 for testing."""
+    profile = TargetProfile(
+        device_id="qbraid_qir_simulator",
+        device_type="SIMULATOR",
+        num_qubits=64,
+        program_spec=ProgramSpec(str, alias="qasm3"),
+    )
+    return QbraidDevice(profile=profile, client=mock_client)
+
+
+def test_prepare_program_reuses_qasm3_conversion(qasm3_qbraid_device, cirq_uniform):
+    """Test that the target OpenQASM 3 conversion is reused for the job metadata."""
+    circuit = cirq_uniform(num_qubits=3)
+    program, program_data = qasm3_qbraid_device._prepare_program(circuit)
+    assert isinstance(program, str)
+    assert program_data["openqasm"] is program
+    assert program_data["num_qubits"] == 3
+    assert isinstance(program_data["depth"], int)
+
+
+def test_prepare_program_skip_metadata(qasm3_qbraid_device, cirq_uniform):
+    """Test that metadata extraction is skipped when include_metadata is False."""
+    circuit = cirq_uniform(num_qubits=3)
+    program, program_data = qasm3_qbraid_device._prepare_program(circuit, include_metadata=False)
+    assert isinstance(program, str)
+    assert program_data == {"num_qubits": None, "depth": None, "openqasm": None}
+
+
+class MockModule:
+    """Mock pyqir.Module for testing."""
+
+    def __init__(self, bitcode: bytes):
+        self.bitcode = bitcode
+
+
+class BatchMockClient(MockClient):
+    """Mock client that creates a unique job per request, failing on select bitcode."""
+
+    def __init__(self, fail_on: Optional[set[bytes]] = None):
+        self.fail_on = fail_on or set()
+        self.requests = []
+
+    def create_job(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Creates a new quantum job with the given data."""
+        if data["bitcode"] in self.fail_on:
+            raise QuantumServiceRequestError("Failed to create job")
+        self.requests.append(data)
+        return {**JOB_DATA, "qbraidJobId": f"job-{data['bitcode'].decode()}"}
+
+
+def test_submit_batch_concurrently_preserves_order():
+    """Test that concurrent batch submission returns jobs in input order."""
+    client = BatchMockClient()
+    device = QbraidProvider(client=client).get_device("qbraid_qir_simulator")
+    modules = [MockModule(str(i).encode()) for i in range(20)]
+    jobs = device.submit(modules, shots=10, max_workers=4, tags={"sweep": "1"})
+    assert [job.id for job in jobs] == [f"job-{i}" for i in range(20)]
+    assert all(request["tags"] == '{"sweep": "1"}' for request in client.requests)
+
+
+def test_submit_batch_reports_partial_failures():
+    """Test that failed submissions in a concurrent batch are reported by index."""
+    client = BatchMockClient(fail_on={b"1", b"3"})
+    device = QbraidProvider(client=client).get_device("qbraid_qir_simulator")
+    modules = [MockModule(str(i).encode()) for i in range(5)]
+    with pytest.raises(JobSubmissionError) as excinfo:
+        device.submit(modules, max_workers=2)
+
+    err = excinfo.value
+    assert set(err.errors) == {1, 3}
+    assert err.jobs[1] is None and err.jobs[3] is None
+    assert [err.jobs[i].id for i in (0, 2, 4)] == ["job-0", "job-2", "job-4"]
+    assert err.__cause__ is None
+
+
+def test_submit_batch_sequentially_reports_partial_failures():
+    """Test that failed submissions in a sequential batch are reported by index."""
+    client = BatchMockClient(fail_on={b"0"})
+    device = QbraidProvider(client=client).get_device("qbraid_qir_simulator")
+    modules = [MockModule(str(i).encode()) for i in range(3)]
+    with pytest.raises(JobSubmissionError) as excinfo:
+        device.submit(modules, tags={"sweep": "1"})
+
+    err = excinfo.value
+    assert set(err.errors) == {0}
+    assert err.__cause__ is err.errors[0]
+    assert isinstance(err.__cause__, QuantumServiceRequestError)
+    assert [job.id for job in err.jobs[1:]] == ["job-1", "job-2"]
+    assert all(request["tags"] == '{"sweep": "1"}' for request in client.requests)
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+def test_submit_batch_empty_input(max_workers):
+    """Test that an empty batch submits nothing and returns no jobs."""
+    client = BatchMockClient()
+    device = QbraidProvider(client=client).get_device("qbraid_qir_simulator")
+    assert device.submit([], max_workers=max_workers) == []
+    assert device.run([], max_workers=max_workers) == []
+    assert not client.requests
+
+
+def test_run_batch_concurrently_preserves_order(monkeypatch):
+    """Test that running a list of programs prepares and submits them as a batch."""
+    client = BatchMockClient()
+    device = QbraidProvider(client=client).get_device("qbraid_qir_simulator")
+    monkeypatch.setattr(device, "_prepare_program", lambda program, include_metadata: (program, {}))
+    modules = [MockModule(str(i).encode()) for i in range(8)]
+    jobs = device.run(modules, shots=10, max_workers=4)
+    assert [job.id for job in jobs] == [f"job-{i}" for i in range(8)]
+    assert device.run(modules[0], shots=10).id == "job-0"
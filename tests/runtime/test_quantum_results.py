@@ -12,9 +12,17 @@
 Unit tests for retrieving and post-processing experimental results.
 
 """
+import numpy as np
 import pytest
 
-from qbraid.runtime.result import GateModelJobResult, normalize_measurement_counts
+from qbraid.runtime.result import (
+    BatchResult,
+    GateModelJobResult,
+    PackedMeasurements,
+    bitstrings_to_array,
+    normalize_measurement_counts,
+    probabilities_to_counts,
+)
 
 
 @pytest.mark.parametrize(
@@ -84,6 +92,13 @@ def test_normalize_single_dict():
     assert normalize_measurement_counts(measurements) == expected
 
 
+def test_bitstrings_to_array():
+    """Test conversion of bitstrings to a 2D array of bits, padded on the left."""
+    array = bitstrings_to_array(["101", "1", "010"], 3)
+    assert array.dtype == np.uint8
+    np.testing.assert_array_equal(array, [[1, 0, 1], [0, 0, 1], [0, 1, 0]])
+
+
 class MockBatchResult(GateModelJobResult):
     """Mock batch result for testing."""
 
@@ -102,3 +117,224 @@ def test_batch_measurement_counts():
     counts = result.measurement_counts(include_zero_values=False)
     expected = [{"0": 550}, {"0": 550, "1": 474}]
     assert counts == expected
+
+
+def test_packed_measurements_from_counts():
+    """Test expanding bit-packed measurements created from a histogram."""
+    packed = PackedMeasurements.from_counts({"10": 3, "1 1": 2, "0": 1})
+    assert packed.num_shots == len(packed) == 6
+    assert packed.num_bits == 2
+    assert packed.nbytes == 6
+    expected = np.array([[1, 0], [1, 0], [1, 0], [1, 1], [1, 1], [0, 0]])
+    np.testing.assert_array_equal(packed.to_array(), expected)
+    assert packed.to_array() is packed.to_array()
+    assert packed.to_array(dtype=np.uint8).dtype == np.uint8
+    assert packed.to_counts() == {"00": 1, "10": 3, "11": 2}
+
+
+def test_packed_measurements_round_trip():
+    """Test that packing preserves measurements wider than a single byte."""
+    measurements = np.random.default_rng(0).integers(0, 2, size=(500, 11))
+    packed = PackedMeasurements.from_array(measurements)
+    assert packed.packed.shape == (500, 2)
+    np.testing.assert_array_equal(packed.to_array(), measurements)
+    counts = packed.to_counts()
+    assert sum(counts.values()) == 500
+    assert PackedMeasurements.from_counts(counts).to_counts() == counts
+
+
+def test_packed_measurements_empty_and_invalid():
+    """Test packed measurements for empty histograms and inconsistent arrays."""
+    empty = PackedMeasurements.from_counts({})
+    assert empty.num_shots == 0
+    assert empty.to_counts() == {}
+    with pytest.raises(ValueError):
+        PackedMeasurements(np.zeros((2, 1), dtype=np.uint8), 9)
+    with pytest.raises(ValueError):
+        PackedMeasurements.from_array(np.array([0, 1]))
+    with pytest.raises(ValueError, match="'0x1' is not a bitstring"):
+        PackedMeasurements.from_counts({"01": 1, "0x1": 2})
+
+
+def test_array_to_histogram():
+    """Test histogramming of per-shot measurements against a reference count."""
+    measurements = np.random.default_rng(1).integers(0, 2, size=(2000, 10))
+    rows = ["".join(map(str, row)) for row in measurements]
+    expected = {row: rows.count(row) for row in set(rows)}
+    counts = GateModelJobResult.array_to_histogram(measurements)
+    assert counts == expected
+    assert list(counts) == sorted(expected)
+    assert PackedMeasurements.from_array(measurements).to_counts() == counts
+
+
+@pytest.mark.parametrize("measurements", [None, np.array([]), np.zeros((0, 3), dtype=int)])
+def test_array_to_histogram_empty(measurements):
+    """Test histogramming of empty measurement arrays."""
+    assert GateModelJobResult.array_to_histogram(measurements) == {}
+
+
+def test_format_counts_sparse_many_bits():
+    """Test that formatting wide results only touches the observed keys."""
+    counts = {"1" * 40: 5, "0" * 40: 7, "01" * 20: 1, "10" * 20: 0}
+    formatted = GateModelJobResult.format_counts(counts)
+    assert list(formatted) == ["0" * 40, "01" * 20, "1" * 40]
+
+    with pytest.raises(ValueError, match="max_dense_bits=20"):
+        GateModelJobResult.format_counts(counts, include_zero_values=True)
+
+
+def test_format_counts_pads_short_keys():
+    """Test that keys shorter than the widest key are zero-padded."""
+    counts = {"1": 2, "10": 3, "0 1": 1}
+    assert GateModelJobResult.format_counts(counts) == {"01": 3, "10": 3}
+    assert GateModelJobResult.format_counts({}) == {}
+
+
+def test_counts_to_probability_vector():
+    """Test converting counts to a dense probability vector."""
+    vector = GateModelJobResult.counts_to_probability_vector({"0 0": 3, "11": 1})
+    np.testing.assert_allclose(vector, [0.75, 0.0, 0.0, 0.25])
+    assert GateModelJobResult.counts_to_probability_vector({}).size == 0
+
+    with pytest.raises(ValueError):
+        GateModelJobResult.counts_to_probability_vector({"101": 1}, max_dense_bits=2)
+
+
+def test_batch_result_from_counts():
+    """Test building a columnar batch result with a shared bit width."""
+    batch = BatchResult.from_counts([{"1": 3, "0 1": 2, "0": 1}, {}, {"110": 4, "0": 0}])
+    assert len(batch) == 3
+    assert batch.num_bits == 3
+    np.testing.assert_array_equal(batch.outcomes, [0, 1, 0, 6])
+    np.testing.assert_array_equal(batch.counts, [1, 5, 0, 4])
+    np.testing.assert_array_equal(batch.offsets, [0, 2, 2, 4])
+    np.testing.assert_array_equal(batch.shots(), [6, 0, 4])
+    np.testing.assert_allclose(batch.probabilities(), [1 / 6, 5 / 6, 0.0, 1.0])
+    assert batch.to_counts() == [{"000": 1, "001": 5}, {}, {"110": 4}]
+
+    outcomes, counts = batch.experiment(2)
+    np.testing.assert_array_equal(outcomes, [0, 6])
+    np.testing.assert_array_equal(counts, [0, 4])
+
+
+def test_batch_result_marginal_and_dense():
+    """Test marginalizing a batch over a subset of bits and exporting it densely."""
+    batch = BatchResult.from_counts([{"101": 2, "100": 3, "011": 1}, {"111": 4}])
+    marginal = batch.marginal([0, 2])
+    assert marginal.num_bits == 2
+    assert marginal.to_counts() == [{"01": 1, "10": 3, "11": 2}, {"11": 4}]
+    assert batch.marginal([2, 0]).to_counts()[0] == {"10": 1, "01": 3, "11": 2}
+    np.testing.assert_array_equal(marginal.to_dense(), [[0, 1, 3, 2], [0, 0, 0, 4]])
+    assert marginal.to_counts(include_zero_values=True)[1] == {"00": 0, "01": 0, "10": 0, "11": 4}
+
+    with pytest.raises(ValueError):
+        batch.marginal([3])
+    with pytest.raises(ValueError):
+        batch.to_dense(max_dense_bits=2)
+
+    columns = batch.to_numpy()
+    np.testing.assert_array_equal(columns["experiment"], [0, 0, 0, 1])
+    np.testing.assert_array_equal(columns["outcome"], [3, 4, 5, 7])
+
+
+def test_batch_result_to_arrow():
+    """Test exporting a batch result to an Arrow table."""
+    pa = pytest.importorskip("pyarrow")
+    table = BatchResult.from_counts([{"01": 2}, {"10": 1}]).to_arrow()
+    assert isinstance(table, pa.Table)
+    assert table.column_names == ["experiment", "outcome", "count"]
+    assert table.schema.metadata[b"num_bits"] == b"2"
+
+
+def test_batch_result_too_many_bits():
+    """Test that outcomes wider than 64 bits are rejected."""
+    with pytest.raises(ValueError):
+        BatchResult.from_counts([{"1" * 65: 1}])
+
+
+def test_batch_measurement_counts_shared_width():
+    """Test that batch measurement counts share a bit width and omit zero counts."""
+    result = MockBatchResult(None)
+    batch = result.batch_result()
+    assert batch.num_experiments == 2
+    np.testing.assert_array_equal(batch.shots(), [550, 1024])
+
+
+class MockCountsResult(GateModelJobResult):
+    """Mock single-experiment result for testing."""
+
+    def __init__(self, counts):
+        super().__init__()
+        self._counts = counts
+
+    def measurements(self):
+        """Return measurements as list."""
+        raise NotImplementedError
+
+    def raw_counts(self, **kwargs):
+        """Returns raw histogram data of the run."""
+        return self._counts
+
+
+def test_marginal_counts():
+    """Test marginalizing single and batch results over bits indexed from the left."""
+    result = MockCountsResult({"001": 3, "110": 1, "011": 2})
+    assert result.marginal_counts([0]) == {"0": 5, "1": 1}
+    assert result.marginal_counts([2, 1]) == {"01": 1, "10": 3, "11": 2}
+    assert result.marginal_counts([0], include_zero_values=True) == {"0": 5, "1": 1}
+    assert MockBatchResult(None).marginal_counts([0]) == [{"0": 550}, {"0": 550, "1": 474}]
+
+
+def test_expectation_values_match_reference():
+    """Test Pauli-Z expectation values against a direct evaluation over bitstrings."""
+    rng = np.random.default_rng(3)
+    keys = {format(int(value), "06b") for value in rng.integers(0, 64, size=20)}
+    counts = {key: int(rng.integers(1, 50)) for key in keys}
+    result = MockCountsResult(counts)
+    shots = sum(counts.values())
+
+    paulis = ["ZIIIIZ", "IZZZII", "IIIIII", [0, 1, 2, 3, 4, 5], [3]]
+    expected = []
+    for pauli in paulis:
+        bits = pauli if isinstance(pauli, list) else [i for i, op in enumerate(pauli) if op == "Z"]
+        parity = {key: sum(int(key[bit]) for bit in bits) % 2 for key in counts}
+        expected.append(sum((-1) ** parity[key] * count for key, count in counts.items()) / shots)
+
+    np.testing.assert_allclose(result.expectation_values(paulis), expected)
+    assert result.expectation_z([3]) == pytest.approx(expected[-1])
+
+
+def test_expectation_values_batch_and_errors():
+    """Test batched expectation values and invalid observables."""
+    result = MockBatchResult(None)
+    np.testing.assert_allclose(result.expectation_z([0]), [1.0, (550 - 474) / 1024])
+    assert result.expectation_values(["Z", "I"]).shape == (2, 2)
+    batch = BatchResult.from_counts([{"01": 3, "11": 1}])
+    np.testing.assert_allclose(
+        batch.expectation_z([[1], [1, 1], [], [0, 1], [0, 1, 1]]), [[-1, 1, 1, -0.5, 0.5]]
+    )
+
+    single = MockCountsResult({"01": 1})
+    with pytest.raises(ValueError, match="not diagonal"):
+        single.expectation_values(["XZ"])
+    with pytest.raises(ValueError, match="has length 3"):
+        single.expectation_values(["ZZZ"])
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        single.expectation_z([2])
+
+
+@pytest.mark.parametrize(
+    "probabilities, shots, expected",
+    [
+        ([1 / 3, 1 / 3, 1 / 3], 100, [34, 33, 33]),
+        ([0.5, 0.5], 3, [2, 1]),
+        ([0.2, 0.2, 0.6], 7, [2, 1, 4]),
+        ([2.0, 2.0], 4, [2, 2]),
+        ([], 10, []),
+        ([0.0, 0.0], 10, [0, 0]),
+    ],
+)
+def test_probabilities_to_counts(probabilities, shots, expected):
+    """Test largest-remainder conversion of probabilities to counts."""
+    counts = probabilities_to_counts(np.array(probabilities), shots)
+    np.testing.assert_array_equal(counts, expected)
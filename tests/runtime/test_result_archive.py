@@ -0,0 +1,145 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+# pylint: disable=redefined-outer-name
+
+"""
+Unit tests for exporting job results to NPZ, Arrow and Parquet archives.
+
+"""
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from braket.tasks.analog_hamiltonian_simulation_quantum_task_result import (
+    AnalogHamiltonianSimulationShotStatus,
+    ShotResult,
+)
+
+from qbraid.runtime import QuantumJobResult, ResultArchive, load_result
+from qbraid.runtime.archive import ParquetShots
+from qbraid.runtime.braket.result import BraketAhsJobResult
+from qbraid.runtime.native.result import ExperimentResult, QbraidJobResult
+
+
+@pytest.fixture
+def qbraid_result():
+    """qBraid job result over 10 bits."""
+    counts = {"0000000000": 700, "1010101010": 250, "1111111111": 50}
+    experiment = ExperimentResult(measurement_counts=counts, execution_duration=12)
+    return QbraidJobResult("qbraid_qir_simulator", "job-123", True, experiment)
+
+
+def test_npz_round_trip_memory_mapped(qbraid_result, tmp_path):
+    """Test that shots, counts and metadata survive an NPZ round trip, memory-mapped."""
+    path = tmp_path / "result.npz"
+    qbraid_result.to_npz(path, metadata={"tag": "nightly"}, chunk_size=64)
+
+    archive = load_result(path)
+    assert isinstance(archive, ResultArchive)
+    assert isinstance(archive.shots, np.memmap)
+    assert archive.num_shots == 1000
+    assert archive.shots.shape == (1000, 2)
+    np.testing.assert_array_equal(archive.measurements(), qbraid_result.measurements())
+    np.testing.assert_array_equal(archive.measurements(700, 702), [[1, 0] * 5] * 2)
+    assert archive.counts == qbraid_result.measurement_counts()
+    assert archive.metadata == {
+        "result_type": "QbraidJobResult",
+        "device_id": "qbraid_qir_simulator",
+        "job_id": "job-123",
+        "success": True,
+        "execution_duration": 12,
+        "tag": "nightly",
+    }
+
+
+def test_npz_without_mmap_loads_into_memory(qbraid_result, tmp_path):
+    """Test loading an NPZ archive without memory-mapping."""
+    path = tmp_path / "result.npz"
+    qbraid_result.to_npz(path)
+    archive = load_result(path, mmap=False)
+    assert not isinstance(archive.shots, np.memmap)
+    assert archive.num_shots == 1000
+
+
+def test_npz_is_readable_by_numpy(qbraid_result, tmp_path):
+    """Test that the streamed archive is a standard NPZ file."""
+    path = tmp_path / "result.npz"
+    qbraid_result.to_npz(path, chunk_size=7)
+    with np.load(path) as data:
+        np.testing.assert_array_equal(data["shots"], qbraid_result.packed_measurements().packed)
+        assert int(data["num_bits"]) == 10
+
+
+def test_ahs_result_npz_round_trip(tmp_path):
+    """Test exporting the decoded atom states of an AHS result."""
+    success = AnalogHamiltonianSimulationShotStatus.SUCCESS
+    mock_result = MagicMock()
+    mock_result.measurements = [
+        ShotResult(success, np.array([1, 1, 0]), np.array([0, 1, 1])),
+        ShotResult(success, np.array([1, 1, 1]), np.array([1, 1, 0])),
+    ]
+    result = BraketAhsJobResult(mock_result)
+    path = tmp_path / "ahs.npz"
+    result.to_npz(path)
+
+    archive = load_result(path)
+    assert archive.encoding == "states"
+    np.testing.assert_array_equal(archive.measurements(), [[1, 2, 0], [2, 2, 1]])
+    assert archive.counts == {"rge": 1, "ggr": 1}
+    assert archive.metadata == {"result_type": "BraketAhsJobResult"}
+
+
+def test_arrow_and_parquet_round_trip(qbraid_result, tmp_path):
+    """Test exporting a result to Arrow and Parquet."""
+    pytest.importorskip("pyarrow")
+    table = qbraid_result.to_arrow(chunk_size=128)
+    assert table.num_rows == 1000
+    assert table.schema.metadata[b"qbraid.num_bits"] == b"10"
+
+    path = tmp_path / "result.parquet"
+    qbraid_result.to_parquet(path, chunk_size=128)
+    archive = load_result(path)
+    np.testing.assert_array_equal(archive.measurements(), qbraid_result.measurements())
+    assert archive.counts == qbraid_result.measurement_counts()
+
+
+def test_parquet_shots_read_lazily(qbraid_result, tmp_path):
+    """Test that Parquet shots are read one row group at a time, on access."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "result.parquet"
+    qbraid_result.to_parquet(path, chunk_size=128)
+    packed = qbraid_result.packed_measurements().packed
+
+    archive = load_result(path)
+    assert isinstance(archive.shots, ParquetShots)
+    assert archive.shots.shape == (1000, 2)
+    for index in (slice(100, 300), slice(127, 129), slice(900, 50, -7), slice(5, 5), -1, 128):
+        np.testing.assert_array_equal(archive.shots[index], packed[index])
+    np.testing.assert_array_equal(np.asarray(archive.shots), packed)
+    np.testing.assert_array_equal(archive.measurements(700, 702), [[1, 0] * 5] * 2)
+    with pytest.raises(IndexError):
+        archive.shots[1000]  # pylint: disable=pointless-statement
+
+    in_memory = load_result(path, mmap=False)
+    assert isinstance(in_memory.shots, np.ndarray)
+    np.testing.assert_array_equal(in_memory.shots, packed)
+
+
+def test_export_unsupported_result(tmp_path):
+    """Test that exporting a result without per-shot data raises a ValueError."""
+    with pytest.raises(ValueError, match="QuantumJobResult does not support exporting shots"):
+        QuantumJobResult().to_npz(tmp_path / "result.npz")
+
+
+def test_load_result_unsupported_format(tmp_path):
+    """Test that loading an unsupported file format raises an error."""
+    with pytest.raises(ValueError, match="Unsupported result archive format"):
+        load_result(tmp_path / "result.csv")
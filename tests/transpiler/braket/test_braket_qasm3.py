@@ -61,6 +61,19 @@ rx(0.3) q[1];
     assert circuit_expected == qasm3_to_braket(qasm_str)
 
 
+def test_braket_from_qasm3_renames_ccx_and_csx():
+    """Test that the stdgates ccx and csx gates are renamed to Braket's ccnot and cv"""
+    qasm_str = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[3] q;
+ccx q[0], q[1], q[2];
+csx q[1], q[2];
+"""
+    circuit_expected = Circuit().ccnot(0, 1, 2).cv(1, 2)
+    assert circuit_expected == qasm3_to_braket(qasm_str)
+
+
 def test_qiskit_to_qasm3_to_braket():
     """Test converting Qiskit circuit to Braket via OpenQASM 3.0 for mapped gate defs"""
     qc = qiskit.QuantumCircuit(4)
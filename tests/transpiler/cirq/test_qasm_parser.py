@@ -21,6 +21,7 @@ Unit tests for Cirq Qasm Parser
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
 import cirq
@@ -33,7 +34,7 @@ from cirq.circuits.qasm_output import QasmUGate
 from cirq.contrib.qasm_import import QasmException
 
 import qbraid.transpiler.conversions.qasm2.cirq_custom as cirq_qasm_gates
-from qbraid.transpiler.conversions.qasm2.cirq_qasm_parser import QasmParser
+from qbraid.transpiler.conversions.qasm2.cirq_qasm_parser import QasmParser, QasmParserPool
 
 
 def test_format_header_circuit():
@@ -1087,3 +1088,48 @@ def test_single_qubit_gates(qasm_gate: str, cirq_gate: cirq.Gate):
 
     ct.assert_same_circuits(parsed_qasm.circuit, expected_circuit)
     assert parsed_qasm.qregs == {"q": 2}
+
+
+def test_parser_tables_are_shared():
+    first = QasmParser()
+    second = QasmParser()
+
+    assert first.parser.action is second.parser.action
+    assert first.parser.productions is not second.parser.productions
+    assert second.parser.productions[1].callable.__self__ is second
+
+
+def test_parser_reuse_after_reset():
+    parser = QasmParser()
+    first = parser.parse("OPENQASM 2.0; qreg q[2]; CX q[0], q[1];")
+    assert parser.parse("OPENQASM 2.0; qreg q[2]; CX q[0], q[1];") is first
+
+    second = parser.parse("OPENQASM 2.0;\nqreg r[1];\nU(0, 0, 0) r[0];")
+    assert second is not first
+    assert second.qregs == {"r": 1}
+    assert first.qregs == {"q": 2}
+    assert len(list(first.circuit.all_operations())) == 1
+
+    with pytest.raises(QasmException, match="at line 2"):
+        parser.parse("OPENQASM 2.0;\nqreg q[1]; qreg q[1];")
+
+    parser.reset()
+    assert parser.parse("OPENQASM 2.0; qreg q[1];").qregs == {"q": 1}
+
+
+def test_parser_pool_parses_concurrently():
+    pool = QasmParserPool(max_size=2)
+    programs = [f"OPENQASM 2.0; qreg q{i}[{i % 3 + 1}]; U(0, 0, 0) q{i}[0];" for i in range(20)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(pool.parse, programs))
+
+    for i, parsed_qasm in enumerate(results):
+        assert parsed_qasm.qregs == {f"q{i}": i % 3 + 1}
+        assert len(list(parsed_qasm.circuit.all_operations())) == 1
+    assert 1 <= len(pool) <= 2
+
+    with pytest.raises(QasmException):
+        pool.parse("OPENQASM 2.0; qreg q[1]; CX q[0];")
+    with pytest.raises(ValueError):
+        QasmParserPool(max_size=0)
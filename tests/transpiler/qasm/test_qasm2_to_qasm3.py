@@ -149,6 +149,23 @@ def test_qasm2_to_qasm3_parametrized(test_input, expected_output):
     _check_output(qasm2_to_qasm3(test_input), expected_output)
 
 
+def test_qasm2_to_qasm3_emits_only_used_gate_defs():
+    """Test that only the library gates used by the program are defined in the output"""
+    qasm2_str = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[3];
+gate rzz(theta) a, b { cx a, b; rz(theta) b; cx a, b; }
+rzz(0.5) q[0], q[1];
+rccx q[0], q[1], q[2];
+"""
+    qasm3_str = qasm2_to_qasm3(qasm2_str)
+    assert qasm3_str.count("gate ") == 2
+    assert "gate rccx" in qasm3_str
+    assert "gate rzz(theta) a, b { cx a, b; rz(theta) b; cx a, b; }" in qasm3_str
+    assert "gate c4x" not in qasm3_str
+
+
 def _generate_valid_qasm_strings(seed=42, gates_to_skip=None, num_circuits=100):
     """Returns a list of 100 random qasm2 strings
     which do not contain any of the gates in gates_to_skip
@@ -243,6 +260,38 @@ def test_rxx_gate_conversion():
     _check_output(qasm2_to_qasm3(test_rxx), test_rxx_expected)
 
 
+def test_rxx_gate_in_gate_definition():
+    """Test rxx gate conversion in the body of a gate definition"""
+
+    test_rxx = """
+    OPENQASM 2.0;
+    include "qelib1.inc";
+    gate myxx(theta) a, b {
+      rxx(theta) a,b;
+    }
+    qreg q[2];
+    myxx(0.5) q[0],q[1];"""
+
+    test_rxx_expected = f"""
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    {gate_def_qasm3}
+    gate myxx(theta) a, b {{
+      h a;
+      h b;
+      cx a,b;
+      rz(theta) b;
+      cx a,b;
+      h b;
+      h a;
+    }}
+    qubit[2] q;
+    myxx(0.5) q[0],q[1];
+    """
+
+    _check_output(qasm2_to_qasm3(test_rxx), test_rxx_expected)
+
+
 @pytest.mark.skip(reason="Syntax not yet supported")
 def test_qasm3_num_qubits_alternate_synatx():
     """Test calculating num qubits for qasm3 syntax edge-case"""
@@ -248,6 +248,14 @@ def test_qiskit_to_from_qasm3():
     assert circuits_allclose(circuit_in, circuit_out, strict_gphase=True)
 
 
+def test_qasm3_to_qiskit_renames_ccnot():
+    """Test that Braket's ccnot gate is renamed to the stdgates ccx gate"""
+    qasm3_str = "OPENQASM 3.0;\nqubit[3] q;\nccnot q[0], q[1], q[2];\n"
+    circuit_expected = QuantumCircuit(3)
+    circuit_expected.ccx(0, 1, 2)
+    assert circuits_allclose(qasm3_to_qiskit(qasm3_str), circuit_expected, strict_gphase=True)
+
+
 def test_raise_circuit_conversion_error():
     """Tests raising error for unsupported gates."""
     with pytest.raises(CircuitConversionError):